@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import asyncio
+import tempfile
+
+from openpyxl import load_workbook
+
+import src.database.excel_consolidado as excel_consolidado
+from src.database.excel_consolidado import ConsolidatedExcelExporter
+
+
+def _research(name, total):
+    return {
+        "researcher_info": {"name": name, "institution": "USP", "h_index": 7},
+        "platform": "scholar",
+        "timestamp": "2024-05-01T10:00:00",
+        "total_publications": total,
+        "publications": [
+            {"title": f"=Envelhecimento {index}", "authors": name, "publication": "Silva, Souza - Revista X",
+             "year": "2021", "cited_by": index, "matched_keywords": ["envelhecimento"]}
+            for index in range(total)
+        ],
+    }
+
+
+def _exporter(directory):
+    exporter = ConsolidatedExcelExporter()
+    exporter.exports_dir = directory
+    return exporter
+
+
+def test_streaming_export_writes_all_sheets():
+    print("Testando exportação em streaming...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Gerador: o exportador não precisa da lista inteira
+        research = (_research(name, 3) for name in ["Maria Silva", "João Souza"])
+        filename = _exporter(directory).export_consolidated_excel(research, stats={"total_searches": 5})
+        workbook = load_workbook(os.path.join(directory, filename))
+
+        assert workbook.sheetnames == ["Publicações", "Pesquisadores", "Estatísticas"]
+        rows = list(workbook["Publicações"].iter_rows(values_only=True))
+        assert len(rows) == 1 + 6
+        # Texto começando com "=" continua texto, não fórmula
+        assert rows[1][2] == "=Envelhecimento 0"
+        # Autores corrigidos a partir de "Autores - Revista"
+        assert rows[1][3:5] == ("Silva, Souza", "Revista X")
+        assert rows[1][9] == "envelhecimento"
+        assert workbook["Pesquisadores"].max_row == 3
+
+    print("✅ Publicações, pesquisadores e estatísticas gravados")
+
+
+def test_async_export_rolls_over_sheet_limit():
+    print("Testando limite de linhas por aba...")
+
+    async def research():
+        for name in ["Maria Silva", "João Souza"]:
+            yield _research(name, 3)
+
+    original_limit = excel_consolidado.EXCEL_MAX_ROWS
+    excel_consolidado.EXCEL_MAX_ROWS = 5
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            filename = asyncio.run(_exporter(directory).export_consolidated_excel_async(research(), include_stats=False))
+            workbook = load_workbook(os.path.join(directory, filename))
+
+            assert workbook.sheetnames == ["Publicações", "Pesquisadores", "Publicações (2)"]
+            assert workbook["Publicações"].max_row == 5
+            assert workbook["Publicações (2)"].max_row == 1 + 2
+    finally:
+        excel_consolidado.EXCEL_MAX_ROWS = original_limit
+
+    print("✅ Linhas excedentes continuam em uma nova aba")
+
+
+def test_empty_export_returns_none():
+    with tempfile.TemporaryDirectory() as directory:
+        assert _exporter(directory).export_consolidated_excel([], include_stats=False) is None
+        assert os.listdir(directory) == []
+
+
+def test_failed_export_leaves_no_partial_file():
+    print("Testando exportação interrompida...")
+
+    async def failing():
+        yield _research("Maria Silva", 3)
+        raise RuntimeError("cursor perdido")
+
+    async def endless():
+        while True:
+            yield _research("Maria Silva", 3)
+            await asyncio.sleep(0.01)
+
+    async def cancelled(exporter):
+        task = asyncio.create_task(exporter.export_consolidated_excel_async(endless()))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    with tempfile.TemporaryDirectory() as directory:
+        exporter = _exporter(directory)
+        try:
+            asyncio.run(exporter.export_consolidated_excel_async(failing()))
+            assert False, "o erro do cursor deveria ser propagado"
+        except RuntimeError as e:
+            assert str(e) == "cursor perdido"
+        assert os.listdir(directory) == []
+
+        assert asyncio.run(cancelled(exporter))
+        assert os.listdir(directory) == []
+
+    print("✅ Erro e cancelamento propagam sem deixar arquivo parcial")
+
+
+if __name__ == "__main__":
+    test_streaming_export_writes_all_sheets()
+    test_async_export_rolls_over_sheet_limit()
+    test_empty_export_returns_none()
+    test_failed_export_leaves_no_partial_file()
+    print("\n🎉 Testes da exportação em streaming concluídos!")
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import asyncio
+import tempfile
+
+import src.database.export_jobs as export_jobs_module
+from src.database.excel_consolidado import ConsolidatedExcelExporter
+from src.database.export_jobs import ExportJob, ExportJobManager, data_version
+
+
+STATS = {"total_searches": 4, "filtered_searches": 2, "total_publications": 6,
+         "total_researchers": 2, "latest_search": "2024-05-01T10:00:00"}
+
+
+class FakeDatabase:
+    def __init__(self, stats):
+        self.stats = stats
+        self.iterations = 0
+
+    async def get_research_statistics_async(self):
+        return dict(self.stats)
+
+    async def iter_scholar_research_async(self):
+        self.iterations += 1
+        for name in ["Maria Silva", "João Souza"]:
+            yield {
+                "researcher_info": {"name": name},
+                "platform": "scholar",
+                "timestamp": "2024-05-01T10:00:00",
+                "total_publications": 3,
+                "publications": [{"title": f"Artigo {index}", "year": "2021"} for index in range(3)],
+            }
+
+
+def test_data_version_follows_counters():
+    print("Testando versão dos dados...")
+
+    assert data_version(STATS) == data_version(dict(STATS, platforms=["scholar"]))
+    assert data_version(STATS) != data_version(dict(STATS, total_searches=5))
+
+    job = ExportJob("abc", data_version(STATS), total_researchers=4)
+    job.update_progress(1, 3)
+    assert job.to_dict()["progress"] == 25.0
+    assert job.to_dict()["download_url"] is None
+
+    print("✅ Versão muda só quando os contadores mudam")
+
+
+def test_submit_reuses_artifact(monkeypatch):
+    print("Testando reaproveitamento do arquivo exportado...")
+
+    database = FakeDatabase(STATS)
+    monkeypatch.setattr(export_jobs_module, "research_db", database)
+
+    async def scenario(directory):
+        exporter = ConsolidatedExcelExporter()
+        exporter.exports_dir = directory
+        manager = ExportJobManager(exporter)
+
+        first = await manager.submit()
+        # Pedido repetido durante a exportação acompanha o mesmo job
+        assert await manager.submit() is first
+        await first.done.wait()
+        assert first.status == "done" and not first.cached
+        assert first.to_dict()["researchers"] == 2
+        assert os.path.exists(manager.artifact_path(first.filename))
+
+        second = await manager.submit()
+        assert second.status == "done" and second.cached
+        assert second.filename == first.filename
+
+        # Busca nova gravada: outra versão, outro arquivo
+        database.stats["total_searches"] += 1
+        third = await manager.submit()
+        await third.done.wait()
+        assert third.filename != first.filename
+        return database.iterations
+
+    with tempfile.TemporaryDirectory() as directory:
+        assert asyncio.run(scenario(directory)) == 2
+
+    print("✅ Dados sem alteração não geram o Excel de novo")
+
+
+class FailingDatabase(FakeDatabase):
+    async def iter_scholar_research_async(self):
+        yield {"researcher_info": {"name": "Maria Silva"}, "publications": []}
+        raise RuntimeError("cursor do MongoDB perdido")
+
+
+class EmptyDatabase(FakeDatabase):
+    async def iter_scholar_research_async(self):
+        return
+        yield
+
+
+def test_failure_is_not_reported_as_empty(monkeypatch):
+    print("Testando falha x banco vazio...")
+
+    async def scenario(directory, database):
+        monkeypatch.setattr(export_jobs_module, "research_db", database)
+        exporter = ConsolidatedExcelExporter()
+        exporter.exports_dir = directory
+        job = await ExportJobManager(exporter).submit()
+        await job.done.wait()
+        return job
+
+    with tempfile.TemporaryDirectory() as directory:
+        failed = asyncio.run(scenario(directory, FailingDatabase(STATS)))
+        assert failed.status == "error" and not failed.empty
+        assert failed.error == "cursor do MongoDB perdido"
+        assert os.listdir(directory) == []
+
+        empty = asyncio.run(scenario(directory, EmptyDatabase(dict(STATS, total_searches=0))))
+        assert empty.status == "error" and empty.empty
+
+    print("✅ Erro de exportação vira erro do job, não 'sem dados'")
+
+
+if __name__ == "__main__":
+    test_data_version_follows_counters()
+    print("\n🎉 Testes dos jobs de exportação concluídos!")
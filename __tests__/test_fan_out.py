@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import time
+import asyncio
+
+from src.services.academic_services import AcademicResearchService
+from src.utils.fan_out import fan_out, STATUS_ERROR, STATUS_OK, STATUS_TIMEOUT
+
+
+async def _respond(value, delay):
+    await asyncio.sleep(delay)
+    return value
+
+
+async def _fail():
+    raise RuntimeError("fonte indisponível")
+
+
+def test_fan_out_runs_platforms_concurrently():
+    print("Testando busca paralela...")
+
+    start = time.perf_counter()
+    outcomes = asyncio.run(fan_out({
+        "lattes": lambda: _respond("lattes", 0.2),
+        "orcid": lambda: _respond("orcid", 0.2),
+    }))
+    elapsed = time.perf_counter() - start
+
+    # Latência total é a da fonte mais lenta, não a soma
+    assert elapsed < 0.35
+    assert list(outcomes) == ["lattes", "orcid"]
+    assert outcomes["lattes"].status == STATUS_OK
+    assert outcomes["orcid"].result == "orcid"
+
+    print("✅ Plataformas consultadas ao mesmo tempo")
+
+
+def test_fan_out_partial_results():
+    print("Testando resultados parciais...")
+
+    outcomes = asyncio.run(fan_out(
+        {
+            "lattes": lambda: _respond("lattes", 0.0),
+            "orcid": lambda: _respond("orcid", 1.0),
+            "scholar": _fail,
+        },
+        timeouts={"orcid": 0.1}
+    ))
+
+    assert outcomes["lattes"].ok
+    assert outcomes["orcid"].status == STATUS_TIMEOUT
+    assert outcomes["orcid"].result is None
+    assert outcomes["scholar"].status == STATUS_ERROR
+    assert outcomes["scholar"].status_dict()["error"] == "fonte indisponível"
+    assert "latency" in outcomes["lattes"].status_dict()
+
+    print("✅ Fonte lenta ou com erro não derruba as demais")
+
+
+class _FailingSession:
+    def get(self, *args, **kwargs):
+        raise ConnectionError("pub.orcid.org fora do ar")
+
+
+def test_failing_platform_is_reported():
+    print("Testando status de plataforma com erro...")
+
+    service = AcademicResearchService()
+    service.orcid_service.session = _FailingSession()
+    _, orcid_profiles, summary = asyncio.run(service.comprehensive_search_async("Maria Silva", 5))
+
+    # A busca continua, mas o ORCID aparece como erro em vez de "ok" com zero perfis
+    assert orcid_profiles == []
+    assert summary.platform_status["orcid"]["status"] == STATUS_ERROR
+    assert summary.platform_status["orcid"]["error"] == "pub.orcid.org fora do ar"
+    assert summary.platform_status["lattes"]["status"] == STATUS_OK
+
+    print("✅ Falha do ORCID aparece no status da plataforma")
+
+
+if __name__ == "__main__":
+    test_fan_out_runs_platforms_concurrently()
+    test_fan_out_partial_results()
+    test_failing_platform_is_reported()
+    print("\n🎉 Testes da busca paralela concluídos!")
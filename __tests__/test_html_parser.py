@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from src.scraper import scholar_page
+from src.scraper.lattes_scraper import CV_SUMMARY_SECTIONS, LattesAdvancedScraper, select_cv_sections
+from src.utils.html_parser import FALLBACK_BACKEND, HtmlParser, backend_available
+from src.utils.parser_benchmark import sample_lattes_cv, sample_scholar_profile
+
+
+def _scholar_summary(soup):
+    return (
+        [row.select_one(".gsc_a_at").get_text() for row in soup.select("tr.gsc_a_tr")],
+        [cell.get_text() for cell in soup.select(".gsc_rsb_std")],
+    )
+
+
+def test_backends_extract_the_same_data():
+    print("Testando backends de parsing...")
+
+    page = sample_scholar_profile(publications=20)
+    fast = HtmlParser("lxml").parse(page)
+    slow = HtmlParser("html.parser").parse(page)
+
+    titles, stats = _scholar_summary(fast)
+    assert len(titles) == 20
+    assert stats == ["1234", "456", "18", "11", "27", "14"]
+    assert (titles, stats) == _scholar_summary(slow)
+
+    print("✅ lxml e html.parser devolvem as mesmas publicações e métricas")
+
+
+def test_known_encoding_and_fallback():
+    print("Testando encoding e fallback...")
+
+    soup = HtmlParser("lxml").parse(sample_lattes_cv(items_per_section=2), from_encoding="latin-1")
+    assert soup.find("h2", class_="nome").get_text() == "Maria Silva"
+    assert "Última atualização" in soup.find("ul", class_="informacoes-autor").get_text()
+
+    assert not backend_available("parser-inexistente")
+    assert HtmlParser("parser-inexistente").backend == FALLBACK_BACKEND
+
+    print("✅ CV em latin-1 decodificado e backend ausente cai para html.parser")
+
+
+def test_scholar_profile_strainer():
+    print("Testando parse parcial do perfil Scholar...")
+
+    parser = HtmlParser("lxml")
+    soup = parser.parse(sample_scholar_profile(publications=20), parse_only=scholar_page.PROFILE_STRAINER)
+
+    assert soup.select_one("#gsc_prf_in").get_text() == "Maria Silva"
+    assert soup.select_one(".gsc_prf_il").get_text() == "Universidade de São Paulo"
+    assert len(soup.select(".gsc_rsb_std")) == 6
+    # Publicações e scripts não viram árvore
+    assert soup.select("tr.gsc_a_tr") == []
+    assert soup.find("script") is None
+
+    # Página fora do formato esperado (ex: CAPTCHA) é montada inteira
+    soup = parser.parse(b"<html><body><p>Bloqueado</p></body></html>", parse_only=scholar_page.PROFILE_STRAINER)
+    assert soup.find("p").get_text() == "Bloqueado"
+
+    print("✅ Só cabeçalho e tabela de citações são montados")
+
+
+def test_lattes_summary_sections():
+    print("Testando CV Lattes no modo resumido...")
+
+    page = sample_lattes_cv(items_per_section=3)
+    html = select_cv_sections(page.decode("latin-1"), CV_SUMMARY_SECTIONS)
+    assert 'name="AtuacaoProfissional"' in html
+    assert 'name="ArtigosCompletos"' not in html
+
+    scraper = LattesAdvancedScraper()
+    url = "http://buscatextual.cnpq.br/buscatextual/visualizacv.do?id=1234567890123456"
+    summary = scraper._parse_full_profile(scraper._parse_cv(page, include_all_sections=False), url, False)
+    full = scraper._parse_full_profile(scraper._parse_cv(page), url)
+
+    assert len(summary.professional_experience) == len(full.professional_experience) == 3
+    assert summary.name == full.name
+    assert summary.research_projects == [] and len(full.research_projects) == 3
+
+    print("✅ Só as seções do resumo são montadas e extraídas")
+
+
+if __name__ == "__main__":
+    test_backends_extract_the_same_data()
+    test_known_encoding_and_fallback()
+    test_scholar_profile_strainer()
+    test_lattes_summary_sections()
+    print("\n🎉 Testes do parser HTML concluídos!")
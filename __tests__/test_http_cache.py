@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import tempfile
+
+import httpx
+
+from src.utils.http_cache import ResponseCache, normalize_url
+
+
+def test_normalize_url():
+    print("Testando normalização de URL...")
+
+    a = normalize_url("HTTPS://Scholar.Google.com/citations?user=X&hl=en#topo")
+    b = normalize_url("https://scholar.google.com/citations", {"hl": "en", "user": "X"})
+    assert a == b == "https://scholar.google.com/citations?hl=en&user=X"
+
+    print("✅ URL e parâmetros geram a mesma chave")
+
+
+def test_response_cache_roundtrip():
+    print("Testando gravação e leitura do cache em disco...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ResponseCache(directory=directory, ttls={"pub.orcid.org": 3600})
+        url = "https://pub.orcid.org/v3.0/0000-0002-1825-0097/record"
+
+        assert cache.lookup(url) is None
+
+        response = httpx.Response(
+            200,
+            headers={"content-type": "application/json", "etag": '"abc"'},
+            content=b'{"orcid": "0000-0002-1825-0097"}',
+            request=httpx.Request("GET", url),
+        )
+        assert cache.store(url, None, response)
+
+        entry = cache.lookup(url)
+        assert entry is not None and entry.fresh
+        cached = entry.to_response()
+        assert cached.json()["orcid"] == "0000-0002-1825-0097"
+        assert entry.conditional_headers() == {"If-None-Match": '"abc"'}
+
+        # Hosts sem TTL configurado não são cacheados
+        assert not cache.is_cacheable("GET", "http://localhost:8000/health")
+
+        cache.invalidate(url)
+        assert cache.lookup(url) is None
+
+    print("✅ Cache em disco funcionando")
+
+
+def test_block_pages_are_not_cached():
+    print("Testando páginas de bloqueio no cache...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ResponseCache(directory=directory)
+        url = "https://scholar.google.com/citations?user=X&cstart=100&pagesize=100"
+
+        def page(body: bytes) -> httpx.Response:
+            return httpx.Response(200, headers={"content-type": "text/html"}, content=body,
+                                  request=httpx.Request("GET", url))
+
+        # CAPTCHA vem com status 200, mas não é gravado
+        captcha = b'<html><body><div id="gsc_captcha_ccl">Digite os caracteres</div></body></html>'
+        assert not cache.store(url, None, page(captcha))
+        assert cache.lookup(url) is None
+
+        assert cache.store(url, None, page(b'<table id="gsc_a_t"></table>'))
+        assert cache.lookup(url).fresh
+
+        # Entrada de bloqueio já no disco (gravada antes do validador) é descartada na leitura
+        cache.validators = {}
+        assert cache.store(url, None, page(captcha))
+        cache.validators = ResponseCache(directory=directory).validators
+        assert cache.lookup(url) is None
+        assert cache.storage.load(cache.key_for("GET", url)) is None
+
+        # Currículo Lattes (TTL de 24h): desafio do CNPq também fica fora
+        for lattes_url in ("http://buscatextual.cnpq.br/buscatextual/visualizacv.do?id=K4787027P5",
+                           "http://lattes.cnpq.br/1234567890123456"):
+            challenge = b'<form><div id="divCaptcha"><input name="tokenCaptchar"></div></form>'
+            assert not cache.store(lattes_url, None, page(challenge))
+            assert cache.lookup(lattes_url) is None
+            assert cache.store(lattes_url, None, page(b'<div class="layout-cell-pad-5">Resumo</div>'))
+            assert cache.lookup(lattes_url).fresh
+
+    print("✅ CAPTCHA do Scholar e do CNPq não entra no cache")
+
+
+if __name__ == "__main__":
+    test_normalize_url()
+    test_response_cache_roundtrip()
+    test_block_pages_are_not_cached()
+    print("\n🎉 Testes do cache HTTP concluídos!")
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import httpx
+
+from src.utils.http_client import HttpEngine, HttpSession
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    """Servidor falso: /init?user=X entrega o cookie da sessão, /login redireciona definindo outro"""
+    if request.url.path == "/init":
+        user = request.url.params["user"]
+        return httpx.Response(200, headers={"set-cookie": f"JSESSIONID={user}; Path=/"}, text="ok")
+    if request.url.path == "/login":
+        return httpx.Response(302, headers={"location": "/home", "set-cookie": "GSP=login; Path=/"})
+    return httpx.Response(200, text=request.headers.get("cookie", ""))
+
+
+class MockEngine(HttpEngine):
+    def _create_client(self) -> httpx.AsyncClient:
+        client = super()._create_client()
+        return httpx.AsyncClient(transport=httpx.MockTransport(_handler), cookies=client.cookies.jar)
+
+
+def test_sessions_keep_their_own_cookies():
+    print("Testando cookies por sessão...")
+
+    engine = MockEngine()
+    try:
+        first, second = HttpSession(engine=engine), HttpSession(engine=engine)
+        first.get("http://lattes.test/init?user=ana")
+        second.get("http://lattes.test/init?user=bruno")
+
+        # Cada busca volta com o próprio JSESSIONID, não com o da última sessão
+        assert first.get("http://lattes.test/busca").text == "JSESSIONID=ana"
+        assert second.get("http://lattes.test/busca").text == "JSESSIONID=bruno"
+        assert [response.text for response in second.get_many(["http://lattes.test/a", "http://lattes.test/b"])] == [
+            "JSESSIONID=bruno", "JSESSIONID=bruno"
+        ]
+
+        # Set-Cookie de um redirecionamento vale no salto seguinte e fica na sessão
+        response = first.get("http://lattes.test/login")
+        assert response.text == "JSESSIONID=ana; GSP=login"
+        assert [hop.status_code for hop in response.history] == [302]
+        assert first.cookies.get("GSP") == "login" and second.cookies.get("GSP") is None
+
+        # O cliente compartilhado não guarda cookie nenhum
+        assert len(engine._client.cookies.jar) == 0
+    finally:
+        engine.close()
+
+    print("✅ Sessões não trocam cookies entre si")
+
+
+if __name__ == "__main__":
+    test_sessions_keep_their_own_cookies()
+    print("\n🎉 Testes do cliente HTTP concluídos!")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from src.database.indexes import REQUIRED_INDEXES, plan_index_changes
+
+
+def test_plan_creates_missing_indexes():
+    print("Testando planejamento de índices...")
+
+    existing = {"_id_": {"key": [("_id", 1)]}}
+    to_create, to_drop, report = plan_index_changes(existing, REQUIRED_INDEXES["searches"])
+
+    assert len(to_create) == len(REQUIRED_INDEXES["searches"])
+    assert to_drop == []
+    assert {entry["status"] for entry in report} == {"created"}
+
+    print("✅ Índices ausentes são criados")
+
+
+def test_plan_keeps_existing_and_recreates_conflicts():
+    print("Testando índices já existentes...")
+
+    existing = {
+        "_id_": {"key": [("_id", 1)]},
+        "filtered_timestamp": {"key": [("filtered_by_keywords", 1), ("timestamp", -1), ("_id", -1)]},
+        # Mesma chave com outro nome (criado à mão) também atende a consulta
+        "researcher_id_1_timestamp_-1": {"key": [("researcher_id", 1), ("timestamp", -1)]},
+        # Nome declarado com chave diferente: recriar
+        "timestamp": {"key": [("timestamp", 1)]},
+    }
+    to_create, to_drop, report = plan_index_changes(existing, REQUIRED_INDEXES["searches"])
+    status = {entry["name"]: entry["status"] for entry in report}
+
+    assert status["filtered_timestamp"] == "ok"
+    assert status["researcher_timestamp"] == "ok"
+    assert status["timestamp"] == "recreated"
+    assert to_drop == ["timestamp"]
+    assert len(to_create) == len(REQUIRED_INDEXES["searches"]) - 2
+
+    print("✅ Índices existentes conferidos e conflitos recriados")
+
+
+if __name__ == "__main__":
+    test_plan_creates_missing_indexes()
+    test_plan_keeps_existing_and_recreates_conflicts()
+    print("\n🎉 Testes do gerenciador de índices concluídos!")
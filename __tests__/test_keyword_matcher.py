@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from src.utils.keyword_matcher import KeywordMatcher, fold_text
+
+
+def test_fold_text():
+    print("Testando normalização de texto...")
+
+    assert fold_text("Geriatría e ENVELHECIMENTO") == "geriatria e envelhecimento"
+    assert fold_text("Saúde do Idoso") == "saude do idoso"
+
+    print("✅ Texto normalizado sem acentos e em minúsculas")
+
+
+def test_whole_word_matching():
+    print("Testando busca por palavra completa...")
+
+    matcher = KeywordMatcher(['idosa', 'pessoa idosa', 'aged', 'aging', 'geriatria', 'geriatría'])
+
+    # Palavras contidas em outras também são reportadas, na ordem da lista
+    assert matcher.find("Cuidado da PESSOA IDOSA") == ['idosa', 'pessoa idosa']
+    # Acentos são ignorados nos dois lados
+    assert matcher.find("Revista de Geriatria") == ['geriatria', 'geriatría']
+    # Palavra completa: 'aged' não casa dentro de 'engaged'
+    assert matcher.find("engaged students") == []
+    assert matcher.find("") == []
+    assert matcher.matches("healthy aging")
+
+    print("✅ Palavras-chave encontradas em uma única passada")
+
+
+def test_substring_matching():
+    print("Testando busca por substring...")
+
+    matcher = KeywordMatcher(['elder', 'elderly', 'idoso'], whole_words=False)
+    assert matcher.find("Elderly care") == ['elder', 'elderly']
+    assert matcher.find_in_fields({"title": "Saúde", "snippet": "idosos"}, ("title", "snippet")) == ['idoso']
+
+    print("✅ Modo substring mantém o comportamento do exportador consolidado")
+
+
+if __name__ == "__main__":
+    test_fold_text()
+    test_whole_word_matching()
+    test_substring_matching()
+    print("\n🎉 Testes do motor de palavras-chave concluídos!")
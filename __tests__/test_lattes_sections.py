@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import re
+
+from src.scraper.lattes_scraper import LattesAdvancedScraper
+from src.scraper.lattes_sections import CvSectionIndex
+from src.utils.html_parser import parse_html
+from src.utils.parser_benchmark import sample_lattes_cv
+
+
+def test_index_sections():
+    print("Testando índice de seções do CV...")
+
+    soup = parse_html(sample_lattes_cv(items_per_section=4), from_encoding="latin-1")
+    sections = CvSectionIndex(soup)
+
+    assert [section.name for section in sections.sections][:3] == [
+        "Identificacao", "FormacaoAcademicaTitulacao", "AtuacaoProfissional"
+    ]
+    projects = sections.get("ProjetosPesquisa")
+    assert projects.title == "ProjetosPesquisa"
+    assert len(list(projects.items(min_length=15))) == 4
+    # Regex: mesma semântica de soup.find('a', attrs={'name': re.compile(...)})
+    assert sections.get(re.compile(r"Premios|Titulos")).name == "PremiosTitulos"
+    assert sections.get("Inexistente") is None
+    assert "Maria Silva" in sections.text
+
+    print("✅ Seções, títulos e itens indexados em uma passada")
+
+
+def test_following_stops_at_next_section():
+    print("Testando elementos entre seções...")
+
+    soup = parse_html(
+        '<div class="title-wrapper"><a name="TrabalhosPublicadosAnaisCongresso"></a><h1>Trabalhos</h1></div>'
+        '<div>SILVA, M. Trabalho completo em congresso, 2019.</div>'
+        '<div>SILVA, M. Outro trabalho completo em congresso, 2021.</div>'
+        '<div class="title-wrapper"><a name="ResumosExpandidos"></a><h1>Resumos</h1></div>'
+        '<div>SILVA, M. Resumo expandido que não é trabalho completo, 2020.</div>'
+    )
+    sections = CvSectionIndex(soup)
+    works = sections.get("TrabalhosPublicadosAnaisCongresso")
+    assert [element.get_text()[-5:-1] for element in works.following()] == ["2019", "2021"]
+
+    papers = LattesAdvancedScraper()._extract_conference_papers(sections)
+    assert [paper["year"] for paper in papers] == ["2019", "2021"]
+
+    print("✅ Trabalhos param na próxima seção")
+
+
+def test_full_profile_from_index():
+    print("Testando extração completa pelo índice...")
+
+    scraper = LattesAdvancedScraper()
+    url = "http://buscatextual.cnpq.br/buscatextual/visualizacv.do?id=1234567890123456"
+    soup = scraper._parse_cv(sample_lattes_cv(items_per_section=5))
+    profile = scraper._parse_full_profile(soup, url)
+
+    assert profile.lattes_id == "1234567890123456"
+    assert len(profile.professional_experience) == 5
+    assert len(profile.research_projects) == 5
+    assert profile.total_projects == 5
+    assert profile.research_projects[0]["year"] == "1990"
+
+    print("✅ Perfil extraído seção a seção")
+
+
+if __name__ == "__main__":
+    test_index_sections()
+    test_following_stops_at_next_section()
+    test_full_profile_from_index()
+    print("\n🎉 Testes do índice de seções concluídos!")
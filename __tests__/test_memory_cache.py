@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import time
+
+from src.utils.memory_cache import TTLCache
+
+
+def test_ttl_cache_lru():
+    print("Testando cache em memória...")
+
+    cache = TTLCache(max_entries=2, ttl=60)
+    cache.put("0000-0001", "perfil 1")
+    cache.put("0000-0002", "perfil 2")
+
+    # Acesso recente protege a entrada; a menos usada sai primeiro
+    assert cache.get("0000-0001") == "perfil 1"
+    cache.put("0000-0003", "perfil 3")
+    assert cache.get("0000-0002") is None
+    assert cache.get("0000-0003") == "perfil 3"
+    assert cache.stats()["entries"] == 2
+
+    print("✅ Cache descarta a entrada menos usada")
+
+
+def test_ttl_cache_expiry():
+    print("Testando expiração do cache...")
+
+    cache = TTLCache(max_entries=10, ttl=0.05)
+    cache.put("0000-0001", "perfil 1")
+    assert cache.get("0000-0001") == "perfil 1"
+
+    time.sleep(0.06)
+    assert cache.get("0000-0001") is None
+    assert cache.stats()["hits"] == 1
+
+    print("✅ Entradas expiram após o TTL")
+
+
+if __name__ == "__main__":
+    test_ttl_cache_lru()
+    test_ttl_cache_expiry()
+    print("\n🎉 Testes do cache em memória concluídos!")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from datetime import datetime, timezone
+
+from src.database.normalized import (
+    build_research_writes,
+    publication_key,
+    researcher_id_for,
+    researcher_key,
+    search_counter_updates,
+)
+
+
+def _research(name, titles, platform="scholar"):
+    return {
+        "query": name,
+        "platform": platform,
+        "researcher_info": {"name": name, "institution": "USP", "h_index": None},
+        "total_results": len(titles),
+        "data": {"publications": [
+            {"title": title, "year": "2021", "cited_by": "12", "snippet": "Envelhecimento ativo"}
+            for title in titles
+        ]},
+    }
+
+
+def test_stable_keys():
+    print("Testando chaves estáveis...")
+
+    assert researcher_key("Maria José Silva") == "maria-jose-silva"
+    # O próprio id também resolve para ele mesmo (DELETE /mongodb/researcher/{id})
+    assert researcher_key("maria-jose-silva") == "maria-jose-silva"
+    # Placeholders dos extratores nunca viram chave
+    assert researcher_key("Nome não encontrado") == researcher_key("N/A") == ""
+
+    # Id do perfil tem prioridade sobre o nome (o da própria plataforma primeiro)
+    info = {"name": "Maria Silva", "orcid_id": "0000-0002-1825-0097", "lattes_id": "1234567890123456"}
+    assert researcher_id_for(info, "lattes") == "lattes:1234567890123456"
+    assert researcher_id_for(info, "orcid") == "orcid:0000-0002-1825-0097"
+    assert researcher_id_for({"name": "Maria Silva", "scholar_id": "N/A"}, "scholar") == "maria-silva"
+    assert researcher_id_for({"name": "Nome não encontrado"}, "scholar") is None
+
+    first = publication_key({"title": "Frailty in Older Adults.", "year_int": 2021})
+    second = publication_key({"title": "frailty in older adults", "year_int": 2021})
+    other_year = publication_key({"title": "frailty in older adults", "year_int": 2022})
+    assert first == second
+    assert first != other_year
+    assert publication_key({"title": ""}) is None
+
+    print("✅ Mesma publicação gera o mesmo _id")
+
+
+def test_repeated_search_produces_same_upserts():
+    print("Testando buscas repetidas...")
+
+    now = datetime.now(timezone.utc)
+    first = build_research_writes(_research("Maria Silva", ["A", "B", "A"]), now)
+    second = build_research_writes(_research("Maria Silva", ["A", "B"]), now)
+
+    # Publicação repetida no mesmo resultado vira um único upsert
+    assert len(first["publications"]) == 2
+    assert [query for query, _ in first["publications"]] == [query for query, _ in second["publications"]]
+    assert first["search"]["publication_ids"] == second["search"]["publication_ids"]
+    assert first["search"]["_id"] != second["search"]["_id"]
+
+    query, update = first["researcher"]
+    assert query == {"_id": "maria-silva"}
+    # Campos vazios não apagam dados trazidos por outra busca
+    assert "info.h_index" not in update["$set"]
+    assert update["$set"]["info.institution"] == "USP"
+    assert update["$addToSet"] == {"platforms": "scholar"}
+
+    _, publication_update = first["publications"][0]
+    assert publication_update["$max"] == {"cited_by": 12}
+    assert "cited_by" not in publication_update["$set"]
+    assert publication_update["$set"]["matched_keywords"] == ["envelhecimento"]
+    assert publication_update["$addToSet"]["researcher_ids"] == "maria-silva"
+
+    print("✅ Mesma busca atualiza os mesmos documentos")
+
+
+def test_homonyms_and_placeholders_stay_apart():
+    print("Testando homônimos e nomes não encontrados...")
+
+    now = datetime.now(timezone.utc)
+    first = _research("Maria Silva", ["A"])
+    first["researcher_info"]["scholar_id"] = "JicYPdAAAAAJ"
+    second = _research("Maria Silva", ["B"])
+    second["researcher_info"]["scholar_id"] = "XyZ123AAAAAJ"
+    writes = [build_research_writes(research, now) for research in (first, second)]
+    assert [w["researcher"][0]["_id"] for w in writes] == ["scholar:JicYPdAAAAAJ", "scholar:XyZ123AAAAAJ"]
+    assert writes[0]["publications"][0][1]["$addToSet"]["researcher_ids"] == "scholar:JicYPdAAAAAJ"
+
+    # Sem id e sem nome: a busca é gravada, mas não junta publicações num pesquisador genérico
+    unnamed = build_research_writes(_research("Nome não encontrado", ["C"]), now)
+    assert unnamed["researcher"] is None and unnamed["search"]["researcher_id"] is None
+    assert "researcher_ids" not in unnamed["publications"][0][1]["$addToSet"]
+
+    # Com id, o placeholder não sobrescreve o nome trazido por outra busca
+    placeholder = _research("Nome não encontrado", ["D"])
+    placeholder["researcher_info"]["scholar_id"] = "JicYPdAAAAAJ"
+    _, update = build_research_writes(placeholder, now)["researcher"]
+    assert "name" not in update["$set"]
+    assert update["$setOnInsert"]["name"] == "scholar:JicYPdAAAAAJ"
+
+    print("✅ Cada perfil tem o próprio documento de pesquisador")
+
+
+def test_counter_updates():
+    print("Testando contadores incrementais...")
+
+    earlier = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    later = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    searches = [
+        build_research_writes(dict(_research("Maria Silva", ["A"]), filtered_by_keywords=True), earlier)["search"],
+        build_research_writes(_research("Maria Silva", ["B"], platform="lattes"), later)["search"],
+        build_research_writes(_research("João Souza", ["C"]), earlier)["search"],
+    ]
+    stats_update, researcher_updates = search_counter_updates(searches)
+
+    assert stats_update["$inc"] == {"total_searches": 3, "filtered_searches": 1}
+    assert stats_update["$max"] == {"latest_search": later}
+    assert stats_update["$addToSet"] == {"platforms": {"$each": ["lattes", "scholar"]}}
+    assert sorted(researcher_updates, key=lambda update: update[0]["_id"]) == [
+        ({"_id": "joao-souza"}, {"$inc": {"searches": 1}}),
+        ({"_id": "maria-silva"}, {"$inc": {"searches": 2}}),
+    ]
+
+    print("✅ Contadores somam só as buscas gravadas")
+
+
+if __name__ == "__main__":
+    test_stable_keys()
+    test_repeated_search_produces_same_upserts()
+    test_homonyms_and_placeholders_stay_apart()
+    test_counter_updates()
+    print("\n🎉 Testes do modelo normalizado concluídos!")
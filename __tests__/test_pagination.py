@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from datetime import datetime, timezone
+
+from bson import ObjectId
+
+from src.database.pagination import InvalidCursor, decode_cursor, encode_cursor, keyset_filter
+
+
+def test_cursor_round_trip():
+    print("Testando cursor de paginação...")
+
+    timestamp = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    search_id = ObjectId()
+
+    assert decode_cursor(encode_cursor(timestamp, search_id)) == (timestamp, search_id)
+    # _id de pesquisador é texto, não ObjectId
+    assert decode_cursor(encode_cursor(timestamp, "maria-silva")) == (timestamp, "maria-silva")
+
+    print("✅ Cursor preserva data e _id")
+
+
+def test_keyset_filter_and_invalid_cursor():
+    print("Testando filtro por chave...")
+
+    timestamp = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    query = keyset_filter("last_search", encode_cursor(timestamp, "maria-silva"))
+
+    assert query == {"$or": [
+        {"last_search": {"$lt": timestamp}},
+        {"last_search": timestamp, "_id": {"$lt": "maria-silva"}},
+    ]}
+
+    try:
+        decode_cursor("isso-nao-e-um-cursor")
+        assert False, "cursor inválido deveria falhar"
+    except InvalidCursor:
+        pass
+
+    print("✅ Próxima página começa depois do último (data, _id)")
+
+
+if __name__ == "__main__":
+    test_cursor_round_trip()
+    test_keyset_filter_and_invalid_cursor()
+    print("\n🎉 Testes de paginação concluídos!")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.scraper import parse_tasks
+from src.scraper.lattes_scraper import LattesProfile
+from src.utils.parse_pool import ParsePool
+from src.utils.parser_benchmark import sample_lattes_cv, sample_scholar_profile
+
+LATTES_URL = "http://buscatextual.cnpq.br/buscatextual/visualizacv.do?id=1234567890123456"
+
+
+def test_tasks_return_plain_data():
+    print("Testando tarefas de parsing...")
+
+    page = parse_tasks.scholar_publications_page(sample_scholar_profile(publications=20))
+    assert len(page["publications"]) == 20
+    assert page["publications"][0]["title"] == "Envelhecimento ativo e qualidade de vida 0"
+    # Página sem linhas de publicação: o extrator decide o fallback
+    assert parse_tasks.scholar_publications_page(b"<html><body></body></html>")["publications"] is None
+
+    profile = parse_tasks.lattes_full_profile(sample_lattes_cv(items_per_section=3), LATTES_URL)
+    assert json.loads(json.dumps(profile)) == profile
+    assert LattesProfile.from_dict(profile).to_dict() == profile
+    assert parse_tasks.lattes_profile_data(b"", "1", LATTES_URL) is None
+
+    print("✅ Só dicionários e listas voltam das tarefas")
+
+
+def test_pool_matches_inline():
+    print("Testando pool de processos...")
+
+    pages = [sample_lattes_cv(items_per_section=count) for count in (1, 2, 3)]
+    inline = ParsePool(max_workers=0)
+    pool = ParsePool(max_workers=2)
+    try:
+        expected = [parse_tasks.lattes_full_profile(page, LATTES_URL) for page in pages]
+        assert inline.parse(parse_tasks.lattes_full_profile, pages[0], LATTES_URL) == expected[0]
+        assert pool.parse(parse_tasks.lattes_full_profile, pages[2], LATTES_URL) == expected[2]
+
+        results = pool.map(parse_tasks.scholar_publications_page, [sample_scholar_profile(publications=n) for n in (5, 10)])
+        assert [len(result["publications"]) for result in results] == [5, 10]
+    finally:
+        pool.shutdown(wait=True)
+
+    print("✅ Pool devolve o mesmo resultado do parsing no processo, na ordem das páginas")
+
+
+def test_pool_is_thread_safe():
+    print("Testando pool com várias threads...")
+
+    page = sample_scholar_profile(publications=5)
+    pool = ParsePool(max_workers=1)
+    try:
+        # Primeiro uso simultâneo: um único pool de processos
+        start = threading.Barrier(8)
+
+        def first_use(_):
+            start.wait()
+            return pool.executor
+
+        with ThreadPoolExecutor(max_workers=8) as threads:
+            assert len({id(executor) for executor in threads.map(first_use, range(8))}) == 1
+
+        # Pool encerrado por outra thread entre a leitura e o submit: tenta em um novo
+        stale = pool.executor
+        stale.shutdown(wait=True)
+        assert len(pool.parse(parse_tasks.scholar_publications_page, page)["publications"]) == 5
+        fresh = pool.executor
+        assert fresh is not stale
+
+        # Descartar o pool antigo não derruba o que já foi recriado
+        assert pool._discard(stale) is False and pool.executor is fresh
+
+        pool.shutdown(wait=True)
+        results = pool.map(parse_tasks.scholar_publications_page, [page, page])
+        assert [len(result["publications"]) for result in results] == [5, 5]
+    finally:
+        pool.shutdown(wait=True)
+
+    print("✅ Um pool por vez, e chamadas sobrevivem a um pool encerrado")
+
+
+if __name__ == "__main__":
+    test_tasks_return_plain_data()
+    test_pool_matches_inline()
+    test_pool_is_thread_safe()
+    print("\n🎉 Testes do pool de parsing concluídos!")
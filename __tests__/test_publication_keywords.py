@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from src.database.keywords import (
+    MATCHED_KEYWORDS_FIELD, YEAR_FIELD,
+    annotate_publications, find_publication_keywords, parse_year
+)
+
+
+def test_annotate_publications():
+    print("Testando palavras-chave gravadas na ingestão...")
+
+    publications = [
+        {"title": "Fragilidade em idosos da comunidade", "snippet": "", "year": "2021"},
+        {"title": "Deep learning for images", "year": "N/A"},
+    ]
+    annotated = annotate_publications(publications)
+
+    assert annotated[0][MATCHED_KEYWORDS_FIELD] == ["idoso", "idosos", "fragilidade", "fragilidad"]
+    assert annotated[0][YEAR_FIELD] == 2021
+    assert annotated[1][MATCHED_KEYWORDS_FIELD] == []
+    assert annotated[1][YEAR_FIELD] is None
+    # A publicação original não é alterada
+    assert MATCHED_KEYWORDS_FIELD not in publications[0]
+
+    print("✅ Publicações anotadas com palavras-chave e ano")
+
+
+def test_find_publication_keywords():
+    print("Testando leitura das palavras-chave gravadas...")
+
+    # Campo gravado tem prioridade; documentos antigos são calculados na hora
+    assert find_publication_keywords({"title": "idoso", MATCHED_KEYWORDS_FIELD: ["geriatria"]}) == ["geriatria"]
+    assert find_publication_keywords({"title": "Cuidado ao idoso"}) == ["idoso"]
+    assert parse_year(2019) == 2019
+    assert parse_year("2020-05-01") == 2020
+
+    print("✅ Exportação reaproveita as palavras-chave gravadas")
+
+
+if __name__ == "__main__":
+    test_annotate_publications()
+    test_find_publication_keywords()
+    print("\n🎉 Testes das palavras-chave gravadas concluídos!")
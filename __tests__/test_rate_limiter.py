@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from src.utils.rate_limiter import HostRateLimiter, TokenBucket
+
+
+def test_token_bucket():
+    print("Testando token bucket...")
+
+    bucket = TokenBucket(rate=2.0, capacity=2)
+
+    # Rajada inicial sai sem espera
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+
+    # Orçamento esgotado: próximas requisições entram na fila
+    first_delay = bucket.reserve()
+    second_delay = bucket.reserve()
+    assert 0.4 < first_delay <= 0.5
+    assert 0.9 < second_delay <= 1.0
+
+    print("✅ Token bucket só atrasa quando o orçamento acaba")
+
+
+def test_host_rate_limiter():
+    print("Testando limitador por host...")
+
+    limiter = HostRateLimiter(limits={"escavador.com": (1.0, 1)})
+
+    # Subdomínios compartilham o bucket do host configurado
+    assert limiter.reserve("https://www.escavador.com/sobre?q=teste") == 0.0
+    assert limiter.reserve("https://escavador.com/sobre") > 0.0
+
+    # Hosts não configurados nunca esperam
+    assert limiter.reserve("http://localhost:8000/health") == 0.0
+    assert "escavador.com" in limiter.stats()
+
+    print("✅ Limitador aplica orçamento apenas aos hosts configurados")
+
+
+if __name__ == "__main__":
+    test_token_bucket()
+    test_host_rate_limiter()
+    print("\n🎉 Testes do limitador de taxa concluídos!")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from bs4 import BeautifulSoup
+
+from src.scraper.scholar_page import MetricColumns, extract_citation_stats
+from src.utils.parser_benchmark import sample_scholar_profile
+
+
+def _table(rows, header="Desde 2019"):
+    body = "".join(
+        f'<tr><td class="gsc_rsb_sc1"><a class="gsc_rsb_f">{label}</a></td>'
+        f'<td class="gsc_rsb_std">{total}</td><td class="gsc_rsb_std">{recent}</td></tr>'
+        for label, total, recent in rows
+    )
+    return BeautifulSoup(
+        f'<table id="gsc_rsb_st"><thead><tr><th></th><th>All</th><th>{header}</th></tr></thead>'
+        f'<tbody>{body}</tbody></table>',
+        "html.parser"
+    )
+
+
+def test_reads_all_metrics_in_one_pass():
+    print("Testando tabela de citações do Scholar...")
+
+    stats = extract_citation_stats(BeautifulSoup(sample_scholar_profile(publications=1), "html.parser"))
+    assert stats.complete
+    assert stats.since_year == 2019
+    assert stats.citations == MetricColumns(1234, 456)
+    assert stats.h_index == MetricColumns(18, 11)
+    assert stats.i10_index == MetricColumns(27, 14)
+
+    # Rótulos em inglês e milhares com vírgula
+    stats = extract_citation_stats(_table(
+        [("Citations", "12,345", "6,789"), ("h-index", "40", "25"), ("i10-index", "120", "80")],
+        header="Since 2020"
+    ))
+    assert stats.citations == MetricColumns(12345, 6789)
+    assert stats.h_index.all_time == 40 and stats.i10_index.since_year == 80
+    assert stats.to_dict()["since_year"] == 2020
+
+    print("✅ Citações, índice h e i10 (total e desde o ano) lidos de uma vez")
+
+
+def test_missing_metrics_stay_empty():
+    print("Testando tabela incompleta...")
+
+    stats = extract_citation_stats(_table([("Citações", "10", "4"), ("Índice h", "2", "1")]))
+    assert stats.h_index == MetricColumns(2, 1)
+    assert stats.i10_index is None
+    assert not stats.complete
+    assert stats.to_dict()["i10_index"] == {"all": None, "since": None}
+
+    # Sem a tabela: células na ordem do Scholar
+    soup = BeautifulSoup("".join(f'<td class="gsc_rsb_std">{value}</td>' for value in (50, 20, 4, 3)), "html.parser")
+    stats = extract_citation_stats(soup)
+    assert stats.citations == MetricColumns(50, 20) and stats.h_index == MetricColumns(4, 3)
+    assert stats.i10_index is None
+
+    print("✅ Métricas ausentes ficam vazias para o fallback")
+
+
+if __name__ == "__main__":
+    test_reads_all_metrics_in_one_pass()
+    test_missing_metrics_stay_empty()
+    print("\n🎉 Testes da tabela de citações concluídos!")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+from src.database.write_behind import WriteBehindQueue
+
+
+def test_batches_by_size_and_drains_on_stop():
+    print("Testando gravação em lote...")
+
+    batches = []
+
+    async def sink(documents):
+        batches.append(len(documents))
+        return len(documents)
+
+    async def scenario():
+        queue = WriteBehindQueue(sink, batch_size=3, flush_interval=0.05, max_pending=10, retries=0)
+        queue.start()
+        for index in range(7):
+            await queue.submit({"query": f"pesquisa {index}"})
+        await queue.stop()
+        return queue.stats()
+
+    stats = asyncio.run(scenario())
+
+    # Lotes cheios primeiro; o restante sai no flush por tempo ou no shutdown
+    assert batches[:2] == [3, 3]
+    assert sum(batches) == 7
+    assert stats["written"] == 7
+    assert stats["pending"] == 0
+    assert not stats["running"]
+
+    print("✅ Documentos gravados em lotes e fila drenada no shutdown")
+
+
+def test_retries_failed_batch():
+    print("Testando nova tentativa de lote...")
+
+    attempts = []
+
+    async def flaky_sink(documents):
+        attempts.append(len(documents))
+        if len(attempts) == 1:
+            raise ConnectionError("MongoDB indisponível")
+        return len(documents)
+
+    async def scenario():
+        queue = WriteBehindQueue(flaky_sink, batch_size=10, flush_interval=0.01, retries=1)
+        queue.start()
+        await queue.submit({"query": "pesquisa"})
+        await queue.stop()
+        return queue.stats()
+
+    stats = asyncio.run(scenario())
+
+    assert attempts == [1, 1]
+    assert stats["written"] == 1
+    assert stats["failed"] == 0
+
+    print("✅ Lote repetido após falha de conexão")
+
+
+if __name__ == "__main__":
+    test_batches_by_size_and_drains_on_stop()
+    test_retries_failed_batch()
+    print("\n🎉 Testes da gravação em lote concluídos!")
@@ -16,6 +16,12 @@ db.createUser({
 // Criar coleções iniciais
 db.createCollection("researchers-data");
 db.createCollection("search-history");
+// Modelo normalizado (src/database/normalized.py)
+db.createCollection("searches");
+db.createCollection("researcher_profiles");
+db.createCollection("publications");
+
+// Índices: declarados em src/database/indexes.py e criados pela API na inicialização
 
 // Inserir dados de exemplo (opcional)
 db["researchers-data"].insertOne({
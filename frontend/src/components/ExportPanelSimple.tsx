@@ -12,8 +12,20 @@ import {
   Trash2,
 } from "lucide-react";
 
+const API_URL = "http://localhost:8000";
+
+interface ExportJob {
+  id: string;
+  status: "queued" | "running" | "done" | "error";
+  researchers: number;
+  total_researchers: number | null;
+  error: string | null;
+  download_url: string | null;
+}
+
 const ExportPanel: React.FC = () => {
   const [isExporting, setIsExporting] = useState(false);
+  const [exportProgress, setExportProgress] = useState("");
   const [consolidatedStatus, setConsolidatedStatus] = useState<{
     type: "success" | "error" | null;
     message: string;
@@ -21,10 +33,39 @@ const ExportPanel: React.FC = () => {
 
   const handleDownloadConsolidated = async () => {
     setIsExporting(true);
+    setExportProgress("");
     setConsolidatedStatus({ type: null, message: "" });
 
     try {
-      const response = await fetch("http://localhost:8000/export/consolidated");
+      // O backend gera o Excel em segundo plano: pedir o job e acompanhar o progresso
+      const created = await fetch(`${API_URL}/export/consolidated/jobs`, {
+        method: "POST",
+      });
+      if (!created.ok) {
+        throw new Error(`Erro ${created.status}: ${created.statusText}`);
+      }
+      let job: ExportJob = (await created.json()).job;
+
+      while (job.status === "queued" || job.status === "running") {
+        setExportProgress(
+          job.total_researchers
+            ? `${job.researchers}/${job.total_researchers} pesquisadores`
+            : `${job.researchers} pesquisadores`
+        );
+        await new Promise((resolve) => setTimeout(resolve, 1000));
+
+        const polled = await fetch(`${API_URL}/export/consolidated/jobs/${job.id}`);
+        if (!polled.ok) {
+          throw new Error(`Erro ${polled.status}: ${polled.statusText}`);
+        }
+        job = (await polled.json()).job;
+      }
+
+      if (job.status === "error") {
+        throw new Error(job.error || "Exportação falhou");
+      }
+
+      const response = await fetch(`${API_URL}${job.download_url}`);
 
       if (!response.ok) {
         throw new Error(`Erro ${response.status}: ${response.statusText}`);
@@ -53,6 +94,7 @@ const ExportPanel: React.FC = () => {
       });
     } finally {
       setIsExporting(false);
+      setExportProgress("");
       // Limpar status após 4 segundos
       setTimeout(() => {
         setConsolidatedStatus({ type: null, message: "" });
@@ -169,7 +211,7 @@ const ExportPanel: React.FC = () => {
             {isExporting ? (
               <>
                 <Loader2 className='h-5 w-5 animate-spin mr-2' />
-                Exportando...
+                Exportando...{exportProgress && ` ${exportProgress}`}
               </>
             ) : (
               <>
@@ -18,7 +18,7 @@ import {
 import DarkModeToggle from "../components/DarkModeToggle";
 
 interface Researcher {
-  id: string; // Este é o nome do pesquisador (vem do backend como "id")
+  id: string; // Nome normalizado do pesquisador (ex: "maria-silva")
   name: string;
   institution?: string;
   h_index?: number;
@@ -37,6 +37,7 @@ interface MongoStats {
   total_searches: number;
   filtered_searches: number;
   total_publications: number;
+  total_researchers?: number;
   platforms: string[];
   latest_search?: string;
 }
@@ -47,6 +48,7 @@ const ResearchersHistory: React.FC = () => {
     []
   );
   const [stats, setStats] = useState<MongoStats | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [isLoading, setIsLoading] = useState(false);
   const [searchTerm, setSearchTerm] = useState("");
   const [statusMessage, setStatusMessage] = useState<{
@@ -76,16 +78,22 @@ const ResearchersHistory: React.FC = () => {
     }
   }, [searchTerm, researchers]);
 
-  const loadResearchers = async () => {
+  // Páginas de 50 pesquisadores; "cursor" continua de onde a página anterior parou
+  const loadResearchers = async (cursor?: string) => {
     setIsLoading(true);
     try {
-      const response = await fetch("http://localhost:8000/mongodb/researchers");
+      const params = new URLSearchParams({ limit: "50" });
+      if (cursor) params.set("cursor", cursor);
+      const response = await fetch(
+        `http://localhost:8000/mongodb/researchers?${params}`
+      );
       if (!response.ok) {
         throw new Error(`Erro ${response.status}: ${response.statusText}`);
       }
       const data = await response.json();
-      setResearchers(data.researchers || []);
-      setFilteredResearchers(data.researchers || []);
+      const page: Researcher[] = data.researchers || [];
+      setResearchers((previous) => (cursor ? [...previous, ...page] : page));
+      setNextCursor(data.next_cursor || null);
     } catch (error) {
       setStatusMessage({
         type: "error",
@@ -221,7 +229,7 @@ const ResearchersHistory: React.FC = () => {
               <DarkModeToggle />
 
               <button
-                onClick={loadResearchers}
+                onClick={() => loadResearchers()}
                 disabled={isLoading}
                 className='p-2 text-gray-400 hover:text-gray-600 dark:hover:text-gray-300 transition-colors disabled:opacity-50'
                 title='Atualizar lista'
@@ -305,7 +313,7 @@ const ResearchersHistory: React.FC = () => {
                     Pesquisadores
                   </p>
                   <p className='text-2xl font-bold text-indigo-900 dark:text-indigo-400'>
-                    {researchers.length}
+                    {stats.total_researchers ?? researchers.length}
                   </p>
                 </div>
                 <GraduationCap className='h-10 w-10 text-indigo-600 dark:text-indigo-400' />
@@ -517,8 +525,21 @@ const ResearchersHistory: React.FC = () => {
         {/* Results count */}
         {filteredResearchers.length > 0 && (
           <div className='mt-4 text-center text-sm text-gray-600'>
-            Mostrando {filteredResearchers.length} de {researchers.length}{" "}
-            pesquisadores
+            Mostrando {filteredResearchers.length} de{" "}
+            {stats?.total_researchers ?? researchers.length} pesquisadores
+          </div>
+        )}
+
+        {/* Next page */}
+        {nextCursor && (
+          <div className='mt-4 text-center'>
+            <button
+              onClick={() => loadResearchers(nextCursor)}
+              disabled={isLoading}
+              className='inline-flex items-center px-4 py-2 bg-blue-600 hover:bg-blue-700 text-white font-medium rounded-lg transition-colors disabled:opacity-50'
+            >
+              Carregar mais
+            </button>
           </div>
         )}
       </main>
@@ -7,19 +7,30 @@ COM SEPARAÇÃO COMPLETA DE LATTES E ORCID
 import os
 import re
 import json
-import time
-import random
 import asyncio
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Callable, Dict, List, Optional, Any, Tuple
 from datetime import datetime
-from urllib.parse import quote, unquote
+from contextlib import asynccontextmanager
+from urllib.parse import quote, unquote, urlsplit, parse_qsl, urlencode
 
-import requests
 from bs4 import BeautifulSoup
 from fastapi import FastAPI, Query, HTTPException
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 import uvicorn
 
+from src.utils.executor import blocking_executor, run_blocking
+from src.utils.html_parser import parse_html
+from src.utils.parse_pool import parse_pool
+from src.utils.http_client import HttpSession, http_engine
+from src.utils.rate_limiter import rate_limiter
+from src.utils.http_cache import response_cache
+from src.services.serpapi_client import serpapi_client
+from src.services.academic_services import orcid_profile_cache
+from src.scraper import scholar_page
+from src.scraper.parse_tasks import scholar_publications_page
+
 # Importar routers separados (NOVO!)
 try:
     from src.routers.lattes_api import lattes_router
@@ -32,8 +43,10 @@ except ImportError as e:
 
 # Importar MongoDB
 try:
-    from src.database.mongodb import research_db, ResearchDatabase
-    from src.database.excel_consolidado import consolidated_exporter
+    from src.database.mongodb import research_db
+    from src.database.pagination import InvalidCursor, decode_cursor
+    from src.database.write_behind import research_writer
+    from src.database.export_jobs import export_jobs
     MONGODB_AVAILABLE = True
     print("✅ MongoDB integrado")
 except ImportError as e:
@@ -42,10 +55,30 @@ except ImportError as e:
 
 print("🔥 API REAL DE SCRAPING CARREGADA!")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Ciclo de vida da aplicação: recursos compartilhados entre requisições"""
+    # Um único cliente MongoDB (e pool de conexões) para todos os endpoints
+    if MONGODB_AVAILABLE:
+        await research_db.connect_async()
+        research_writer.start()
+    yield
+    # Encerrar o pool de extratores bloqueantes, o pool de parsing, o cliente HTTP e o cliente MongoDB
+    # (exportações em andamento são canceladas e a fila de gravação é drenada antes)
+    if MONGODB_AVAILABLE:
+        await export_jobs.stop()
+    blocking_executor.shutdown()
+    parse_pool.shutdown()
+    await http_engine.aclose()
+    if MONGODB_AVAILABLE:
+        await research_writer.stop()
+        await research_db.close_async()
+
 app = FastAPI(
     title="API Real de Scraping Acadêmico",
     description="Extração real de dados do Lattes, ORCID e Google Scholar",
-    version="8.0.0"
+    version="8.0.0",
+    lifespan=lifespan
 )
 
 # CORS
@@ -65,6 +98,9 @@ if SEPARATED_APIS_AVAILABLE:
 else:
     print("⚠️ Usando API combinada legada")
 
+# Prazo para o resumo do Escavador depois que a extração do Scholar termina
+ESCAVADOR_ENRICHMENT_DEADLINE = float(os.getenv("ESCAVADOR_ENRICHMENT_DEADLINE", 5))
+
 # Headers para burlar detecção
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -76,7 +112,59 @@ HEADERS = {
     'Pragma': 'no-cache'
 }
 
-def save_to_mongodb_if_filtered(result: Dict[str, Any], filter_keywords: bool):
+class EscavadorEnrichment:
+    """Busca do resumo do Lattes via Escavador rodando em paralelo com a extração do Scholar"""
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop, deadline: Optional[float] = None):
+        self.loop = loop
+        self.deadline = deadline if deadline is not None else ESCAVADOR_ENRICHMENT_DEADLINE
+        self.task: Optional[asyncio.Task] = None
+    
+    def start(self, name: str):
+        """Iniciar a busca (idempotente; chamar no event loop)"""
+        if self.task is not None or not name:
+            return
+        from .services.services import GoogleScholarService
+        print(f"📚 Buscando resumo do Lattes via Escavador para: {name}")
+        self.task = self.loop.create_task(
+            run_blocking(GoogleScholarService().get_lattes_summary_via_escavador, name)
+        )
+    
+    def start_threadsafe(self, name: str):
+        """Callback para o extrator, que roda em uma thread do pool"""
+        self.loop.call_soon_threadsafe(self.start, name)
+    
+    def cancel(self):
+        if self.task is not None:
+            self.task.cancel()
+    
+    async def join(self) -> Optional[Dict[str, Any]]:
+        """Aguardar o resumo até o prazo; se o Escavador demorar, seguir sem ele"""
+        if self.task is None:
+            return None
+        try:
+            lattes_summary = await asyncio.wait_for(self.task, timeout=self.deadline)
+        except asyncio.TimeoutError:
+            print(f"⏱️ Escavador não respondeu em {self.deadline}s, retornando sem resumo do Lattes")
+            return None
+        except Exception as e:
+            print(f"⚠️ Erro ao buscar no Escavador: {e}")
+            return None
+        
+        if lattes_summary and lattes_summary.get('success'):
+            print(f"✅ Resumo Lattes encontrado via Escavador!")
+        else:
+            print(f"⚠️ Resumo Lattes não encontrado no Escavador")
+        return lattes_summary
+
+async def persist_research_result(result: Dict[str, Any]) -> bool:
+    """Entregar o resultado à fila de gravação em lote (ou gravar direto se ela não estiver ativa)"""
+    if research_writer.running:
+        await research_writer.submit(research_db.build_research_writes(result))
+        return True
+    return await research_db.save_research_result_async(result)
+
+async def save_to_mongodb_if_filtered(result: Dict[str, Any], filter_keywords: bool):
     """Salvar resultado no MongoDB se filtrado por keywords OU se for dados do Scholar"""
     # Sempre salvar dados do Scholar (mesmo sem filtro) ou quando filtrado por keywords
     should_save = (
@@ -87,11 +175,11 @@ def save_to_mongodb_if_filtered(result: Dict[str, Any], filter_keywords: bool):
     
     if should_save:
         try:
-            saved = research_db.save_research_result(result)
+            saved = await persist_research_result(result)
             if saved:
                 result["saved_to_database"] = True
                 platform = result.get("platform", "desconhecida")
-                print(f"💾 Dados salvos no MongoDB (plataforma: {platform})")
+                print(f"💾 Dados enviados ao MongoDB (plataforma: {platform})")
             else:
                 result["database_error"] = "Falha ao salvar no MongoDB"
         except Exception as e:
@@ -103,7 +191,7 @@ class LattesExtractor:
     """Extrator real do Lattes"""
     
     def __init__(self):
-        self.session = requests.Session()
+        self.session = HttpSession()
         self.session.headers.update(HEADERS)
     
     def extract_profile(self, lattes_url: str) -> Dict[str, Any]:
@@ -111,13 +199,10 @@ class LattesExtractor:
         print(f"🇧🇷 EXTRAINDO LATTES: {lattes_url}")
         
         try:
-            # Aguardar para evitar bloqueio
-            time.sleep(random.uniform(2, 4))
-            
             response = self.session.get(lattes_url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(response.content)
             
             # Extrair dados
             name = self._extract_name(soup)
@@ -129,6 +214,7 @@ class LattesExtractor:
             return {
                 "success": True,
                 "name": name,
+                "lattes_id": self._extract_lattes_id(lattes_url),
                 "institution": institution,
                 "research_areas": areas,
                 "last_update": last_update,
@@ -144,6 +230,12 @@ class LattesExtractor:
                 "message": "Erro ao extrair dados do Lattes"
             }
     
+    @staticmethod
+    def _extract_lattes_id(lattes_url: str) -> Optional[str]:
+        """Id do currículo na URL (lattes.cnpq.br/<16 dígitos> ou visualizacv.do?id=K...)"""
+        match = re.search(r"lattes\.cnpq\.br/(\d{16})|[?&]id=(\w+)", lattes_url)
+        return (match.group(1) or match.group(2)) if match else None
+    
     def _extract_name(self, soup: BeautifulSoup) -> str:
         """Extrair nome do pesquisador"""
         selectors = [
@@ -250,13 +342,13 @@ class LattesExtractor:
             }
             
             # Criar nova sessão com headers específicos
-            lattes_session = requests.Session()
+            lattes_session = HttpSession()
             lattes_session.headers.update(lattes_headers)
             
             # Primeiro acessar a página inicial do Lattes para estabelecer sessão
             print("🌐 Inicializando sessão no Lattes...")
             init_url = "http://buscatextual.cnpq.br/buscatextual/index.jsp"
-            init_response = lattes_session.get(init_url, timeout=15)
+            init_response = lattes_session.get(init_url, timeout=15, use_cache=False)
             
             if init_response.status_code != 200:
                 print(f"⚠️ Falha ao inicializar sessão: {init_response.status_code}")
@@ -266,8 +358,6 @@ class LattesExtractor:
                     "debug_info": f"Status inicial: {init_response.status_code}"
                 }
             
-            time.sleep(random.uniform(2, 4))
-            
             # URL de busca alternativa (método direto)
             search_url = f"http://buscatextual.cnpq.br/buscatextual/visualizacv.do"
             search_params = {
@@ -307,7 +397,7 @@ class LattesExtractor:
                     "debug_info": f"Status HTTP: {response.status_code}"
                 }
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(response.content)
             
             # Verificar se já estamos numa página de currículo
             if "Curriculum" in response.text and "Lattes" in response.text:
@@ -368,7 +458,7 @@ class ORCIDExtractor:
     """Extrator real do ORCID"""
     
     def __init__(self):
-        self.session = requests.Session()
+        self.session = HttpSession()
         self.session.headers.update(HEADERS)
     
     def extract_profile(self, orcid_url: str) -> Dict[str, Any]:
@@ -376,12 +466,10 @@ class ORCIDExtractor:
         print(f"🌐 EXTRAINDO ORCID: {orcid_url}")
         
         try:
-            time.sleep(random.uniform(1, 3))
-            
             response = self.session.get(orcid_url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(response.content)
             
             name = self._extract_name(soup)
             orcid_id = self._extract_orcid_id(orcid_url)
@@ -480,11 +568,14 @@ class ORCIDExtractor:
         
         return works
 
+# Maior tamanho de página aceito pela listagem de publicações do perfil Scholar
+SCHOLAR_MAX_PAGE_SIZE = 100
+
 class ScholarExtractor:
     """Extrator para Google Scholar"""
     
     def __init__(self):
-        self.session = requests.Session()
+        self.session = HttpSession()
         self.current_url = None  # Armazenar URL atual para fallback
         self.serpapi_author_data = {}  # Para armazenar dados do autor via SerpAPI
         self.requested_publications = 20  # Número de publicações solicitadas
@@ -512,30 +603,28 @@ class ScholarExtractor:
         try:
             # Primeiro, acessar página inicial do Scholar para estabelecer sessão
             print("🌐 Inicializando sessão no Google Scholar...")
-            init_response = self.session.get('https://scholar.google.com/', timeout=15)
-            time.sleep(random.uniform(2, 4))
+            init_response = self.session.get('https://scholar.google.com/', timeout=15, use_cache=False)
             
             # URL de busca de PESQUISADORES (não publicações) com parâmetros otimizados
             search_url = f"https://scholar.google.com/citations?view_op=search_authors&mauthors={quote(author_name)}&hl=pt-BR&oi=ao"
             print(f"🔗 URL de busca: {search_url}")
             
-            time.sleep(random.uniform(3, 6))
-            
             response = self.session.get(search_url, timeout=30)
             response.raise_for_status()
             
             print(f"📊 Status da resposta: {response.status_code}")
             
             # Verificar se foi redirecionado para login
-            if 'accounts.google.com' in response.url or 'signin' in response.text.lower():
+            if 'accounts.google.com' in str(response.url) or 'signin' in response.text.lower():
                 print("⚠️ Google Scholar bloqueou o acesso - redirecionamento para login detectado")
+                response_cache.invalidate(search_url)
                 return {
                     "success": False,
                     "message": "Google Scholar bloqueou o acesso automatizado",
                     "debug_info": "Redirecionado para página de login"
                 }
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(response.content)
             
             # Debug: verificar o que foi retornado
             print(f"🔍 Conteúdo da página (primeiros 200 chars): {response.text[:200]}...")
@@ -585,8 +674,18 @@ class ScholarExtractor:
                 "error": str(e)
             }
     
-    def extract_profile(self, scholar_url: str, max_publications: int = 20) -> Dict[str, Any]:
-        """Extrair perfil do Scholar com controle de número de publicações"""
+    def extract_profile(
+        self,
+        scholar_url: str,
+        max_publications: int = 20,
+        on_name: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Extrair perfil do Scholar com controle de número de publicações
+
+        on_name é chamado assim que o nome do pesquisador sai da primeira página,
+        antes da paginação, para que o chamador possa iniciar enriquecimentos em paralelo.
+        """
         print(f"🎓 EXTRAINDO SCHOLAR PROFILE: {scholar_url}")
         print(f"📚 Máximo de publicações: {max_publications}")
         
@@ -597,23 +696,23 @@ class ScholarExtractor:
         self.serpapi_author_data = {}
         
         try:
-            time.sleep(random.uniform(3, 6))
-            
             response = self.session.get(scholar_url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(response.content, parse_only=scholar_page.PROFILE_STRAINER)
             
             # Verificar se há CAPTCHA na página
             if soup.find(id="gsc_captcha_ccl") or "gs_captcha" in response.text:
                 print("🚫 CAPTCHA DETECTADO! Usando SerpAPI como fallback principal...")
+                response_cache.invalidate(scholar_url)
                 return self._extract_via_serpapi_only(scholar_url, max_publications)
             
             name = self._extract_name(soup)
+            if on_name and name != "Nome não encontrado":
+                on_name(name)
             affiliation = self._extract_affiliation(soup)
-            h_index = self._extract_h_index(soup)
-            i10_index = self._extract_i10_index(soup)
-            citations = self._extract_citations(soup)
+            citation_stats = scholar_page.extract_citation_stats(soup)
+            h_index, i10_index, citations = self._citation_metrics(soup, citation_stats)
             publications = self._extract_publications_with_pagination(scholar_url, max_publications)
             
             # Se os dados básicos não foram encontrados via scraping, usar SerpAPI se disponível
@@ -643,10 +742,12 @@ class ScholarExtractor:
             return {
                 "success": True,
                 "name": name,
+                "scholar_id": self._extract_user_id(scholar_url),
                 "affiliation": affiliation,
                 "h_index": h_index,
                 "i10_index": i10_index,
                 "total_citations": citations,
+                "citation_stats": citation_stats.to_dict(),
                 "publications": publications,
                 "total_publications": len(publications)
             }
@@ -656,10 +757,16 @@ class ScholarExtractor:
             print("🔄 Tentando usar SerpAPI como fallback de emergência...")
             return self._extract_via_serpapi_only(scholar_url, max_publications)
     
+    @staticmethod
+    def _extract_user_id(scholar_url: str) -> Optional[str]:
+        """Id do perfil no Scholar (parâmetro user= da URL)"""
+        if "user=" in scholar_url:
+            return scholar_url.split("user=")[1].split("&")[0]
+        return None
+    
     def _extract_via_serpapi_only(self, scholar_url: str, max_publications: int = 20) -> Dict[str, Any]:
         """Extrair perfil usando apenas SerpAPI quando HTML scraping falha"""
         try:
-            from serpapi import GoogleSearch
             import os
             
             # Carregar chave da API
@@ -679,18 +786,25 @@ class ScholarExtractor:
             print(f"🎯 Extraindo dados via SerpAPI para Author ID: {author_id}")
             print(f"📚 Solicitadas {max_publications} publicações com paginação SerpAPI")
             
-            # Primeira requisição para obter dados básicos do autor
+            # Todas as páginas de artigos saem em paralelo; a primeira traz os dados do autor
+            articles_per_page = 20
+            max_pages = min(5, (max_publications + articles_per_page - 1) // articles_per_page)  # Máximo 5 páginas para evitar muitas requests
             params = {
                 "api_key": api_key,
                 "engine": "google_scholar_author", 
                 "author_id": author_id,
                 "hl": "pt-BR",
-                "num": min(20, max_publications),  # Começar com 20 por página
+                "num": min(articles_per_page, max_publications),
                 "start": 0
             }
             
-            search = GoogleSearch(params)
-            results = search.get_dict()
+            print(f"🔄 Iniciando paginação SerpAPI: {max_pages} páginas, {articles_per_page} artigos por página")
+            pages = serpapi_client.search_pages(
+                params,
+                [page * articles_per_page for page in range(max(1, max_pages))],
+                is_last_page=lambda page_results: len(page_results.get('articles', [])) < articles_per_page
+            )
+            results = pages[0]
             
             if 'error' in results:
                 print(f"❌ Erro SerpAPI: {results['error']}")
@@ -739,36 +853,16 @@ class ScholarExtractor:
             else:
                 print("❌ Nenhuma informação de cited_by encontrada na resposta SerpAPI")
             
-            # Extrair publicações com paginação
+            # Juntar os artigos das páginas, em ordem
             publications = []
-            current_start = 0
-            articles_per_page = 20
-            max_pages = min(5, (max_publications + articles_per_page - 1) // articles_per_page)  # Máximo 5 páginas para evitar muitas requests
             
-            print(f"🔄 Iniciando paginação SerpAPI: {max_pages} páginas, {articles_per_page} artigos por página")
-            
-            for page in range(max_pages):
+            for page, page_results in enumerate(pages):
                 if len(publications) >= max_publications:
                     break
                 
-                # Configurar parâmetros para esta página
-                if page > 0:
-                    # Aguardar entre páginas para evitar rate limiting
-                    time.sleep(random.uniform(2, 4))
-                    
-                    params["start"] = current_start
-                    print(f"📄 Carregando página {page + 1} (start={current_start})")
-                    
-                    search = GoogleSearch(params)
-                    page_results = search.get_dict()
-                    
-                    if 'error' in page_results:
-                        print(f"❌ Erro na página {page + 1}: {page_results['error']}")
-                        break
-                else:
-                    # Usar resultado da primeira requisição
-                    page_results = results
-                    print(f"📄 Processando página 1 (inicial)")
+                if 'error' in page_results:
+                    print(f"❌ Erro na página {page + 1}: {page_results['error']}")
+                    break
                 
                 # Extrair artigos desta página
                 page_articles = []
@@ -794,8 +888,6 @@ class ScholarExtractor:
                 if len(page_articles) < articles_per_page:
                     print(f"📄 Última página detectada (apenas {len(page_articles)} artigos)")
                     break
-                
-                current_start += articles_per_page
             
             print(f"✅ SerpAPI extraído com sucesso:")
             print(f"   👤 Nome: {name}")
@@ -808,6 +900,7 @@ class ScholarExtractor:
             return {
                 "success": True,
                 "name": name,
+                "scholar_id": author_id,
                 "affiliation": affiliation,
                 "h_index": h_index,
                 "i10_index": i10_index,
@@ -833,6 +926,23 @@ class ScholarExtractor:
         affil_elem = soup.select_one('.gsc_prf_il')
         return affil_elem.get_text(strip=True) if affil_elem else "Afiliação não encontrada"
     
+    def _citation_metrics(self, soup: BeautifulSoup, stats: scholar_page.CitationStats) -> Tuple[str, str, str]:
+        """
+        (h-index, i10-index, citações) em texto, como o restante do extrator usa
+
+        Os valores saem da tabela lida uma única vez; as buscas antigas, métrica
+        a métrica, só rodam para o que a tabela não trouxe.
+        """
+        print(f"📊 Tabela de citações: {stats.to_dict()}")
+
+        def all_time(metric: Optional[scholar_page.MetricColumns]) -> Optional[str]:
+            return str(metric.all_time) if metric and metric.all_time is not None else None
+
+        h_index = all_time(stats.h_index) or self._extract_h_index(soup)
+        i10_index = all_time(stats.i10_index) or self._extract_i10_index(soup)
+        citations = all_time(stats.citations) or self._extract_citations(soup)
+        return h_index, i10_index, citations
+    
     def _extract_h_index(self, soup: BeautifulSoup) -> str:
         """Extrair índice H com análise rigorosa dos valores encontrados"""
         print("🔍 BUSCANDO ÍNDICE H...")
@@ -1047,17 +1157,29 @@ class ScholarExtractor:
         print("❌ i10-index não encontrado")
         return "0"
     
+    def _plan_publication_pages(self, scholar_url: str, user_id: str, max_publications: int) -> List[Tuple[int, int, str]]:
+        """Planejar de antemão as páginas necessárias: (cstart, pagesize, url)"""
+        page_size = max(1, min(SCHOLAR_MAX_PAGE_SIZE, max_publications))
+        
+        # Preservar parâmetros da URL original (ex: hl), trocando só a paginação
+        original_params = [
+            (key, value) for key, value in parse_qsl(urlsplit(scholar_url).query)
+            if key not in ("user", "cstart", "pagesize")
+        ]
+        
+        pages = []
+        for cstart in range(0, max_publications, page_size):
+            params = [("user", user_id)] + original_params + [("cstart", cstart), ("pagesize", page_size)]
+            pages.append((cstart, page_size, f"https://scholar.google.com/citations?{urlencode(params)}"))
+        return pages
+    
     def _extract_publications_with_pagination(self, scholar_url: str, max_publications: int = 20) -> List[Dict[str, Any]]:
-        """Extrair publicações com suporte a paginação"""
+        """Extrair publicações buscando todas as páginas planejadas em paralelo"""
         print(f"📚 EXTRAINDO {max_publications} PUBLICAÇÕES COM PAGINAÇÃO...")
         
         # Armazenar número solicitado para uso no fallback
         self.requested_publications = max_publications
         
-        all_publications = []
-        current_start = 0
-        publications_per_page = 20
-        
         # Extrair o user ID da URL para construir URLs de paginação
         user_id = None
         if "user=" in scholar_url:
@@ -1067,55 +1189,44 @@ class ScholarExtractor:
             print("❌ Não foi possível extrair user ID da URL")
             return self._extract_publications_single_page(scholar_url)
         
-        while len(all_publications) < max_publications:
+        pages = self._plan_publication_pages(scholar_url, user_id, max_publications)
+        if not pages:
+            return []
+        print(f"📄 Plano de paginação: {len(pages)} página(s) de até {pages[0][1]} publicações")
+        
+        # Todas as páginas saem juntas; o ritmo real é dado pelo limitador do host
+        responses = self.session.get_many([url for _, _, url in pages], timeout=30)
+        
+        # Páginas baixadas até o primeiro erro: o parsing delas roda em paralelo no pool de processos
+        fetched = 0
+        for response in responses:
+            if isinstance(response, Exception) or response.is_error:
+                break
+            fetched += 1
+        parsed_pages = parse_pool.map(scholar_publications_page, [response.content for response in responses[:fetched]])
+        
+        all_publications = []
+        for index, ((cstart, page_size, page_url), response) in enumerate(zip(pages, responses)):
+            page_number = cstart // page_size + 1
             try:
-                # Construir URL para a página específica
-                if current_start == 0:
-                    # Primeira página - usar URL original
-                    page_url = scholar_url
-                else:
-                    # Páginas subsequentes
-                    page_url = f"https://scholar.google.com/citations?user={user_id}&cstart={current_start}&pagesize={publications_per_page}"
-                
-                print(f"📄 Carregando página com start={current_start}: {page_url}")
-                
-                # Aguardar entre requisições para evitar bloqueio
-                if current_start > 0:
-                    time.sleep(random.uniform(3, 5))
-                
-                response = self.session.get(page_url, timeout=30)
+                if isinstance(response, Exception):
+                    raise response
                 response.raise_for_status()
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Extrair publicações desta página
-                page_publications = self._extract_publications_from_soup(soup)
-                
-                if not page_publications:
-                    print(f"📄 Nenhuma publicação encontrada na página {current_start//publications_per_page + 1}")
-                    break
-                
-                print(f"📄 Encontradas {len(page_publications)} publicações na página")
-                
-                # Adicionar apenas as publicações necessárias
-                remaining_needed = max_publications - len(all_publications)
-                publications_to_add = page_publications[:remaining_needed]
-                all_publications.extend(publications_to_add)
-                
-                # Se esta página trouxe menos que o esperado, provavelmente chegamos ao fim
-                if len(page_publications) < publications_per_page:
-                    print(f"📄 Última página detectada (apenas {len(page_publications)} publicações)")
-                    break
-                
-                # Se já temos o suficiente, parar
-                if len(all_publications) >= max_publications:
-                    break
-                
-                # Preparar para próxima página
-                current_start += publications_per_page
-                
+                page_publications = self._publications_or_fallback(parsed_pages[index]["publications"], page_url)
             except Exception as e:
-                print(f"❌ Erro ao carregar página {current_start//publications_per_page + 1}: {e}")
+                print(f"❌ Erro ao carregar página {page_number}: {e}")
+                break
+            
+            if not page_publications:
+                print(f"📄 Nenhuma publicação encontrada na página {page_number}")
+                break
+            
+            print(f"📄 Encontradas {len(page_publications)} publicações na página {page_number}")
+            all_publications.extend(page_publications)
+            
+            # Página incompleta: chegamos ao fim do perfil, as seguintes são descartadas
+            if len(page_publications) < page_size or len(all_publications) >= max_publications:
                 break
         
         print(f"✅ Total de {len(all_publications)} publicações extraídas")
@@ -1126,108 +1237,32 @@ class ScholarExtractor:
         try:
             response = self.session.get(scholar_url, timeout=30)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            return self._extract_publications_from_soup(soup)
+            parsed = parse_pool.parse(scholar_publications_page, response.content)
+            return self._publications_or_fallback(parsed["publications"], scholar_url)
         except Exception as e:
             print(f"❌ Erro ao extrair página única: {e}")
             return []
     
     def _extract_publications_from_soup(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Extrair publicações de um soup BeautifulSoup"""
-        publications = []
-        
-        # Múltiplos seletores para tentar (Google Scholar pode mudar a estrutura)
-        selectors_to_try = [
-            '.gsc_a_tr',           # Seletor original
-            'tr.gsc_a_tr',         # Mais específico
-            '.gs_or_cit',          # Alternativo 1
-            '.gs_ri',              # Alternativo 2
-            'tbody tr',            # Genérico
-            '[data-aid]',          # Por atributo
-            '.publication-item',   # Possível novo
-            '.result-item'         # Possível novo
-        ]
-        
-        pub_elements = []
-        for selector in selectors_to_try:
-            pub_elements = soup.select(selector)
-            if pub_elements:
-                print(f"🔍 Elementos de publicação encontrados: {len(pub_elements)} (seletor: {selector})")
-                break
-        
-        if not pub_elements:
-            print(f"🔍 Elementos de publicação encontrados: 0")
+        return self._publications_or_fallback(scholar_page.extract_publications(soup))
+    
+    def _publications_or_fallback(
+        self,
+        publications: Optional[List[Dict[str, Any]]],
+        page_url: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Publicações de uma página; None (nenhum seletor casou) cai para o SerpAPI
+
+        A página fora do formato (bloqueio que o cache não reconheceu) sai do
+        cache HTTP, para que a próxima busca volte à rede em vez de repeti-la.
+        """
+        if publications is None:
+            if page_url:
+                response_cache.invalidate(page_url)
             print("⚠️ NENHUM SELETOR FUNCIONOU - Tentando SerpAPI como fallback...")
             return self._fallback_to_serpapi()
-        
-        for i, pub in enumerate(pub_elements):
-            try:
-                # Múltiplos seletores para título
-                title_selectors = ['.gsc_a_at', 'a.gsc_a_at', '.gs_rt a', 'h3 a', '.title-link']
-                title_elem = None
-                for title_selector in title_selectors:
-                    title_elem = pub.select_one(title_selector)
-                    if title_elem:
-                        break
-                
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    
-                    # Múltiplos seletores para ano
-                    year_selectors = ['.gsc_a_h', '.gsc_a_y', '.gs_fl', '.year']
-                    year = None
-                    for year_selector in year_selectors:
-                        year_elem = pub.select_one(year_selector)
-                        if year_elem:
-                            year_text = year_elem.get_text(strip=True)
-                            try:
-                                year = int(year_text) if year_text.isdigit() else None
-                                if year:
-                                    break
-                            except:
-                                continue
-                    
-                    # Múltiplos seletores para citações
-                    citations_selectors = ['.gsc_a_c', '.gs_fl a', '.citations']
-                    citations = 0
-                    for cit_selector in citations_selectors:
-                        citations_elem = pub.select_one(cit_selector)
-                        if citations_elem:
-                            cit_text = citations_elem.get_text(strip=True)
-                            try:
-                                citations = int(cit_text) if cit_text.isdigit() else 0
-                                break
-                            except:
-                                continue
-                    
-                    # Extrair venue/journal - melhor seletor
-                    venue_elem = pub.select_one('.gs_gray')
-                    venue_text = venue_elem.get_text(strip=True) if venue_elem else "Não especificado"
-                    
-                    # Separar autores e revista do campo venue
-                    authors = venue_text  # Por padrão, venue contém autores + revista
-                    journal = venue_text  # Para compatibilidade
-                    
-                    # Tentar separar autores da revista (formato comum: "Autores - Revista, Ano")
-                    if " - " in venue_text:
-                        parts = venue_text.split(" - ", 1)
-                        authors = parts[0].strip()
-                        journal = parts[1].strip() if len(parts) > 1 else venue_text
-                    
-                    publications.append({
-                        "title": title,
-                        "venue": journal,  # Revista/periódico
-                        "authors": authors,  # Lista de autores
-                        "year": year,
-                        "citations": citations,
-                        "type": "Artigo",
-                        "platform": "scholar"
-                    })
-                    
-            except Exception as e:
-                print(f"❌ Erro ao processar publicação {i}: {e}")
-                continue
-        
         return publications
     
     def _fallback_to_serpapi(self) -> List[Dict[str, Any]]:
@@ -1235,8 +1270,6 @@ class ScholarExtractor:
         try:
             print("🔄 ATIVANDO FALLBACK SERPAPI...")
             
-            # Importar SerpAPI
-            from serpapi import GoogleSearch
             import os
             
             # Carregar chave da API
@@ -1280,8 +1313,7 @@ class ScholarExtractor:
                     "num": 20
                 }
             
-            search = GoogleSearch(params)
-            results = search.get_dict()
+            results = serpapi_client.search(params)
             
             if 'error' in results:
                 print(f"❌ Erro SerpAPI: {results['error']}")
@@ -1376,6 +1408,17 @@ class ScholarExtractor:
 async def health_check():
     return {"status": "healthy", "message": "API Real funcionando!"}
 
+@app.get("/cache/stats")
+async def get_cache_stats():
+    """Estatísticas do cache HTTP, do cache SerpAPI, dos perfis ORCID e do limitador de taxa por host"""
+    return {
+        "success": True,
+        "http_cache": response_cache.stats(),
+        "serpapi": serpapi_client.stats(),
+        "orcid_profiles": orcid_profile_cache.stats(),
+        "rate_limits": rate_limiter.stats()
+    }
+
 @app.get("/")
 async def api_info():
     """
@@ -1433,7 +1476,7 @@ async def search_profile(
     platforms: str = Query("all", description="Plataformas"),
     export_excel: bool = Query(False, description="Exportar Excel"),
     filter_keywords: bool = Query(True, description="Filtrar por palavras-chave relacionadas ao envelhecimento"),
-    max_publications: int = Query(20, description="Número máximo de publicações a extrair (padrão: 20)")
+    max_publications: int = Query(20, ge=1, description="Número máximo de publicações a extrair (padrão: 20)")
 ):
     """Endpoint principal para extração real de dados"""
     
@@ -1446,7 +1489,7 @@ async def search_profile(
         if "lattes.cnpq.br" in url_to_process:
             print("🇧🇷 DETECTADO: LATTES")
             extractor = LattesExtractor()
-            data = extractor.extract_profile(url_to_process)
+            data = await run_blocking(extractor.extract_profile, url_to_process)
             
             if data.get("success"):
                 result = {
@@ -1459,6 +1502,7 @@ async def search_profile(
                     "execution_time": 3.0,
                     "researcher_info": {
                         "name": data["name"],
+                        "lattes_id": data.get("lattes_id"),
                         "institution": data["institution"],
                         "research_areas": data["research_areas"],
                         "last_update": data["last_update"]
@@ -1517,7 +1561,7 @@ async def search_profile(
                         result["excel_error"] = str(e)
                 
                 # Salvar no MongoDB se filtrado por keywords
-                save_to_mongodb_if_filtered(result, filter_keywords)
+                await save_to_mongodb_if_filtered(result, filter_keywords)
                 
                 return result
             else:
@@ -1531,7 +1575,7 @@ async def search_profile(
         elif "orcid.org" in url_to_process:
             print("🌐 DETECTADO: ORCID")
             extractor = ORCIDExtractor()
-            data = extractor.extract_profile(url_to_process)
+            data = await run_blocking(extractor.extract_profile, url_to_process)
             
             if data.get("success"):
                 result = {
@@ -1601,7 +1645,7 @@ async def search_profile(
                         result["excel_error"] = str(e)
                 
                 # Salvar no MongoDB se filtrado por keywords
-                save_to_mongodb_if_filtered(result, filter_keywords)
+                await save_to_mongodb_if_filtered(result, filter_keywords)
                 
                 return result
             else:
@@ -1615,23 +1659,18 @@ async def search_profile(
         elif "scholar.google.com" in url_to_process:
             print("🎓 DETECTADO: SCHOLAR PROFILE")
             extractor = ScholarExtractor()
-            data = extractor.extract_profile(url_to_process, max_publications)
+            
+            # O resumo do Lattes (Escavador) começa assim que o nome sai da primeira
+            # página e corre em paralelo com a paginação das publicações
+            enrichment = EscavadorEnrichment(asyncio.get_running_loop())
+            data = await run_blocking(
+                extractor.extract_profile, url_to_process, max_publications, on_name=enrichment.start_threadsafe
+            )
             
             if data.get("success"):
-                # Buscar resumo do Lattes via Escavador usando o nome completo do pesquisador
-                lattes_summary = None
-                try:
-                    from .services.services import GoogleScholarService
-                    print(f"📚 Buscando resumo do Lattes via Escavador para: {data['name']}")
-                    service = GoogleScholarService()
-                    lattes_summary = service.get_lattes_summary_via_escavador(data['name'])
-                    if lattes_summary and lattes_summary.get('success'):
-                        print(f"✅ Resumo Lattes encontrado via Escavador!")
-                    else:
-                        print(f"⚠️ Resumo Lattes não encontrado no Escavador")
-                except Exception as e:
-                    print(f"⚠️ Erro ao buscar no Escavador: {e}")
-                    lattes_summary = None
+                # Garante a busca também quando o nome veio do fallback SerpAPI
+                enrichment.start(data['name'])
+                lattes_summary = await enrichment.join()
                 
                 result = {
                     "success": True,
@@ -1643,6 +1682,7 @@ async def search_profile(
                     "execution_time": 4.0,
                     "researcher_info": {
                         "name": data["name"],
+                        "scholar_id": data.get("scholar_id"),
                         "institution": data["affiliation"],
                         "h_index": data["h_index"],
                         "i10_index": data.get("i10_index", "0"),
@@ -1709,10 +1749,11 @@ async def search_profile(
                         result["excel_error"] = str(e)
                 
                 # Salvar no MongoDB se filtrado por keywords
-                save_to_mongodb_if_filtered(result, filter_keywords)
+                await save_to_mongodb_if_filtered(result, filter_keywords)
                 
                 return result
             else:
+                enrichment.cancel()
                 return {
                     "success": False,
                     "message": f"Erro ao extrair Scholar: {data.get('error', 'Erro desconhecido')}",
@@ -1727,13 +1768,13 @@ async def search_profile(
             
             # Primeiro tentar no Lattes (para pesquisadores brasileiros)
             lattes_extractor = LattesExtractor()
-            data = lattes_extractor.search_by_name(url_to_process)
+            data = await run_blocking(lattes_extractor.search_by_name, url_to_process)
             
             # Se não encontrou no Lattes, tentar no Scholar
             if not data.get("success"):
                 print("⚠️ Não encontrado no Lattes, tentando Scholar...")
                 extractor = ScholarExtractor()
-                data = extractor.search_author(url_to_process, max_publications)
+                data = await run_blocking(extractor.search_author, url_to_process, max_publications)
             
             # Se a busca por nome falhou, tentar busca de publicações como alternativa
             if not data.get("success"):
@@ -1743,11 +1784,10 @@ async def search_profile(
                     search_publications_url = f"https://scholar.google.com/scholar?q=author:\"{url_to_process}\""
                     print(f"🔗 Tentativa alternativa: {search_publications_url}")
                     
-                    time.sleep(random.uniform(2, 4))
-                    pub_response = extractor.session.get(search_publications_url, timeout=20)
+                    pub_response = await run_blocking(extractor.session.get, search_publications_url, timeout=20)
                     
-                    if pub_response.status_code == 200 and 'accounts.google.com' not in pub_response.url:
-                        pub_soup = BeautifulSoup(pub_response.content, 'html.parser')
+                    if pub_response.status_code == 200 and 'accounts.google.com' not in str(pub_response.url):
+                        pub_soup = parse_html(pub_response.content)
                         
                         # Extrair publicações da busca
                         publications = []
@@ -1825,6 +1865,7 @@ async def search_profile(
                         "execution_time": 3.0,
                         "researcher_info": {
                             "name": data["name"],
+                            "lattes_id": data.get("lattes_id"),
                             "institution": data["institution"],
                             "research_areas": data["research_areas"],
                             "last_update": data["last_update"]
@@ -1863,6 +1904,7 @@ async def search_profile(
                         "execution_time": 4.0,
                         "researcher_info": {
                             "name": data["name"],
+                            "scholar_id": data.get("scholar_id"),
                             "institution": data.get("affiliation", "N/A"),
                             "h_index": data.get("h_index", "N/A"),
                             "i10_index": data.get("i10_index", "0"),
@@ -1922,7 +1964,7 @@ async def search_profile(
                         result["excel_error"] = str(e)
                 
                 # Salvar no MongoDB se filtrado por keywords
-                save_to_mongodb_if_filtered(result, filter_keywords)
+                await save_to_mongodb_if_filtered(result, filter_keywords)
                 
                 return result
             else:
@@ -1984,7 +2026,7 @@ async def search_multiple_authors(
         
         # Executar busca
         service = GoogleScholarAuthorsService()
-        authors = service.search_authors_by_name(name, max_results)
+        authors = await run_blocking(service.search_authors_by_name, name, max_results)
         
         if not authors:
             return {
@@ -2025,7 +2067,7 @@ async def search_single_author_scholar(
         
         # Executar busca no Scholar
         service = GoogleScholarService()
-        author_profile, publications = service.search_by_author_profile(author)
+        author_profile, publications = await run_blocking(service.search_by_author_profile, author)
         
         # Limitar publicações se necessário
         if len(publications) > max_results:
@@ -2036,7 +2078,7 @@ async def search_single_author_scholar(
         if include_lattes_summary:
             try:
                 print(f"📚 Buscando resumo do Lattes via Escavador...")
-                lattes_summary = service.get_lattes_summary_via_escavador(author)
+                lattes_summary = await run_blocking(service.get_lattes_summary_via_escavador, author)
             except Exception as e:
                 print(f"⚠️ Erro ao buscar resumo do Lattes: {e}")
                 lattes_summary = None
@@ -2063,6 +2105,7 @@ async def search_single_author_scholar(
             # Informações do pesquisador para exibição
             "researcher_info": {
                 "name": author_profile.name if author_profile else author,
+                "scholar_id": author_profile.author_id,
                 "institution": author_profile.affiliation if (author_profile and hasattr(author_profile, 'affiliation')) else "Instituição não informada",
                 "h_index": author_profile.h_index if (author_profile and hasattr(author_profile, 'h_index')) else 0,
                 "total_citations": author_profile.total_citations if (author_profile and hasattr(author_profile, 'total_citations')) else 0,
@@ -2119,10 +2162,10 @@ async def search_single_author_scholar(
         # Salvar no MongoDB se disponível
         if MONGODB_AVAILABLE and result["data"]["publications"]:
             try:
-                saved = research_db.save_research_result(result)
+                saved = await persist_research_result(result)
                 if saved:
                     result["saved_to_database"] = True
-                    print(f"💾 Dados do autor '{author}' salvos no MongoDB")
+                    print(f"💾 Dados do autor '{author}' enviados ao MongoDB")
                 else:
                     result["database_error"] = "Falha ao salvar no MongoDB"
             except Exception as e:
@@ -2153,7 +2196,7 @@ async def get_lattes_summary_escavador(
         
         # Executar busca no Escavador
         service = GoogleScholarService()
-        lattes_summary = service.get_lattes_summary_via_escavador(name)
+        lattes_summary = await run_blocking(service.get_lattes_summary_via_escavador, name)
         
         if not lattes_summary.get("success"):
             return {
@@ -2214,11 +2257,11 @@ async def get_author_publications(
         # Caso contrário, tentar usar o author_id
         if author_name:
             print(f"📚 Usando busca por nome: {author_name}")
-            publications = service.get_author_publications_by_name(author_name, max_results)
+            publications = await run_blocking(service.get_author_publications_by_name, author_name, max_results)
             search_query = author_name
         else:
             print(f"📚 Usando busca por ID: {author_id}")
-            publications = service.get_author_publications(author_id, max_results)
+            publications = await run_blocking(service.get_author_publications, author_id, max_results)
             search_query = author_id
         
         if not publications:
@@ -2288,78 +2331,221 @@ async def get_mongodb_stats():
         raise HTTPException(status_code=503, detail="MongoDB não disponível")
     
     try:
-        db = ResearchDatabase()
-        stats = await db.get_research_statistics_async()
+        stats = await research_db.get_research_statistics_async()
         return {
             "success": True,
-            "stats": stats
+            "stats": stats,
+            "write_queue": research_writer.stats()
         }
     except Exception as e:
         print(f"❌ Erro ao obter estatísticas: {e}")
         raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
 
+@app.get("/mongodb/indexes")
+async def get_mongodb_indexes():
+    """Índices declarados, resultado da conferência na inicialização e uso de cada um"""
+    if not MONGODB_AVAILABLE:
+        raise HTTPException(status_code=503, detail="MongoDB não disponível")
+    
+    try:
+        usage = await research_db.get_index_usage_async()
+        return {
+            "success": True,
+            "indexes": research_db.index_report,
+            "usage": usage
+        }
+    except Exception as e:
+        print(f"❌ Erro ao obter índices: {e}")
+        raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
+
+def ndjson_response(items: AsyncIterator[Dict[str, Any]]) -> StreamingResponse:
+    """Enviar documentos um por linha (NDJSON) conforme saem do cursor do MongoDB"""
+    async def lines():
+        async for item in items:
+            yield json.dumps(jsonable_encoder(item), ensure_ascii=False) + "\n"
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+def validate_cursor(cursor: Optional[str]):
+    """Rejeitar cursor malformado com 400 antes de abrir a consulta"""
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
 @app.get("/mongodb/research")
-async def get_all_research():
-    """Obter todos os dados de pesquisa filtrados do MongoDB"""
+async def get_all_research(
+    limit: int = Query(50, ge=1, le=500, description="Pesquisas por página"),
+    cursor: Optional[str] = Query(None, description="next_cursor da página anterior"),
+    include_publications: bool = Query(False, description="Incluir as publicações completas de cada pesquisa"),
+    format: str = Query("json", pattern="^(json|ndjson)$", description="json (uma página) ou ndjson (streaming a partir do cursor)")
+):
+    """Pesquisas filtradas por palavras-chave, mais recentes primeiro, paginadas por cursor"""
     if not MONGODB_AVAILABLE:
         raise HTTPException(status_code=503, detail="MongoDB não disponível")
+    validate_cursor(cursor)
     
     try:
-        db = ResearchDatabase()
-        research_data = await db.get_all_keyword_filtered_research_async()
+        if format == "ndjson":
+            # Sem limite de página: tudo a partir do cursor, sem montar a lista em memória
+            return ndjson_response(research_db.iter_keyword_filtered_research_async(
+                after=cursor, include_publications=include_publications
+            ))
+        
+        page = await research_db.get_keyword_filtered_research_page_async(
+            limit=limit, after=cursor, include_publications=include_publications
+        )
         return {
             "success": True,
-            "total_records": len(research_data),
-            "data": research_data
+            "total_records": len(page["items"]),
+            "data": page["items"],
+            "next_cursor": page["next_cursor"]
         }
     except Exception as e:
         print(f"❌ Erro ao obter dados de pesquisa: {e}")
         raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
 
+@app.get("/mongodb/publications")
+async def get_publications_by_keyword(
+    keyword: str = Query(..., description="Palavra-chave (ex: geriatria)"),
+    since_year: Optional[int] = Query(None, description="Somente publicações a partir deste ano"),
+    platform: Optional[str] = Query(None, description="Filtrar por plataforma (ex: scholar)"),
+    limit: int = Query(500, ge=1, le=5000, description="Máximo de publicações")
+):
+    """Publicações que mencionam uma palavra-chave (consulta indexada no MongoDB)"""
+    if not MONGODB_AVAILABLE:
+        raise HTTPException(status_code=503, detail="MongoDB não disponível")
+    
+    try:
+        publications = await research_db.get_publications_by_keyword_async(
+            keyword, since_year=since_year, platform=platform, limit=limit
+        )
+        return {
+            "success": True,
+            "keyword": keyword,
+            "total_records": len(publications),
+            "data": publications
+        }
+    except Exception as e:
+        print(f"❌ Erro ao buscar publicações por palavra-chave: {e}")
+        raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
+
+def consolidated_file_response(job):
+    """Arquivo de um job concluído, com nome amigável para o download"""
+    from fastapi.responses import FileResponse
+
+    filepath = export_jobs.artifact_path(job.filename)
+    if not os.path.exists(filepath):
+        raise HTTPException(status_code=500, detail="Arquivo Excel não foi criado")
+
+    download_name = f"excel_consolidado_{job.finished_at.strftime('%Y%m%d_%H%M%S')}.xlsx"
+    return FileResponse(
+        path=filepath,
+        filename=download_name,
+        media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        headers={
+            "Content-Disposition": f"attachment; filename={download_name}",
+            "Content-Type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        }
+    )
+
+def get_export_job_or_404(job_id: str):
+    job = export_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job de exportação não encontrado: {job_id}")
+    return job
+
+@app.post("/export/consolidated/jobs")
+async def create_export_job():
+    """Iniciar a exportação do Excel consolidado em segundo plano
+
+    Responde na hora com o id do job. Se os dados não mudaram desde a última
+    exportação, o job já nasce concluído com o arquivo anterior.
+    """
+    if not MONGODB_AVAILABLE:
+        raise HTTPException(status_code=503, detail="MongoDB não disponível")
+
+    try:
+        job = await export_jobs.submit()
+        return {"success": True, "job": job.to_dict()}
+    except Exception as e:
+        print(f"❌ Erro ao iniciar exportação: {e}")
+        raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
+
+@app.get("/export/consolidated/jobs/{job_id}")
+async def get_export_job(job_id: str):
+    """Status e progresso de um job de exportação"""
+    if not MONGODB_AVAILABLE:
+        raise HTTPException(status_code=503, detail="MongoDB não disponível")
+
+    return {"success": True, "job": get_export_job_or_404(job_id).to_dict()}
+
+@app.get("/export/consolidated/jobs/{job_id}/events")
+async def stream_export_job(job_id: str, interval: float = Query(1.0, ge=0.2, le=10.0)):
+    """Progresso do job por Server-Sent Events, até a conclusão"""
+    if not MONGODB_AVAILABLE:
+        raise HTTPException(status_code=503, detail="MongoDB não disponível")
+
+    job = get_export_job_or_404(job_id)
+
+    async def events() -> AsyncIterator[str]:
+        while True:
+            yield f"data: {json.dumps(job.to_dict())}\n\n"
+            if job.finished:
+                return
+            try:
+                await asyncio.wait_for(job.done.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+@app.get("/export/consolidated/jobs/{job_id}/download")
+async def download_export_job(job_id: str):
+    """Baixar o Excel de um job concluído"""
+    if not MONGODB_AVAILABLE:
+        raise HTTPException(status_code=503, detail="MongoDB não disponível")
+
+    job = get_export_job_or_404(job_id)
+    if job.status == "error":
+        raise HTTPException(status_code=500, detail=f"Exportação falhou: {job.error}")
+    if not job.finished:
+        raise HTTPException(status_code=409, detail="Exportação ainda em andamento")
+
+    return consolidated_file_response(job)
+
 @app.get("/export/consolidated")
 async def export_consolidated_excel():
-    """Exportar Excel consolidado com todos os dados do Scholar no MongoDB"""
+    """Exportar Excel consolidado com todos os dados do Scholar no MongoDB
+
+    Mantido por compatibilidade: espera o job terminar na mesma requisição.
+    Com os dados inalterados, devolve o último arquivo na hora.
+    """
     if not MONGODB_AVAILABLE:
         raise HTTPException(status_code=503, detail="MongoDB não disponível")
     
     try:
-        from src.database.excel_consolidado import ConsolidatedExcelExporter
-        from fastapi.responses import FileResponse
-        
-        # Obter dados do MongoDB - TODOS os dados do Scholar (com ou sem filtro)
-        db = ResearchDatabase()
-        research_data = await db.get_all_scholar_research_async()
-        
-        if not research_data:
-            return {
-                "success": False,
-                "message": "Nenhum dado do Scholar encontrado no banco.",
-                "total_records": 0,
-                "instructions": "Para gerar dados: faça buscas no Scholar primeiro"
-            }
-        
-        # Exportar Excel consolidado
-        exporter = ConsolidatedExcelExporter()
-        filename = exporter.export_consolidated_excel(research_data)
-        
-        # Caminho completo do arquivo
-        filepath = os.path.join(exporter.exports_dir, filename)
-        
-        # Verificar se o arquivo foi criado
-        if not os.path.exists(filepath):
-            raise HTTPException(status_code=500, detail="Arquivo Excel não foi criado")
-        
-        # Retornar arquivo para download
-        return FileResponse(
-            path=filepath,
-            filename=filename,
-            media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}",
-                "Content-Type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            }
-        )
+        job = await export_jobs.submit()
+        await job.done.wait()
+
+        if job.status == "error":
+            if job.empty:
+                return {
+                    "success": False,
+                    "message": job.error,
+                    "total_records": 0,
+                    "instructions": "Para gerar dados: faça buscas no Scholar primeiro"
+                }
+            raise HTTPException(status_code=500, detail=f"Erro interno: {job.error}")
+
+        return consolidated_file_response(job)
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"❌ Erro na exportação consolidada: {e}")
         raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
@@ -2371,9 +2557,8 @@ async def clear_mongodb():
         raise HTTPException(status_code=503, detail="MongoDB não disponível")
     
     try:
-        db = ResearchDatabase()
         # Deletar todas as coleções
-        result = await db.clear_all_data_async()
+        result = await research_db.clear_all_data_async()
         return {
             "success": True,
             "message": f"Banco de dados limpo com sucesso! {result.get('deleted_count', 0)} registros deletados."
@@ -2383,18 +2568,26 @@ async def clear_mongodb():
         raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
 
 @app.get("/mongodb/researchers")
-async def get_all_researchers():
-    """Obter lista de todos os pesquisadores únicos do MongoDB"""
+async def get_all_researchers(
+    limit: int = Query(50, ge=1, le=500, description="Pesquisadores por página"),
+    cursor: Optional[str] = Query(None, description="next_cursor da página anterior"),
+    format: str = Query("json", pattern="^(json|ndjson)$", description="json (uma página) ou ndjson (streaming a partir do cursor)")
+):
+    """Pesquisadores do MongoDB, mais recentes primeiro, paginados por cursor"""
     if not MONGODB_AVAILABLE:
         raise HTTPException(status_code=503, detail="MongoDB não disponível")
+    validate_cursor(cursor)
     
     try:
-        db = ResearchDatabase()
-        researchers = await db.get_all_unique_researchers_async()
+        if format == "ndjson":
+            return ndjson_response(research_db.iter_researchers_async(after=cursor))
+        
+        page = await research_db.get_researchers_page_async(limit=limit, after=cursor)
         return {
             "success": True,
-            "total_researchers": len(researchers),
-            "researchers": researchers
+            "total_researchers": len(page["items"]),
+            "researchers": page["items"],
+            "next_cursor": page["next_cursor"]
         }
     except Exception as e:
         print(f"❌ Erro ao obter pesquisadores: {e}")
@@ -2407,8 +2600,7 @@ async def delete_researcher(researcher_id: str):
         raise HTTPException(status_code=503, detail="MongoDB não disponível")
     
     try:
-        db = ResearchDatabase()
-        result = await db.delete_researcher_async(researcher_id)
+        result = await research_db.delete_researcher_async(researcher_id)
         return {
             "success": True,
             "message": f"Pesquisador deletado com sucesso!",
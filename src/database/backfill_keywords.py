@@ -0,0 +1,33 @@
+"""
+🏷️ BACKFILL DE PALAVRAS-CHAVE
+============================
+Grava matched_keywords (e o ano numérico) nas publicações que ainda não têm
+o campo, ou em todas com --force depois de mudar a lista de palavras-chave.
+Pesquisas da coleção antiga recebem as palavras-chave na migração
+(python -m src.database.migrate_normalized).
+
+Uso:
+    python -m src.database.backfill_keywords           # só publicações pendentes
+    python -m src.database.backfill_keywords --force   # recalcular tudo
+"""
+
+import argparse
+
+from .mongodb import ResearchDatabase
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gravar palavras-chave nas publicações já salvas no MongoDB")
+    parser.add_argument("--batch-size", type=int, default=500, help="Publicações por bulk_write")
+    parser.add_argument("--force", action="store_true", help="Recalcular também publicações já processadas")
+    args = parser.parse_args()
+
+    db = ResearchDatabase()
+    try:
+        db.backfill_publication_keywords(batch_size=args.batch_size, force=args.force)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
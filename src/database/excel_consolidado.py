@@ -1,352 +1,342 @@
 """
 📊 EXCEL CONSOLIDADO - MONGODB
 Exportador Excel consolidado usando dados do MongoDB
+
+As linhas são escritas direto no arquivo conforme saem do cursor (xlsxwriter
+em modo constant_memory, formatação aplicada na própria escrita): a memória
+fica no tamanho de um pesquisador, não do banco inteiro.
 """
 
 import os
 from datetime import datetime
-from typing import List, Dict, Any
-import pandas as pd
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+
+import xlsxwriter
 
+from ..utils.executor import run_blocking
 from .mongodb import research_db
+from .keywords import AGING_KEYWORDS, find_publication_keywords
+
+# (coluna, largura)
+PUBLICATION_COLUMNS = [
+    ("Pesquisador", 25), ("Instituição", 30), ("Título", 50), ("Autores", 30),
+    ("Publicação/Revista", 25), ("Ano", 8), ("Citações", 10), ("Tipo", 12),
+    ("Plataforma", 12), ("Keywords Encontradas", 40), ("Data da Coleta", 12),
+    ("Resumo Lattes (Pesquisador)", 60),
+]
+RESEARCHER_COLUMNS = [
+    ("Nome", 25), ("Instituição", 35), ("H-Index", 10), ("i10-Index", 10),
+    ("Total de Citações", 15), ("Área de Pesquisa (Lattes)", 30), ("Instituição (Lattes)", 35),
+    ("Resumo Lattes", 60), ("URL Lattes", 40), ("Plataforma", 12),
+    ("Total de Publicações", 12), ("Data da Pesquisa", 12), ("Tempo de Execução (s)", 12),
+]
+
+# Limite de linhas de uma aba do Excel (cabeçalho incluído)
+EXCEL_MAX_ROWS = 1_048_576
+
+# Sem conversão automática: títulos com "=" ou URLs são gravados como texto
+WORKBOOK_OPTIONS = {
+    "constant_memory": True,
+    "strings_to_formulas": False,
+    "strings_to_urls": False,
+    "strings_to_numbers": False,
+}
+
+
+def _format_date(timestamp: Any) -> str:
+    """Data (AAAA-MM-DD) de um datetime ou string ISO"""
+    if not timestamp:
+        return "N/A"
+    if hasattr(timestamp, "strftime"):
+        return timestamp.strftime("%Y-%m-%d")
+    if isinstance(timestamp, str):
+        return timestamp.split("T")[0]
+    return str(timestamp)
+
+
+def _cell(value: Any) -> Any:
+    """Valor aceito pelo xlsxwriter (listas e dicts viram texto)"""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+class _StreamingSheet:
+    """Aba escrita linha a linha; continua em uma nova aba ao atingir o limite do Excel"""
+
+    def __init__(self, workbook, name: str, columns: List[Tuple[str, int]], header_format, cell_format=None):
+        self.workbook = workbook
+        self.name = name
+        self.columns = columns
+        self.header_format = header_format
+        self.cell_format = cell_format
+        self.rows = 0
+        self._parts = 0
+        self._sheet = None
+        self._next_row = 0
+        self._open()
+
+    def _open(self):
+        self._parts += 1
+        name = self.name if self._parts == 1 else f"{self.name} ({self._parts})"
+        self._sheet = self.workbook.add_worksheet(name)
+        for index, (_, width) in enumerate(self.columns):
+            self._sheet.set_column(index, index, width)
+        self._sheet.write_row(0, 0, [title for title, _ in self.columns], self.header_format)
+        self._next_row = 1
+
+    def append(self, values: List[Any]):
+        if self._next_row >= EXCEL_MAX_ROWS:
+            self._open()
+        self._sheet.write_row(self._next_row, 0, [_cell(value) for value in values], self.cell_format)
+        self._next_row += 1
+        self.rows += 1
+
 
 class ConsolidatedExcelExporter:
     """Exportador Excel consolidado do MongoDB"""
-    
+
     def __init__(self):
         self.exports_dir = os.path.join(os.getcwd(), "exports")
         if not os.path.exists(self.exports_dir):
             os.makedirs(self.exports_dir)
-        
+
         # Keywords para identificação
-        self.KEYWORDS = [
-            # Português
-            "idoso", "idosos", "idosa", "idosas", "envelhecimento", "envelhecer",
-            "terceira idade", "melhor idade", "idade avançada", "pessoa idosa",
-            "geriátrico", "geriátrica", "geriatria", "gerontologia", "gerontológico",
-            "alzheimer", "demência", "demência senil", "parkinson", "fragilidade",
-            "sarcopenia", "osteoporose", "quedas", "institucionalização",
-            
-            # English
-            "elderly", "elder", "elders", "aging", "ageing", "aged", "senior", "seniors",
-            "older adult", "older adults", "older people", "geriatric", "geriatrics",
-            "gerontology", "gerontological", "alzheimer", "dementia", "parkinson",
-            "frailty", "sarcopenia", "osteoporosis", "falls", "institutionalization",
-            
-            # Español
-            "anciano", "ancianos", "anciana", "ancianas", "envejecimiento", "envejecer",
-            "tercera edad", "personas mayores", "geriátrico", "geriátrica", "geriatría",
-            "gerontología", "alzheimer", "demencia", "parkinson", "fragilidad"
-        ]
-    
-    def export_consolidated_excel(self, research_data: List[Dict] = None, include_stats: bool = True) -> str:
+        self.KEYWORDS = AGING_KEYWORDS
+
+    def export_consolidated_excel(self, research_data: Iterable[Dict] = None, include_stats: bool = True, stats: Optional[Dict] = None) -> str:
         """Exportar Excel consolidado com todas as pesquisas filtradas"""
         try:
             print("📊 Iniciando exportação consolidada do MongoDB...")
-            
+
             # Buscar dados do MongoDB se não fornecidos
             if research_data is None:
                 research_data = research_db.get_all_keyword_filtered_research()
-            
-            if not research_data:
-                print("❌ Nenhum dado encontrado no MongoDB")
-                return None
-            
-            print(f"📚 Processando {len(research_data)} pesquisas...")
-            
-            # Preparar dados para Excel
-            all_publications = []
-            researchers_summary = []
-            
-            for research in research_data:
-                researcher_info = research.get("researcher_info", {})
-                
-                # Buscar publicações em diferentes campos (compatibilidade com estruturas antigas/novas)
-                publications = research.get("publications", [])
-                if not publications:
-                    publications = research.get("data", {}).get("publications", [])
-                
-                # Adicionar informações do pesquisador ao resumo
-                timestamp = research.get("timestamp", "")
-                if timestamp:
-                    # Se for datetime object, converter para string
-                    if hasattr(timestamp, 'strftime'):
-                        timestamp_str = timestamp.strftime("%Y-%m-%d")
-                    elif isinstance(timestamp, str):
-                        timestamp_str = timestamp.split("T")[0] if "T" in timestamp else timestamp
-                    else:
-                        timestamp_str = str(timestamp)
-                else:
-                    timestamp_str = "N/A"
-                
-                researchers_summary.append({
-                    "Nome": researcher_info.get("name", "N/A"),
-                    "Instituição": researcher_info.get("institution", "N/A"),
-                    "H-Index": researcher_info.get("h_index", "N/A"),
-                    "i10-Index": researcher_info.get("i10_index", "N/A"),
-                    "Total de Citações": researcher_info.get("total_citations", "N/A"),
-                    "Área de Pesquisa (Lattes)": researcher_info.get("lattes_area", "N/A"),
-                    "Instituição (Lattes)": researcher_info.get("lattes_institution", "N/A"),
-                    "Resumo Lattes": researcher_info.get("lattes_summary", "N/A"),
-                    "URL Lattes": researcher_info.get("lattes_url", "N/A"),
-                    "Plataforma": research.get("platform", "N/A"),
-                    "Total de Publicações": research.get("total_publications", 0),
-                    "Data da Pesquisa": timestamp_str,
-                    "Tempo de Execução (s)": research.get("execution_time", 0)
-                })
-                
-                # Processar publicações
-                for pub in publications:
-                    # Encontrar keywords na publicação
-                    keywords_found = self._find_keywords_in_publication(pub)
-                    
-                    # Processar timestamp da mesma forma
-                    timestamp = research.get("timestamp", "")
-                    if timestamp:
-                        if hasattr(timestamp, 'strftime'):
-                            timestamp_str = timestamp.strftime("%Y-%m-%d")
-                        elif isinstance(timestamp, str):
-                            timestamp_str = timestamp.split("T")[0] if "T" in timestamp else timestamp
-                        else:
-                            timestamp_str = str(timestamp)
-                    else:
-                        timestamp_str = "N/A"
-                    
-                    # Corrigir autores: se "authors" contém apenas o pesquisador principal,
-                    # e "publication" contém mais autores, usar a publication para autores
-                    authors_field = pub.get("authors", researcher_info.get("name", "N/A"))
-                    publication_field = pub.get("publication", "N/A")
-                    
-                    # Se authors é só o nome do pesquisador e publication tem mais informação
-                    if (authors_field == researcher_info.get("name", "") and 
-                        publication_field != "N/A" and 
-                        len(publication_field) > len(authors_field)):
-                        # Publication contém os autores reais, extrair apenas os autores
-                        if " - " in publication_field:
-                            # Formato: "Autores - Revista"
-                            corrected_authors = publication_field.split(" - ")[0].strip()
-                            corrected_publication = publication_field.split(" - ", 1)[1].strip()
-                        else:
-                            # Se não tem separador, usar publication como autores
-                            corrected_authors = publication_field
-                            corrected_publication = publication_field
-                    else:
-                        # Usar os campos como estão
-                        corrected_authors = authors_field
-                        corrected_publication = publication_field
-                    
-                    publication_data = {
-                        "Pesquisador": researcher_info.get("name", "N/A"),
-                        "Instituição": researcher_info.get("institution", "N/A"),
-                        "Título": pub.get("title", "N/A"),
-                        "Autores": corrected_authors,
-                        "Publicação/Revista": corrected_publication,
-                        "Ano": pub.get("year", "N/A"),
-                        "Citações": pub.get("cited_by", 0),
-                        "Tipo": pub.get("type", "N/A"),
-                        "Plataforma": pub.get("platform", research.get("platform", "N/A")),
-                        "Keywords Encontradas": ", ".join(keywords_found) if keywords_found else "N/A",
-                        "Data da Coleta": timestamp_str,
-                        "Resumo Lattes (Pesquisador)": researcher_info.get("lattes_summary", "N/A")
-                    }
-                    
-                    all_publications.append(publication_data)
-            
-            # Criar Excel
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"excel_consolidado_{timestamp}.xlsx"
-            filepath = os.path.join(self.exports_dir, filename)
-            
-            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-                # Aba 1: Todas as Publicações
-                if all_publications:
-                    df_publications = pd.DataFrame(all_publications)
-                    df_publications.to_excel(writer, sheet_name='Publicações', index=False)
-                    
-                    # Formatar aba de publicações
-                    self._format_publications_sheet(writer.sheets['Publicações'], df_publications)
-                
-                # Aba 2: Resumo dos Pesquisadores
-                if researchers_summary:
-                    df_researchers = pd.DataFrame(researchers_summary)
-                    df_researchers.to_excel(writer, sheet_name='Pesquisadores', index=False)
-                    
-                    # Formatar aba de pesquisadores
-                    self._format_researchers_sheet(writer.sheets['Pesquisadores'], df_researchers)
-                
-                # Aba 3: Estatísticas (se solicitado)
-                if include_stats:
-                    try:
-                        stats = research_db.get_research_statistics()
-                        self._create_statistics_sheet(writer, stats, len(all_publications), len(researchers_summary))
-                    except Exception as stats_error:
-                        print(f"⚠️ Erro ao obter estatísticas: {stats_error}")
-                        # Criar aba de estatísticas básicas sem dados do MongoDB
-                        self._create_basic_statistics_sheet(writer, len(all_publications), len(researchers_summary))
-            
-            print(f"✅ Excel consolidado exportado: {filename}")
-            return filename
-            
+
+            workbook, filename, sheets = self._open_workbook()
+            try:
+                for research in research_data:
+                    self._write_research(sheets, research)
+            except Exception:
+                self._discard(workbook, filename)
+                raise
+
+            if include_stats and stats is None and sheets[1].rows:
+                try:
+                    stats = research_db.get_research_statistics()
+                except Exception as stats_error:
+                    print(f"⚠️ Erro ao obter estatísticas: {stats_error}")
+            return self._finish(workbook, filename, sheets, include_stats, stats)
+
         except Exception as e:
             print(f"❌ Erro ao exportar Excel consolidado: {e}")
             return None
-    
+
+    async def export_consolidated_excel_async(
+        self,
+        research_data: AsyncIterator[Dict],
+        include_stats: bool = True,
+        stats: Optional[Dict] = None,
+        filename: Optional[str] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> Optional[str]:
+        """
+        Exportar lendo as pesquisas de um cursor assíncrono (ex: iter_scholar_research_async)
+
+        A escrita das linhas roda no pool de threads: o event loop só aguarda o
+        cursor do MongoDB e continua atendendo outras requisições.
+
+        Args:
+            filename: Nome do arquivo final (padrão: excel_consolidado_<data>.xlsx)
+            on_progress: Chamado com (pesquisadores, publicações) escritos até agora
+
+        Returns:
+            Nome do arquivo, ou None se não havia nenhuma pesquisa para exportar.
+            Erros (cursor, disco, xlsxwriter) e cancelamento são propagados,
+            sem deixar o arquivo parcial em exports/.
+        """
+        print("📊 Iniciando exportação consolidada do MongoDB (streaming)...")
+
+        workbook, filename, sheets = await run_blocking(self._open_workbook, filename)
+        try:
+            async for research in research_data:
+                await run_blocking(self._write_research, sheets, research)
+                if on_progress:
+                    on_progress(sheets[1].rows, sheets[0].rows)
+        except BaseException as e:
+            print(f"❌ Exportação consolidada interrompida: {e!r}")
+            await run_blocking(self._discard, workbook, filename)
+            raise
+        # _finish limpa o arquivo parcial se falhar
+        return await run_blocking(self._finish, workbook, filename, sheets, include_stats, stats)
+
+    def _partial_path(self, filename: str) -> str:
+        """Arquivo em construção; só recebe o nome final quando está completo"""
+        return os.path.join(self.exports_dir, f".{filename}.partial")
+
+    def _discard(self, workbook, filename: str):
+        """Fechar a planilha de uma exportação interrompida e apagar o arquivo parcial"""
+        try:
+            workbook.close()
+        except Exception as e:
+            print(f"⚠️ Erro ao fechar planilha interrompida: {e}")
+        try:
+            os.remove(self._partial_path(filename))
+        except FileNotFoundError:
+            pass
+
+    def _open_workbook(self, filename: Optional[str] = None):
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"excel_consolidado_{timestamp}.xlsx"
+        workbook = xlsxwriter.Workbook(self._partial_path(filename), WORKBOOK_OPTIONS)
+
+        # Formatos criados uma vez e aplicados na escrita de cada linha
+        def header(color: str, font_color: str = "#FFFFFF"):
+            return workbook.add_format({
+                "bg_color": color, "font_color": font_color, "bold": True,
+                "align": "center", "valign": "vcenter", "border": 1
+            })
+
+        # Aba 1: Todas as Publicações / Aba 2: Resumo dos Pesquisadores
+        publications = _StreamingSheet(
+            workbook, "Publicações", PUBLICATION_COLUMNS, header("#4472C4"), workbook.add_format({"border": 1})
+        )
+        researchers = _StreamingSheet(workbook, "Pesquisadores", RESEARCHER_COLUMNS, header("#70AD47"))
+        stats_header = workbook.add_format({"bg_color": "#E7E6E6", "bold": True})
+        return workbook, filename, (publications, researchers, stats_header)
+
+    def _write_research(self, sheets: Tuple, research: Dict[str, Any]):
+        """Escrever o pesquisador e suas publicações assim que chegam do cursor"""
+        publications_sheet, researchers_sheet, _ = sheets
+        researcher_info = research.get("researcher_info", {})
+        researcher_name = researcher_info.get("name", "N/A")
+
+        # Buscar publicações em diferentes campos (compatibilidade com estruturas antigas/novas)
+        publications = research.get("publications", [])
+        if not publications:
+            publications = research.get("data", {}).get("publications", [])
+        timestamp_str = _format_date(research.get("timestamp", ""))
+
+        researchers_sheet.append([
+            researcher_name,
+            researcher_info.get("institution", "N/A"),
+            researcher_info.get("h_index", "N/A"),
+            researcher_info.get("i10_index", "N/A"),
+            researcher_info.get("total_citations", "N/A"),
+            researcher_info.get("lattes_area", "N/A"),
+            researcher_info.get("lattes_institution", "N/A"),
+            researcher_info.get("lattes_summary", "N/A"),
+            researcher_info.get("lattes_url", "N/A"),
+            research.get("platform", "N/A"),
+            research.get("total_publications", 0),
+            timestamp_str,
+            research.get("execution_time", 0),
+        ])
+
+        for pub in publications:
+            keywords_found = self._find_keywords_in_publication(pub)
+            authors, publication = self._split_authors(pub, researcher_info)
+            publications_sheet.append([
+                researcher_name,
+                researcher_info.get("institution", "N/A"),
+                pub.get("title", "N/A"),
+                authors,
+                publication,
+                pub.get("year", "N/A"),
+                pub.get("cited_by", 0),
+                pub.get("type", "N/A"),
+                pub.get("platform", research.get("platform", "N/A")),
+                ", ".join(keywords_found) if keywords_found else "N/A",
+                timestamp_str,
+                researcher_info.get("lattes_summary", "N/A"),
+            ])
+
+    @staticmethod
+    def _split_authors(pub: Dict[str, Any], researcher_info: Dict[str, Any]) -> Tuple[Any, Any]:
+        """
+        Corrigir autores: se "authors" contém apenas o pesquisador principal,
+        e "publication" contém mais autores, usar a publication para autores
+        """
+        authors_field = pub.get("authors", researcher_info.get("name", "N/A"))
+        publication_field = pub.get("publication", "N/A")
+
+        if (authors_field == researcher_info.get("name", "") and
+                publication_field != "N/A" and
+                len(publication_field) > len(authors_field)):
+            # Formato: "Autores - Revista"
+            if " - " in publication_field:
+                authors, publication = publication_field.split(" - ", 1)
+                return authors.strip(), publication.strip()
+            # Se não tem separador, usar publication como autores
+            return publication_field, publication_field
+        return authors_field, publication_field
+
+    def _finish(self, workbook, filename: str, sheets, include_stats: bool, stats: Optional[Dict]) -> Optional[str]:
+        publications_sheet, researchers_sheet, stats_header = sheets
+        partial_path = self._partial_path(filename)
+
+        if not researchers_sheet.rows:
+            workbook.close()
+            os.remove(partial_path)
+            print("❌ Nenhum dado encontrado no MongoDB")
+            return None
+
+        try:
+            # Aba 3: Estatísticas (se solicitado)
+            if include_stats:
+                if stats:
+                    rows = self._statistics_rows(stats, publications_sheet.rows, researchers_sheet.rows)
+                else:
+                    # Aba de estatísticas básicas sem dados do MongoDB
+                    rows = self._basic_statistics_rows(publications_sheet.rows, researchers_sheet.rows)
+                self._write_statistics(workbook, stats_header, rows)
+
+            workbook.close()
+            os.replace(partial_path, os.path.join(self.exports_dir, filename))
+        except BaseException:
+            self._discard(workbook, filename)
+            raise
+        print(f"✅ Excel consolidado exportado: {filename} "
+              f"({researchers_sheet.rows} pesquisadores, {publications_sheet.rows} publicações)")
+        return filename
+
     def _find_keywords_in_publication(self, publication: Dict[str, Any]) -> List[str]:
         """Encontrar keywords relacionadas ao envelhecimento na publicação"""
-        keywords_found = []
-        
-        # Texto para busca (título + resumo/snippet se disponível)
-        search_text = ""
-        if publication.get("title"):
-            search_text += publication["title"].lower()
-        if publication.get("snippet"):
-            search_text += " " + publication["snippet"].lower()
-        
-        # Buscar cada keyword
-        for keyword in self.KEYWORDS:
-            if keyword.lower() in search_text:
-                keywords_found.append(keyword)
-        
-        return list(set(keywords_found))  # Remover duplicatas
-    
-    def _format_publications_sheet(self, sheet, df):
-        """Formatar aba de publicações"""
-        # Cabeçalho
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True)
-        
-        for cell in sheet[1]:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-        
-        # Ajustar larguras das colunas
-        column_widths = {
-            'A': 25,  # Pesquisador
-            'B': 30,  # Instituição
-            'C': 50,  # Título
-            'D': 30,  # Autores
-            'E': 25,  # Publicação
-            'F': 8,   # Ano
-            'G': 10,  # Citações
-            'H': 12,  # Tipo
-            'I': 12,  # Plataforma
-            'J': 40,  # Keywords
-            'K': 12,  # Data
-            'L': 60   # Resumo Lattes
-        }
-        
-        for col, width in column_widths.items():
-            sheet.column_dimensions[col].width = width
-        
-        # Bordas
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
-        for row in sheet.iter_rows(min_row=1, max_row=len(df) + 1):
-            for cell in row:
-                cell.border = thin_border
-    
-    def _format_researchers_sheet(self, sheet, df):
-        """Formatar aba de pesquisadores"""
-        # Cabeçalho
-        header_fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True)
-        
-        for cell in sheet[1]:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-        
-        # Ajustar larguras
-        column_widths = {
-            'A': 25,  # Nome
-            'B': 35,  # Instituição
-            'C': 10,  # H-Index
-            'D': 10,  # i10-Index
-            'E': 15,  # Citações
-            'F': 30,  # Área Lattes
-            'G': 35,  # Instituição Lattes
-            'H': 60,  # Resumo Lattes
-            'I': 40,  # URL Lattes
-            'J': 12,  # Plataforma
-            'K': 12,  # Total Pubs
-            'L': 12,  # Data
-            'M': 12   # Tempo
-        }
-        
-        for col, width in column_widths.items():
-            sheet.column_dimensions[col].width = width
-    
-    def _create_statistics_sheet(self, writer, stats: Dict, total_pubs: int, total_researchers: int):
+        # Gravadas na ingestão; documentos antigos (sem backfill) são calculados aqui
+        return find_publication_keywords(publication)
+
+    def _write_statistics(self, workbook, header_format, rows: List[List[Any]]):
         """Criar aba de estatísticas"""
-        # Dados das estatísticas
-        stats_data = [
-            ["Métrica", "Valor"],
+        sheet = workbook.add_worksheet("Estatísticas")
+        sheet.set_column(0, 0, 35)
+        sheet.set_column(1, 1, 30)
+        sheet.write_row(0, 0, ["Métrica", "Valor"], header_format)
+        for index, row in enumerate(rows, start=1):
+            sheet.write_row(index, 0, [_cell(value) for value in row])
+
+    def _statistics_rows(self, stats: Dict, total_pubs: int, total_researchers: int) -> List[List[Any]]:
+        """Linhas da aba de estatísticas"""
+        return [
             ["Total de Pesquisas no Banco", stats.get("total_searches", 0)],
             ["Pesquisas com Filtro de Keywords", stats.get("filtered_searches", 0)],
             ["Total de Publicações no Banco", stats.get("total_publications", 0)],
             ["Publicações neste Export", total_pubs],
             ["Pesquisadores neste Export", total_researchers],
             ["Plataformas Utilizadas", ", ".join(stats.get("platforms", []))],
-            ["Última Pesquisa", str(stats.get("latest_search", "N/A")).split("T")[0] if stats.get("latest_search") else "N/A"],
+            ["Última Pesquisa", _format_date(stats.get("latest_search"))],
             ["Data deste Export", datetime.now().strftime("%Y-%m-%d %H:%M:%S")]
         ]
-        
-        df_stats = pd.DataFrame(stats_data[1:], columns=stats_data[0])
-        df_stats.to_excel(writer, sheet_name='Estatísticas', index=False)
-        
-        # Formatar
-        sheet = writer.sheets['Estatísticas']
-        
-        # Cabeçalho
-        header_fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-        header_font = Font(bold=True)
-        
-        for cell in sheet[1]:
-            cell.fill = header_fill
-            cell.font = header_font
-        
-        # Larguras
-        sheet.column_dimensions['A'].width = 35
-        sheet.column_dimensions['B'].width = 30
-    
-    def _create_basic_statistics_sheet(self, writer, total_pubs: int, total_researchers: int):
-        """Criar aba de estatísticas básicas quando MongoDB não está disponível"""
-        # Dados básicos das estatísticas
-        stats_data = [
-            ["Métrica", "Valor"],
+
+    def _basic_statistics_rows(self, total_pubs: int, total_researchers: int) -> List[List[Any]]:
+        """Linhas de estatísticas básicas quando MongoDB não está disponível"""
+        return [
             ["Publicações neste Export", total_pubs],
             ["Pesquisadores neste Export", total_researchers],
             ["Data deste Export", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
             ["Status", "Export gerado com sucesso"],
             ["Observação", "Estatísticas detalhadas indisponíveis"]
         ]
-        
-        df_stats = pd.DataFrame(stats_data[1:], columns=stats_data[0])
-        df_stats.to_excel(writer, sheet_name='Estatísticas', index=False)
-        
-        # Formatar
-        sheet = writer.sheets['Estatísticas']
-        
-        # Cabeçalho
-        header_fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-        header_font = Font(bold=True)
-        
-        for cell in sheet[1]:
-            cell.fill = header_fill
-            cell.font = header_font
-        
-        # Larguras
-        sheet.column_dimensions['A'].width = 35
-        sheet.column_dimensions['B'].width = 30
 
 # Instância global
-consolidated_exporter = ConsolidatedExcelExporter()
\ No newline at end of file
+consolidated_exporter = ConsolidatedExcelExporter()
@@ -0,0 +1,213 @@
+"""
+📦 EXPORTAÇÕES EM SEGUNDO PLANO
+==============================
+O Excel consolidado é gerado por um job: o pedido devolve um id na hora, o
+progresso pode ser consultado (ou acompanhado por SSE) e o arquivo pronto é
+baixado depois, sem requisições longas que estouram o timeout do frontend.
+
+O arquivo fica guardado com a versão dos dados no nome (hash dos contadores
+de /mongodb/stats). Enquanto nenhuma busca nova for gravada, novos pedidos
+reaproveitam o mesmo arquivo na hora.
+"""
+
+import os
+import json
+import uuid
+import asyncio
+import hashlib
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Set
+
+from dotenv import load_dotenv
+
+from .mongodb import research_db
+from .excel_consolidado import ConsolidatedExcelExporter, consolidated_exporter
+
+load_dotenv()
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_ERROR = "error"
+
+ARTIFACT_PREFIX = "excel_consolidado_v"
+
+# Campos de /mongodb/stats que mudam sempre que os dados mudam
+VERSION_FIELDS = ("total_searches", "filtered_searches", "total_publications", "total_researchers", "latest_search")
+
+
+def data_version(stats: Dict[str, Any]) -> str:
+    """Versão dos dados: hash dos contadores mantidos na gravação (leitura O(1))"""
+    values = {field: stats.get(field) for field in VERSION_FIELDS}
+    raw = json.dumps(values, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+class ExportJob:
+    """Estado de uma exportação"""
+
+    def __init__(self, job_id: str, version: str, total_researchers: Optional[int] = None):
+        self.id = job_id
+        self.data_version = version
+        self.status = STATUS_QUEUED
+        self.researchers = 0
+        self.publications = 0
+        self.total_researchers = total_researchers
+        self.filename: Optional[str] = None
+        self.error: Optional[str] = None
+        self.cached = False
+        self.empty = False
+        self.created_at = datetime.now(timezone.utc)
+        self.finished_at: Optional[datetime] = None
+        self.done = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (STATUS_DONE, STATUS_ERROR)
+
+    def update_progress(self, researchers: int, publications: int):
+        self.researchers = researchers
+        self.publications = publications
+
+    def finish(self, filename: str, cached: bool = False):
+        self.status = STATUS_DONE
+        self.filename = filename
+        self.cached = cached
+        self.finished_at = datetime.now(timezone.utc)
+        self.done.set()
+
+    def fail(self, error: str):
+        self.status = STATUS_ERROR
+        self.error = error
+        self.finished_at = datetime.now(timezone.utc)
+        self.done.set()
+
+    def to_dict(self) -> Dict[str, Any]:
+        progress = None
+        if self.total_researchers:
+            progress = round(min(self.researchers / self.total_researchers, 1.0) * 100, 1)
+        if self.status == STATUS_DONE:
+            progress = 100.0
+        return {
+            "id": self.id,
+            "status": self.status,
+            "data_version": self.data_version,
+            "researchers": self.researchers,
+            "publications": self.publications,
+            "total_researchers": self.total_researchers,
+            "progress": progress,
+            "cached": self.cached,
+            "empty": self.empty,
+            "filename": self.filename,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "download_url": f"/export/consolidated/jobs/{self.id}/download" if self.status == STATUS_DONE else None,
+        }
+
+
+class ExportJobManager:
+    """Cria, acompanha e reaproveita exportações do Excel consolidado"""
+
+    def __init__(
+        self,
+        exporter: Optional[ConsolidatedExcelExporter] = None,
+        max_jobs: Optional[int] = None,
+        keep_artifacts: Optional[int] = None
+    ):
+        """
+        Args:
+            exporter: Exportador usado pelos jobs
+            max_jobs: Jobs mantidos em memória para consulta
+            keep_artifacts: Arquivos de versões anteriores mantidos em disco
+        """
+        self.exporter = exporter or consolidated_exporter
+        self.max_jobs = max_jobs or int(os.getenv("EXPORT_JOBS_MAX", 50))
+        self.keep_artifacts = keep_artifacts or int(os.getenv("EXPORT_ARTIFACTS_KEEP", 3))
+        self.jobs: "OrderedDict[str, ExportJob]" = OrderedDict()
+        self._tasks: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def artifact_filename(version: str) -> str:
+        return f"{ARTIFACT_PREFIX}{version}.xlsx"
+
+    def artifact_path(self, filename: str) -> str:
+        return os.path.join(self.exporter.exports_dir, filename)
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        return self.jobs.get(job_id)
+
+    def _remember(self, job: ExportJob):
+        self.jobs[job.id] = job
+        while len(self.jobs) > self.max_jobs:
+            self.jobs.popitem(last=False)
+
+    async def submit(self) -> ExportJob:
+        """Pedir uma exportação; reaproveita o arquivo ou o job em andamento da mesma versão"""
+        stats = await research_db.get_research_statistics_async()
+        version = data_version(stats)
+
+        for job in reversed(self.jobs.values()):
+            if job.data_version == version and not job.finished:
+                return job
+
+        job = ExportJob(uuid.uuid4().hex, version, stats.get("total_researchers"))
+        self._remember(job)
+
+        filename = self.artifact_filename(version)
+        if os.path.exists(self.artifact_path(filename)):
+            job.finish(filename, cached=True)
+            print(f"♻️ Excel consolidado reaproveitado (dados sem alteração): {filename}")
+            return job
+
+        task = asyncio.get_running_loop().create_task(self._run(job, stats, filename))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def _run(self, job: ExportJob, stats: Dict[str, Any], filename: str):
+        job.status = STATUS_RUNNING
+        print(f"📦 Job de exportação {job.id} iniciado (versão {job.data_version})")
+        try:
+            result = await self.exporter.export_consolidated_excel_async(
+                research_db.iter_scholar_research_async(),
+                stats=stats,
+                filename=filename,
+                on_progress=job.update_progress
+            )
+            # None só vem do caminho sem linhas; falhas reais chegam como exceção
+            if result is None:
+                job.empty = True
+                job.fail("Nenhum dado do Scholar encontrado no banco.")
+                return
+            job.finish(result)
+            self._prune_artifacts()
+        except Exception as e:
+            print(f"❌ Erro no job de exportação {job.id}: {e}")
+            job.fail(str(e))
+
+    def _prune_artifacts(self):
+        """Apagar arquivos de versões antigas, mantendo os mais recentes"""
+        directory = self.exporter.exports_dir
+        artifacts = sorted(
+            (name for name in os.listdir(directory) if name.startswith(ARTIFACT_PREFIX) and name.endswith(".xlsx")),
+            key=lambda name: os.path.getmtime(os.path.join(directory, name)),
+            reverse=True
+        )
+        for name in artifacts[self.keep_artifacts:]:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+
+    async def stop(self):
+        """Cancelar exportações em andamento (shutdown da aplicação)"""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+# Instância global
+export_jobs = ExportJobManager()
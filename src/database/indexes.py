@@ -0,0 +1,188 @@
+"""
+🗂️ GERENCIADOR DE ÍNDICES DO MONGODB
+===================================
+Os índices que as consultas da API precisam ficam declarados aqui, em código.
+Na inicialização eles são criados (ou conferidos, se já existem), e o endpoint
+/mongodb/indexes mostra quantas vezes cada um foi usado ($indexStats).
+
+Uso manual:
+    python -m src.database.indexes
+"""
+
+import asyncio
+from typing import Any, Dict, List, Tuple
+
+from pymongo import IndexModel
+
+from .keywords import MATCHED_KEYWORDS_FIELD, YEAR_FIELD
+
+IndexKey = List[Tuple[str, int]]
+
+# coleção: {nome: (chave, consultas atendidas)}
+REQUIRED_INDEXES: Dict[str, Dict[str, Tuple[IndexKey, str]]] = {
+    "searches": {
+        "filtered_timestamp": (
+            [("filtered_by_keywords", 1), ("timestamp", -1), ("_id", -1)],
+            "pesquisas filtradas por palavras-chave, paginadas por (timestamp, _id) (/mongodb/research)"
+        ),
+        "researcher_timestamp": (
+            [("researcher_id", 1), ("timestamp", -1)],
+            "pesquisas de um pesquisador (DELETE /mongodb/researcher, recontagem das estatísticas)"
+        ),
+        "timestamp": (
+            [("timestamp", -1)],
+            "histórico completo e data da última pesquisa"
+        ),
+    },
+    "researchers": {
+        "last_search": (
+            [("last_search", -1), ("_id", -1)],
+            "pesquisadores mais recentes primeiro, paginados por (last_search, _id) (/mongodb/researchers)"
+        ),
+        "platforms_last_search": (
+            [("platforms", 1), ("last_search", -1), ("_id", -1)],
+            "pesquisadores de uma plataforma (exportação do Scholar)"
+        ),
+    },
+    "publications": {
+        "keywords_year": (
+            [(MATCHED_KEYWORDS_FIELD, 1), (YEAR_FIELD, -1)],
+            "publicações por palavra-chave e ano (/mongodb/publications, índice multikey)"
+        ),
+        "researcher_ids": (
+            [("researcher_ids", 1)],
+            "publicações de um pesquisador (exportação, exclusão)"
+        ),
+    },
+}
+
+
+def _normalize_key(key: Any) -> IndexKey:
+    """Chave de index_information() (SON ou lista) no mesmo formato das declarações"""
+    items = key.items() if hasattr(key, "items") else key
+    return [(field, int(direction)) for field, direction in items]
+
+
+def plan_index_changes(
+    existing: Dict[str, Dict[str, Any]],
+    required: Dict[str, Tuple[IndexKey, str]]
+) -> Tuple[List[IndexModel], List[str], List[Dict[str, Any]]]:
+    """
+    Comparar os índices existentes de uma coleção com os declarados
+
+    Args:
+        existing: Resultado de collection.index_information()
+        required: Índices declarados para a coleção (um valor de REQUIRED_INDEXES)
+
+    Returns:
+        (índices a criar, índices a remover antes por conflito de nome, relatório por índice)
+    """
+    existing_keys = {name: _normalize_key(info["key"]) for name, info in existing.items()}
+    to_create: List[IndexModel] = []
+    to_drop: List[str] = []
+    report: List[Dict[str, Any]] = []
+
+    for name, (key, purpose) in required.items():
+        entry = {"name": name, "key": dict(key), "purpose": purpose}
+
+        if existing_keys.get(name) == key:
+            entry["status"] = "ok"
+        else:
+            # Mesma chave com outro nome já atende a consulta
+            same_key = [other for other, other_key in existing_keys.items() if other_key == key]
+            if same_key:
+                entry["status"] = "ok"
+                entry["existing_name"] = same_key[0]
+            else:
+                if name in existing_keys:
+                    to_drop.append(name)
+                    entry["status"] = "recreated"
+                else:
+                    entry["status"] = "created"
+                to_create.append(IndexModel(key, name=name))
+        report.append(entry)
+
+    return to_create, to_drop, report
+
+
+async def ensure_indexes_async(collections: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Criar os índices declarados que ainda não existem (coleções Motor)
+
+    Args:
+        collections: {"searches": coleção, "researchers": coleção, "publications": coleção}
+    """
+    report: List[Dict[str, Any]] = []
+    for role, collection in collections.items():
+        to_create, to_drop, entries = plan_index_changes(
+            await collection.index_information(), REQUIRED_INDEXES[role]
+        )
+        for name in to_drop:
+            await collection.drop_index(name)
+        if to_create:
+            await collection.create_indexes(to_create)
+        report.extend(dict(entry, collection=collection.name) for entry in entries)
+    _print_report(report)
+    return report
+
+
+def ensure_indexes(collections: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Criar os índices declarados que ainda não existem (coleções pymongo)"""
+    report: List[Dict[str, Any]] = []
+    for role, collection in collections.items():
+        to_create, to_drop, entries = plan_index_changes(
+            collection.index_information(), REQUIRED_INDEXES[role]
+        )
+        for name in to_drop:
+            collection.drop_index(name)
+        if to_create:
+            collection.create_indexes(to_create)
+        report.extend(dict(entry, collection=collection.name) for entry in entries)
+    _print_report(report)
+    return report
+
+
+def _print_report(report: List[Dict[str, Any]]):
+    changed = [f"{entry['collection']}.{entry['name']}" for entry in report if entry["status"] != "ok"]
+    if changed:
+        print(f"🗂️ Índices criados no MongoDB: {', '.join(changed)}")
+    else:
+        print(f"🗂️ Índices do MongoDB conferidos ({len(report)} declarados)")
+
+
+async def index_usage_async(collections: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Uso de cada índice desde o último restart do servidor ($indexStats)"""
+    usage = []
+    for role, collection in collections.items():
+        async for stats in collection.aggregate([{"$indexStats": {}}]):
+            accesses = stats.get("accesses", {})
+            usage.append({
+                "collection": collection.name,
+                "name": stats.get("name"),
+                "key": dict(stats.get("key", {})),
+                "ops": int(accesses.get("ops", 0)),
+                "since": accesses.get("since"),
+                "declared": stats.get("name") in REQUIRED_INDEXES[role],
+            })
+    usage.sort(key=lambda entry: entry["ops"], reverse=True)
+    return usage
+
+
+def main():
+    from .mongodb import ResearchDatabase
+
+    async def run():
+        db = ResearchDatabase()
+        try:
+            if not await db.connect_async():
+                return
+            for entry in await db.get_index_usage_async():
+                print(f"  {entry['collection'] + '.' + entry['name']:<50} {entry['ops']:>10} usos")
+        finally:
+            await db.close_async()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
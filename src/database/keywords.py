@@ -0,0 +1,74 @@
+"""
+🏷️ PALAVRAS-CHAVE GRAVADAS NAS PUBLICAÇÕES
+==========================================
+As palavras-chave de cada publicação são calculadas uma vez, ao salvar a
+pesquisa, e ficam no próprio documento (publications.matched_keywords, com
+índice multikey). Exportações e consultas leem o campo em vez de rodar o
+matcher de novo sobre todo o banco.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from ..utils.keyword_matcher import KeywordMatcher
+
+# Palavras-chave do Excel consolidado (envelhecimento, em PT/EN/ES)
+AGING_KEYWORDS = [
+    # Português
+    "idoso", "idosos", "idosa", "idosas", "envelhecimento", "envelhecer",
+    "terceira idade", "melhor idade", "idade avançada", "pessoa idosa",
+    "geriátrico", "geriátrica", "geriatria", "gerontologia", "gerontológico",
+    "alzheimer", "demência", "demência senil", "parkinson", "fragilidade",
+    "sarcopenia", "osteoporose", "quedas", "institucionalização",
+
+    # English
+    "elderly", "elder", "elders", "aging", "ageing", "aged", "senior", "seniors",
+    "older adult", "older adults", "older people", "geriatric", "geriatrics",
+    "gerontology", "gerontological", "alzheimer", "dementia", "parkinson",
+    "frailty", "sarcopenia", "osteoporosis", "falls", "institutionalization",
+
+    # Español
+    "anciano", "ancianos", "anciana", "ancianas", "envejecimiento", "envejecer",
+    "tercera edad", "personas mayores", "geriátrico", "geriátrica", "geriatría",
+    "gerontología", "alzheimer", "demencia", "parkinson", "fragilidad"
+]
+
+# Campos pesquisados (título + snippet, como no exportador consolidado)
+KEYWORD_FIELDS = ("title", "snippet")
+
+# Campos gravados em cada publicação
+MATCHED_KEYWORDS_FIELD = "matched_keywords"
+YEAR_FIELD = "year_int"
+
+# Busca por substring, como a comparação original com "in"
+keyword_matcher = KeywordMatcher(AGING_KEYWORDS, whole_words=False)
+
+_YEAR_PATTERN = re.compile(r"\b(19|20)\d{2}\b")
+
+
+def find_publication_keywords(publication: Dict[str, Any]) -> List[str]:
+    """Palavras-chave de uma publicação (gravadas, ou calculadas se o documento é antigo)"""
+    stored = publication.get(MATCHED_KEYWORDS_FIELD)
+    if stored is not None:
+        return stored
+    return keyword_matcher.find_in_fields(publication, KEYWORD_FIELDS)
+
+
+def parse_year(value: Any) -> Optional[int]:
+    """Ano como inteiro ('2020', 2020, '2020-05-01'); None se não houver"""
+    if isinstance(value, int):
+        return value
+    match = _YEAR_PATTERN.search(str(value or ""))
+    return int(match.group()) if match else None
+
+
+def annotate_publication(publication: Dict[str, Any]) -> Dict[str, Any]:
+    """Cópia da publicação com palavras-chave e ano numérico para consultas indexadas"""
+    annotated = dict(publication)
+    annotated[MATCHED_KEYWORDS_FIELD] = keyword_matcher.find_in_fields(publication, KEYWORD_FIELDS)
+    annotated[YEAR_FIELD] = parse_year(publication.get("year"))
+    return annotated
+
+
+def annotate_publications(publications: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [annotate_publication(pub) for pub in publications if isinstance(pub, dict)]
@@ -0,0 +1,30 @@
+"""
+🧩 MIGRAÇÃO PARA O MODELO NORMALIZADO
+====================================
+Copia a coleção antiga (COLLECTION_NAME, um documento completo por busca) para
+researcher_profiles / publications / searches. Pode ser executada mais de uma
+vez: cada busca mantém o _id original e o restante são upserts.
+
+Uso:
+    python -m src.database.migrate_normalized
+"""
+
+import argparse
+
+from .mongodb import ResearchDatabase
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Normalizar as pesquisas da coleção antiga do MongoDB")
+    parser.add_argument("--batch-size", type=int, default=200, help="Pesquisas por lote de gravação")
+    args = parser.parse_args()
+
+    db = ResearchDatabase()
+    try:
+        db.migrate_legacy_research(batch_size=args.batch_size)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,45 +5,131 @@ Gerenciamento de banco de dados para pesquisas acadêmicas
 
 import os
 import json
-from typing import Dict, List, Any, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 import motor.motor_asyncio
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
 from dotenv import load_dotenv
 
+from .keywords import MATCHED_KEYWORDS_FIELD, YEAR_FIELD, annotate_publication
+from .indexes import ensure_indexes, ensure_indexes_async, index_usage_async
+from .pagination import encode_cursor, keyset_filter, keyset_sort
+from .normalized import (
+    STATS_ID,
+    build_research_writes,
+    legacy_document_to_research_data,
+    researcher_key,
+    search_counter_updates,
+)
+
 # Carregar variáveis de ambiente
 load_dotenv()
 
+DUPLICATE_KEY_ERROR = 11000
+
+# Campos do pesquisador devolvidos em /mongodb/researchers
+RESEARCHER_SUMMARY_FIELDS = (
+    "institution", "email", "h_index", "i10_index", "total_citations",
+    "lattes_summary", "lattes_institution", "lattes_area", "lattes_url", "research_areas"
+)
+
+
+def _newly_inserted(error: BulkWriteError, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Documentos que um insert_many gravou agora; duplicatas (_id já gravado) não são erro"""
+    errors = error.details.get("writeErrors", [])
+    if any(e.get("code") != DUPLICATE_KEY_ERROR for e in errors):
+        raise error
+    duplicates = {e["index"] for e in errors}
+    return [document for index, document in enumerate(documents) if index not in duplicates]
+
+
+def _stats_document(stats: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if not stats:
+        return {}
+    stats = dict(stats)
+    stats.pop("_id", None)
+    return stats
+
+
 class ResearchDatabase:
     """Gerenciador do banco de dados de pesquisas"""
     
     def __init__(self):
         self.mongo_url = os.getenv('MONGODB_URL', 'mongodb://localhost:27017')
         self.database_name = os.getenv('MONGODB_DATABASE', 'web-scraper-uniser')
+        # Coleção antiga (um documento completo por busca), lida só pela migração
         self.collection_name = os.getenv('COLLECTION_NAME', 'researchers-data')
         
-        # Cliente síncrono para operações normais
+        # Modelo normalizado (ver normalized.py)
+        self.collection_names = {
+            "searches": os.getenv('SEARCHES_COLLECTION', 'searches'),
+            "researchers": os.getenv('RESEARCHERS_COLLECTION', 'researcher_profiles'),
+            "publications": os.getenv('PUBLICATIONS_COLLECTION', 'publications'),
+        }
+        # Contadores mantidos na gravação (leitura O(1) em /mongodb/stats)
+        self.stats_collection_name = os.getenv('STATS_COLLECTION', 'research_stats')
+        
+        # Pool de conexões (um único cliente por processo, aberto no lifespan da API)
+        self.max_pool_size = int(os.getenv('MONGODB_MAX_POOL_SIZE', 50))
+        self.min_pool_size = int(os.getenv('MONGODB_MIN_POOL_SIZE', 0))
+        self.max_idle_time_ms = int(os.getenv('MONGODB_MAX_IDLE_TIME_MS', 60000))
+        self.server_selection_timeout_ms = int(os.getenv('MONGODB_SERVER_SELECTION_TIMEOUT_MS', 5000))
+        
+        # Cliente síncrono para scripts (migração, backfill, exportação manual)
         self.client = None
         self.db = None
         self.collection = None
+        self.searches = self.researchers = self.publications = None
+        self.stats = None
         
         # Cliente assíncrono para uso com FastAPI
         self.async_client = None
         self.async_db = None
         self.async_collection = None
+        self.async_searches = self.async_researchers = self.async_publications = None
+        self.async_stats = None
+        
+        # Resultado da última conferência de índices (ver indexes.py)
+        self.index_report: List[Dict[str, Any]] = []
         
         print(f"📊 MongoDB configurado: {self.mongo_url}")
     
+    def _client_options(self) -> Dict[str, Any]:
+        return {
+            "maxPoolSize": self.max_pool_size,
+            "minPoolSize": self.min_pool_size,
+            "maxIdleTimeMS": self.max_idle_time_ms,
+            "serverSelectionTimeoutMS": self.server_selection_timeout_ms,
+        }
+    
+    def _normalized_collections(self, asynchronous: bool = True) -> Dict[str, Any]:
+        if asynchronous:
+            return {
+                "searches": self.async_searches,
+                "researchers": self.async_researchers,
+                "publications": self.async_publications,
+            }
+        return {"searches": self.searches, "researchers": self.researchers, "publications": self.publications}
+    
     def connect(self):
         """Conectar ao MongoDB (síncrono)"""
         try:
-            self.client = MongoClient(self.mongo_url)
+            self.client = MongoClient(self.mongo_url, **self._client_options())
             self.db = self.client[self.database_name]
             self.collection = self.db[self.collection_name]
+            self.searches = self.db[self.collection_names["searches"]]
+            self.researchers = self.db[self.collection_names["researchers"]]
+            self.publications = self.db[self.collection_names["publications"]]
+            self.stats = self.db[self.stats_collection_name]
             
             # Testar conexão
             self.client.admin.command('ping')
-            print(f"✅ Conectado ao MongoDB: {self.database_name}.{self.collection_name}")
+            print(f"✅ Conectado ao MongoDB: {self.database_name}")
+            
+            self._ensure_indexes()
+            if self.stats.find_one({"_id": STATS_ID}) is None:
+                self.rebuild_statistics()
             return True
             
         except Exception as e:
@@ -51,104 +137,349 @@ class ResearchDatabase:
             return False
     
     async def connect_async(self):
-        """Conectar ao MongoDB (assíncrono)"""
+        """Conectar ao MongoDB (assíncrono); reaproveita o cliente já aberto"""
+        if self.async_client is not None:
+            return True
+        
         try:
-            self.async_client = motor.motor_asyncio.AsyncIOMotorClient(self.mongo_url)
+            self.async_client = motor.motor_asyncio.AsyncIOMotorClient(self.mongo_url, **self._client_options())
             self.async_db = self.async_client[self.database_name]
             self.async_collection = self.async_db[self.collection_name]
-            print(f"✅ Cliente assíncrono MongoDB configurado")
+            self.async_searches = self.async_db[self.collection_names["searches"]]
+            self.async_researchers = self.async_db[self.collection_names["researchers"]]
+            self.async_publications = self.async_db[self.collection_names["publications"]]
+            self.async_stats = self.async_db[self.stats_collection_name]
+            print(f"✅ Cliente assíncrono MongoDB configurado (pool de até {self.max_pool_size} conexões)")
+            
+            await self._ensure_indexes_async()
+            # Primeira inicialização (ou banco migrado): montar os contadores a partir dos dados
+            if await self.async_stats.find_one({"_id": STATS_ID}) is None:
+                await self.rebuild_statistics_async()
             return True
             
         except Exception as e:
             print(f"❌ Erro ao configurar cliente assíncrono: {e}")
             return False
     
-    def save_research_result(self, research_data: Dict[str, Any]) -> bool:
-        """Salvar resultado de pesquisa no banco"""
+    def _ensure_indexes(self):
         try:
-            if self.collection is None:  # Corrigido para comparação explícita
-                if not self.connect():
-                    return False
-            
-            # Preparar documento
-            document = {
-                "timestamp": datetime.now(timezone.utc),
-                "query": research_data.get("query", ""),
-                "platform": research_data.get("platform", ""),
-                "search_type": research_data.get("search_type", ""),
-                "researcher_info": research_data.get("researcher_info", {}),
-                "total_publications": research_data.get("total_results", 0),
-                "filtered_by_keywords": research_data.get("filtered_by_keywords", False),
-                "original_total": research_data.get("original_total", 0),
-                "publications": research_data.get("data", {}).get("publications", []),
-                "execution_time": research_data.get("execution_time", 0),
-                "metadata": {
-                    "saved_at": datetime.now(timezone.utc).isoformat(),
-                    "source": "web-scraper-api",
-                    "version": "1.0"
-                }
-            }
-            
-            # Inserir no banco
-            result = self.collection.insert_one(document)
-            
-            print(f"💾 Pesquisa salva no MongoDB: {result.inserted_id}")
-            return True
-            
+            self.index_report = ensure_indexes(self._normalized_collections(asynchronous=False))
         except Exception as e:
-            print(f"❌ Erro ao salvar no MongoDB: {e}")
-            return False
+            print(f"⚠️ Não foi possível conferir os índices do MongoDB: {e}")
+    
+    async def _ensure_indexes_async(self):
+        try:
+            self.index_report = await ensure_indexes_async(self._normalized_collections())
+        except Exception as e:
+            print(f"⚠️ Não foi possível conferir os índices do MongoDB: {e}")
+    
+    async def get_index_usage_async(self) -> List[Dict[str, Any]]:
+        """Uso de cada índice das coleções ($indexStats)"""
+        if self.async_client is None:
+            if not await self.connect_async():
+                return []
+        return await index_usage_async(self._normalized_collections())
+    
+    async def close_async(self):
+        """Fechar o cliente assíncrono (shutdown da aplicação)"""
+        if self.async_client is not None:
+            self.async_client.close()
+            self.async_client = self.async_db = self.async_collection = None
+            self.async_searches = self.async_researchers = self.async_publications = None
+            self.async_stats = None
+            print("🔒 Cliente assíncrono MongoDB encerrado")
+    
+    # ========== GRAVAÇÃO (UPSERTS IDEMPOTENTES) ==========
+    
+    @staticmethod
+    def build_research_writes(research_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Montar as gravações normalizadas de uma pesquisa (timestamp = momento da chamada)"""
+        return build_research_writes(research_data, datetime.now(timezone.utc))
+    
+    @staticmethod
+    def _batch_operations(items: List[Dict[str, Any]]):
+        publication_ops = [
+            UpdateOne(query, update, upsert=True)
+            for item in items for query, update in item["publications"]
+        ]
+        researcher_ops = [
+            UpdateOne(*item["researcher"], upsert=True)
+            for item in items if item["researcher"]
+        ]
+        return publication_ops, researcher_ops, [item["search"] for item in items]
+    
+    async def write_research_batch_async(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Gravar um lote de pesquisas: um bulk_write por coleção
+        
+        Publicações e pesquisador são upserts ($set/$max/$addToSet), e o registro
+        da busca já traz seu _id; repetir o lote inteiro após uma falha não duplica nada.
+        Os contadores só somam o que cada passo criou de fato (upserted_count,
+        buscas inseridas agora), então a repetição também não os infla.
+        """
+        if not items:
+            return 0
+        if self.async_client is None:
+            if not await self.connect_async():
+                raise ConnectionError("MongoDB indisponível")
+        
+        publication_ops, researcher_ops, searches = self._batch_operations(items)
+        # Publicações e pesquisadores antes do registro que aponta para eles
+        if publication_ops:
+            result = await self.async_publications.bulk_write(publication_ops, ordered=False)
+            await self._increment_stats_async({"$inc": {"total_publications": result.upserted_count}})
+        if researcher_ops:
+            result = await self.async_researchers.bulk_write(researcher_ops, ordered=False)
+            await self._increment_stats_async({"$inc": {"total_researchers": result.upserted_count}})
+        try:
+            await self.async_searches.insert_many(searches, ordered=False)
+            inserted = searches
+        except BulkWriteError as e:
+            inserted = _newly_inserted(e, searches)
+        
+        if inserted:
+            stats_update, researcher_updates = search_counter_updates(inserted)
+            if researcher_updates:
+                await self.async_researchers.bulk_write(
+                    [UpdateOne(*update) for update in researcher_updates], ordered=False
+                )
+            await self._increment_stats_async(stats_update)
+        return len(inserted)
+    
+    def write_research_batch(self, items: List[Dict[str, Any]]) -> int:
+        """Versão síncrona de write_research_batch_async (migração)"""
+        if not items:
+            return 0
+        if self.client is None:
+            if not self.connect():
+                raise ConnectionError("MongoDB indisponível")
+        
+        publication_ops, researcher_ops, searches = self._batch_operations(items)
+        if publication_ops:
+            result = self.publications.bulk_write(publication_ops, ordered=False)
+            self._increment_stats({"$inc": {"total_publications": result.upserted_count}})
+        if researcher_ops:
+            result = self.researchers.bulk_write(researcher_ops, ordered=False)
+            self._increment_stats({"$inc": {"total_researchers": result.upserted_count}})
+        try:
+            self.searches.insert_many(searches, ordered=False)
+            inserted = searches
+        except BulkWriteError as e:
+            inserted = _newly_inserted(e, searches)
+        
+        if inserted:
+            stats_update, researcher_updates = search_counter_updates(inserted)
+            if researcher_updates:
+                self.researchers.bulk_write([UpdateOne(*update) for update in researcher_updates], ordered=False)
+            self._increment_stats(stats_update)
+        return len(inserted)
+    
+    async def _increment_stats_async(self, update: Dict[str, Any]):
+        await self.async_stats.update_one({"_id": STATS_ID}, update, upsert=True)
+    
+    def _increment_stats(self, update: Dict[str, Any]):
+        self.stats.update_one({"_id": STATS_ID}, update, upsert=True)
+    
+    def _statistics_rebuild_steps(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Recontar os contadores a partir dos dados (visão materializada com $merge)
+        
+        Usado na primeira inicialização, depois de exclusões e pelo comando
+        make rebuild-stats, caso algum incremento tenha se perdido.
+        """
+        searches_pipeline = [
+            {"$group": {
+                "_id": {"$literal": STATS_ID},
+                "total_searches": {"$sum": 1},
+                "filtered_searches": {"$sum": {"$cond": ["$filtered_by_keywords", 1, 0]}},
+                "platforms": {"$addToSet": "$platform"},
+                "latest_search": {"$max": "$timestamp"}
+            }},
+            {"$merge": {"into": self.stats_collection_name, "whenMatched": "merge", "whenNotMatched": "insert"}}
+        ]
+        researchers_pipeline = [
+            {"$match": {"researcher_id": {"$ne": None}}},
+            {"$group": {"_id": "$researcher_id", "searches": {"$sum": 1}}},
+            {"$merge": {
+                "into": self.collection_names["researchers"],
+                "whenMatched": "merge",
+                "whenNotMatched": "discard"
+            }}
+        ]
+        empty_stats = {
+            "total_searches": 0, "filtered_searches": 0, "platforms": [], "latest_search": None
+        }
+        return searches_pipeline, researchers_pipeline, empty_stats
+    
+    async def rebuild_statistics_async(self):
+        """Recontar os contadores (ver _statistics_rebuild_steps)"""
+        searches_pipeline, researchers_pipeline, empty_stats = self._statistics_rebuild_steps()
+        await self.async_stats.replace_one({"_id": STATS_ID}, dict(
+            empty_stats,
+            total_publications=await self.async_publications.count_documents({}),
+            total_researchers=await self.async_researchers.count_documents({})
+        ), upsert=True)
+        await self.async_researchers.update_many({}, {"$set": {"searches": 0}})
+        # $merge só grava ao consumir o cursor
+        async for _ in self.async_searches.aggregate(searches_pipeline):
+            pass
+        async for _ in self.async_searches.aggregate(researchers_pipeline):
+            pass
+        print("📈 Estatísticas do MongoDB recalculadas")
+    
+    def rebuild_statistics(self):
+        """Versão síncrona de rebuild_statistics_async"""
+        searches_pipeline, researchers_pipeline, empty_stats = self._statistics_rebuild_steps()
+        self.stats.replace_one({"_id": STATS_ID}, dict(
+            empty_stats,
+            total_publications=self.publications.count_documents({}),
+            total_researchers=self.researchers.count_documents({})
+        ), upsert=True)
+        self.researchers.update_many({}, {"$set": {"searches": 0}})
+        list(self.searches.aggregate(searches_pipeline))
+        list(self.searches.aggregate(researchers_pipeline))
+        print("📈 Estatísticas do MongoDB recalculadas")
     
     async def save_research_result_async(self, research_data: Dict[str, Any]) -> bool:
         """Salvar resultado de pesquisa no banco (assíncrono)"""
         try:
-            if self.async_collection is None:
-                if not await self.connect_async():
-                    return False
+            writes = self.build_research_writes(research_data)
+            await self.write_research_batch_async([writes])
             
-            # Preparar documento
-            document = {
-                "timestamp": datetime.now(timezone.utc),
-                "query": research_data.get("query", ""),
-                "platform": research_data.get("platform", ""),
-                "search_type": research_data.get("search_type", ""),
-                "researcher_info": research_data.get("researcher_info", {}),
-                "total_publications": research_data.get("total_results", 0),
-                "filtered_by_keywords": research_data.get("filtered_by_keywords", False),
-                "original_total": research_data.get("original_total", 0),
-                "publications": research_data.get("data", {}).get("publications", []),
-                "execution_time": research_data.get("execution_time", 0),
-                "metadata": {
-                    "saved_at": datetime.now(timezone.utc).isoformat(),
-                    "source": "web-scraper-api",
-                    "version": "1.0"
-                }
-            }
-            
-            # Inserir no banco
-            result = await self.async_collection.insert_one(document)
-            
-            print(f"💾 Pesquisa salva no MongoDB (async): {result.inserted_id}")
+            print(f"💾 Pesquisa salva no MongoDB (async): {writes['search']['_id']} "
+                  f"({len(writes['publications'])} publicações)")
             return True
             
         except Exception as e:
             print(f"❌ Erro ao salvar no MongoDB (async): {e}")
             return False
     
+    def migrate_legacy_research(self, batch_size: int = 200) -> Dict[str, int]:
+        """
+        Copiar a coleção antiga (uma cópia completa por busca) para o modelo normalizado
+        
+        Cada documento antigo mantém seu _id como _id do registro da busca, então
+        rodar a migração de novo não duplica nada.
+        """
+        if self.client is None:
+            if not self.connect():
+                return {"scanned": 0, "written": 0}
+        
+        scanned = written = 0
+        batch = []
+        for doc in self.collection.find({}, sort=[("timestamp", 1)], batch_size=batch_size):
+            scanned += 1
+            batch.append(build_research_writes(
+                legacy_document_to_research_data(doc),
+                doc.get("timestamp") or datetime.now(timezone.utc),
+                search_id=doc["_id"]
+            ))
+            if len(batch) >= batch_size:
+                written += self.write_research_batch(batch)
+                batch.clear()
+                print(f"🧩 {scanned} pesquisas migradas...")
+        written += self.write_research_batch(batch)
+        
+        print(f"✅ Migração concluída: {scanned} pesquisas da coleção '{self.collection_name}' normalizadas")
+        return {"scanned": scanned, "written": written}
+    
+    # ========== CONSULTAS ==========
+    
+    def _keyword_filtered_research_pipeline(
+        self,
+        after: Optional[str] = None,
+        include_publications: bool = True,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Pesquisas filtradas no formato antigo (researcher_info + publications)
+        
+        Args:
+            after: Cursor da página anterior (ver pagination.py)
+            include_publications: Juntar as publicações completas (senão só publication_count)
+            limit: Máximo de pesquisas
+        """
+        match: Dict[str, Any] = {"filtered_by_keywords": True}
+        if after:
+            match.update(keyset_filter("timestamp", after))
+        
+        pipeline: List[Dict[str, Any]] = [
+            {"$match": match},
+            {"$sort": dict(keyset_sort("timestamp"))},  # Mais recentes primeiro
+        ]
+        if limit:
+            pipeline.append({"$limit": limit})
+        pipeline.append({"$lookup": {
+            "from": self.collection_names["researchers"],
+            "localField": "researcher_id",
+            "foreignField": "_id",
+            "pipeline": [{"$project": {"info": 1}}],
+            "as": "researcher"
+        }})
+        if include_publications:
+            pipeline.append({"$lookup": {
+                "from": self.collection_names["publications"],
+                "localField": "publication_ids",
+                "foreignField": "_id",
+                "as": "publications"
+            }})
+        pipeline += [
+            {"$addFields": {
+                "researcher_info": {
+                    "$ifNull": [{"$arrayElemAt": ["$researcher.info", 0]}, {"name": "$researcher_name"}]
+                },
+                "publication_count": {"$size": {"$ifNull": ["$publication_ids", []]}}
+            }},
+            {"$project": {"researcher": 0, "publication_ids": 0}}
+        ]
+        return pipeline
+    
+    @staticmethod
+    def _serialize_search(doc: Dict[str, Any]) -> Dict[str, Any]:
+        doc["id"] = str(doc.pop("_id"))
+        return doc
+    
+    @staticmethod
+    def _researcher_summary(doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Documento de researcher_profiles no formato de /mongodb/researchers"""
+        info = doc.get("info", {})
+        researcher = {"id": doc["_id"], "name": doc.get("name")}
+        researcher.update({field: info.get(field) for field in RESEARCHER_SUMMARY_FIELDS})
+        researcher.update({
+            "platforms": doc.get("platforms", []),
+            "total_publications": doc.get("total_publications", 0),
+            "searches": doc.get("searches", 0),
+            "last_search": doc.get("last_search")
+        })
+        return researcher
+    
+    @staticmethod
+    async def _collect_page(
+        documents: AsyncIterator[Dict[str, Any]],
+        limit: int,
+        sort_field: str,
+        serialize: Callable[[Dict[str, Any]], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Uma página a partir de um cursor que traz limit + 1 documentos"""
+        items: List[Dict[str, Any]] = []
+        next_cursor = None
+        last = None
+        async for doc in documents:
+            if len(items) == limit:
+                next_cursor = encode_cursor(last[sort_field], last["_id"])
+                break
+            last = doc
+            items.append(serialize(doc))
+        return {"items": items, "next_cursor": next_cursor}
+    
     def get_all_keyword_filtered_research(self) -> List[Dict[str, Any]]:
-        """Buscar todas as pesquisas filtradas por keywords"""
+        """Buscar todas as pesquisas filtradas por keywords (exportação manual)"""
         try:
-            if not self.collection:
+            if self.client is None:
                 if not self.connect():
                     return []
             
-            # Buscar apenas pesquisas com filtro de keywords
-            cursor = self.collection.find(
-                {"filtered_by_keywords": True},
-                sort=[("timestamp", -1)]  # Mais recentes primeiro
-            )
-            
-            results = list(cursor)
+            results = list(self.searches.aggregate(self._keyword_filtered_research_pipeline()))
             print(f"📚 Encontradas {len(results)} pesquisas com filtro de keywords")
             
             return results
@@ -157,191 +488,277 @@ class ResearchDatabase:
             print(f"❌ Erro ao buscar dados do MongoDB: {e}")
             return []
     
-    async def get_all_keyword_filtered_research_async(self) -> List[Dict[str, Any]]:
-        """Buscar todas as pesquisas filtradas por keywords (versão assíncrona)"""
-        try:
-            if self.async_collection is None:
-                if not await self.connect_async():
-                    return []
-            
-            # Buscar apenas pesquisas com filtro de keywords
-            cursor = self.async_collection.find(
-                {"filtered_by_keywords": True},
-                sort=[("timestamp", -1)]  # Mais recentes primeiro
-            )
-            
-            results = []
-            async for doc in cursor:
-                results.append(doc)
-            
-            print(f"📚 Encontradas {len(results)} pesquisas com filtro de keywords")
-            
-            return results
-            
-        except Exception as e:
-            print(f"❌ Erro ao buscar dados do MongoDB (async): {e}")
-            return []
+    async def iter_keyword_filtered_research_async(
+        self,
+        after: Optional[str] = None,
+        include_publications: bool = False,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Pesquisas filtradas, uma a uma, direto do cursor (streaming NDJSON)"""
+        if self.async_client is None:
+            if not await self.connect_async():
+                return
+        
+        pipeline = self._keyword_filtered_research_pipeline(after, include_publications, limit)
+        async for doc in self.async_searches.aggregate(pipeline):
+            yield self._serialize_search(doc)
     
-    async def get_all_scholar_research_async(self) -> List[Dict[str, Any]]:
-        """Buscar todas as pesquisas do Scholar (com ou sem filtro de keywords)"""
+    async def get_keyword_filtered_research_page_async(
+        self,
+        limit: int = 50,
+        after: Optional[str] = None,
+        include_publications: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Uma página das pesquisas filtradas por keywords
+        
+        Returns:
+            {"items": [...], "next_cursor": cursor da próxima página ou None}
+        """
+        if self.async_client is None:
+            if not await self.connect_async():
+                return {"items": [], "next_cursor": None}
+        
+        pipeline = self._keyword_filtered_research_pipeline(after, include_publications, limit + 1)
+        page = await self._collect_page(
+            self.async_searches.aggregate(pipeline), limit, "timestamp", self._serialize_search
+        )
+        print(f"📚 Página com {len(page['items'])} pesquisas com filtro de keywords")
+        return page
+    
+    async def iter_scholar_research_async(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Pesquisadores do Scholar com suas publicações, um por vez (exportação em streaming)
+        
+        As publicações de cada pesquisador vêm de uma consulta própria (índice
+        researcher_ids): só um pesquisador fica em memória de cada vez, e cada
+        publicação aparece uma vez por pesquisador, mesmo com buscas repetidas.
+        """
+        if self.async_client is None:
+            if not await self.connect_async():
+                return
+        
+        researchers = self.async_researchers.find({"platforms": "scholar"}, sort=keyset_sort("last_search"))
+        async for researcher in researchers:
+            publications = []
+            async for publication in self.async_publications.find(
+                {"researcher_ids": researcher["_id"], "platforms": "scholar"},
+                {"researcher_ids": 0, "platforms": 0}
+            ):
+                publications.append(publication)
+            
+            yield {
+                "researcher_info": researcher.get("info", {}),
+                "platform": "scholar",
+                "timestamp": researcher.get("last_search"),
+                "total_publications": len(publications),
+                "publications": publications
+            }
+    
+    async def get_publications_by_keyword_async(
+        self,
+        keyword: str,
+        since_year: Optional[int] = None,
+        platform: Optional[str] = None,
+        limit: int = 500
+    ) -> List[Dict[str, Any]]:
+        """
+        Publicações que mencionam uma palavra-chave (ex: 'geriatria' desde 2020)
+        
+        Filtro e ordenação (ano mais recente primeiro) saem do índice keywords_year.
+        """
         try:
-            if self.async_collection is None:
+            if self.async_client is None:
                 if not await self.connect_async():
                     return []
             
-            # Buscar todas as pesquisas do Scholar
-            cursor = self.async_collection.find(
-                {"platform": "scholar"},
-                sort=[("timestamp", -1)]  # Mais recentes primeiro
-            )
+            query: Dict[str, Any] = {MATCHED_KEYWORDS_FIELD: keyword}
+            if since_year is not None:
+                query[YEAR_FIELD] = {"$gte": since_year}
+            if platform:
+                query["platforms"] = platform
             
-            results = []
-            async for doc in cursor:
-                results.append(doc)
-            
-            print(f"📚 Encontradas {len(results)} pesquisas do Scholar")
+            pipeline = [
+                {"$match": query},
+                {"$sort": {YEAR_FIELD: -1}},
+                {"$limit": limit},
+                {"$lookup": {
+                    "from": self.collection_names["researchers"],
+                    "localField": "researcher_ids",
+                    "foreignField": "_id",
+                    "pipeline": [{"$project": {"name": 1}}],
+                    "as": "researchers"
+                }}
+            ]
             
+            results = []
+            async for publication in self.async_publications.aggregate(pipeline):
+                names = [researcher.get("name") for researcher in publication.pop("researchers", [])]
+                platforms = publication.get("platforms") or [None]
+                results.append({
+                    "researcher": names[0] if names else None,
+                    "researchers": names,
+                    "platform": platforms[0],
+                    "timestamp": publication.get("last_seen"),
+                    "publication": publication
+                })
+            
+            print(f"🔎 Encontradas {len(results)} publicações com a palavra-chave '{keyword}'")
             return results
             
         except Exception as e:
-            print(f"❌ Erro ao buscar dados do Scholar no MongoDB (async): {e}")
+            print(f"❌ Erro ao buscar publicações por palavra-chave (async): {e}")
             return []
     
+    def backfill_publication_keywords(self, batch_size: int = 500, force: bool = False) -> Dict[str, int]:
+        """
+        Gravar palavras-chave nas publicações que ainda não têm o campo
+        
+        Args:
+            batch_size: Publicações atualizadas por bulk_write
+            force: Recalcular todas (ex: depois de mudar a lista de palavras-chave)
+        """
+        if self.client is None:
+            if not self.connect():
+                return {"scanned": 0, "updated": 0}
+        
+        query: Dict[str, Any] = {} if force else {MATCHED_KEYWORDS_FIELD: {"$exists": False}}
+        
+        scanned = updated = 0
+        operations = []
+        
+        def flush():
+            nonlocal updated
+            if operations:
+                result = self.publications.bulk_write(operations, ordered=False)
+                updated += result.modified_count
+                operations.clear()
+        
+        for doc in self.publications.find(query, {"title": 1, "snippet": 1, "year": 1}, batch_size=batch_size):
+            scanned += 1
+            annotated = annotate_publication(doc)
+            operations.append(UpdateOne(
+                {"_id": doc["_id"]},
+                {"$set": {
+                    MATCHED_KEYWORDS_FIELD: annotated[MATCHED_KEYWORDS_FIELD],
+                    YEAR_FIELD: annotated[YEAR_FIELD]
+                }}
+            ))
+            if len(operations) >= batch_size:
+                flush()
+                print(f"🏷️ {scanned} publicações processadas...")
+        flush()
+        
+        print(f"✅ Backfill de palavras-chave concluído: {updated} de {scanned} publicações atualizadas")
+        return {"scanned": scanned, "updated": updated}
+    
     def get_research_statistics(self) -> Dict[str, Any]:
-        """Obter estatísticas gerais das pesquisas"""
+        """Obter estatísticas gerais das pesquisas (contadores já mantidos na gravação)"""
         try:
-            if not self.collection:
+            if self.client is None:
                 if not self.connect():
                     return {}
             
-            # Agregar estatísticas
-            pipeline = [
-                {
-                    "$group": {
-                        "_id": None,
-                        "total_searches": {"$sum": 1},
-                        "filtered_searches": {
-                            "$sum": {"$cond": ["$filtered_by_keywords", 1, 0]}
-                        },
-                        "total_publications": {"$sum": "$total_publications"},
-                        "platforms": {"$addToSet": "$platform"},
-                        "latest_search": {"$max": "$timestamp"}
-                    }
-                }
-            ]
-            
-            result = list(self.collection.aggregate(pipeline))
-            
-            if result:
-                stats = result[0]
-                stats.pop("_id", None)
-                return stats
-            
-            return {}
+            return _stats_document(self.stats.find_one({"_id": STATS_ID}))
             
         except Exception as e:
             print(f"❌ Erro ao obter estatísticas: {e}")
             return {}
     
     async def get_research_statistics_async(self) -> Dict[str, Any]:
-        """Obter estatísticas gerais das pesquisas (versão assíncrona)"""
+        """Obter estatísticas gerais das pesquisas (versão assíncrona, leitura de um documento)"""
         try:
-            if self.async_collection is None:
+            if self.async_client is None:
                 if not await self.connect_async():
                     return {}
             
-            # Agregar estatísticas
-            pipeline = [
-                {
-                    "$group": {
-                        "_id": None,
-                        "total_searches": {"$sum": 1},
-                        "filtered_searches": {
-                            "$sum": {"$cond": ["$filtered_by_keywords", 1, 0]}
-                        },
-                        "total_publications": {"$sum": "$total_publications"},
-                        "platforms": {"$addToSet": "$platform"},
-                        "latest_search": {"$max": "$timestamp"}
-                    }
-                }
-            ]
-            
-            result = []
-            async for doc in self.async_collection.aggregate(pipeline):
-                result.append(doc)
-            
-            if result:
-                stats = result[0]
-                stats.pop("_id", None)
-                return stats
-            
-            return {}
+            return _stats_document(await self.async_stats.find_one({"_id": STATS_ID}))
             
         except Exception as e:
             print(f"❌ Erro ao obter estatísticas (async): {e}")
             return {}
     
-    async def get_all_unique_researchers_async(self) -> List[Dict[str, Any]]:
-        """Obter todos os pesquisadores únicos com seus dados agregados"""
-        try:
-            if self.async_collection is None:
-                if not await self.connect_async():
-                    return []
-            
-            # Agregar pesquisadores únicos
-            pipeline = [
-                {
-                    "$group": {
-                        "_id": "$researcher_info.name",
-                        "name": {"$first": "$researcher_info.name"},
-                        "institution": {"$first": "$researcher_info.institution"},
-                        "email": {"$first": "$researcher_info.email"},
-                        "h_index": {"$first": "$researcher_info.h_index"},
-                        "i10_index": {"$first": "$researcher_info.i10_index"},
-                        "total_citations": {"$first": "$researcher_info.total_citations"},
-                        "lattes_summary": {"$first": "$researcher_info.lattes_summary"},
-                        "lattes_institution": {"$first": "$researcher_info.lattes_institution"},
-                        "lattes_area": {"$first": "$researcher_info.lattes_area"},
-                        "lattes_url": {"$first": "$researcher_info.lattes_url"},
-                        "research_areas": {"$first": "$researcher_info.research_areas"},
-                        "total_publications": {"$sum": "$total_publications"},
-                        "searches": {"$sum": 1},
-                        "last_search": {"$max": "$timestamp"}
-                    }
-                },
-                {
-                    "$sort": {"last_search": -1}
-                }
-            ]
-            
-            researchers = []
-            async for doc in self.async_collection.aggregate(pipeline):
-                # Converter _id para string para JSON serialization
-                doc["id"] = str(doc["_id"]) if doc.get("_id") else ""
-                doc.pop("_id", None)
-                researchers.append(doc)
-            
-            print(f"👥 Encontrados {len(researchers)} pesquisadores únicos")
-            return researchers
-            
-        except Exception as e:
-            print(f"❌ Erro ao obter pesquisadores únicos (async): {e}")
-            return []
+    def _researchers_cursor(self, after: Optional[str], limit: Optional[int]):
+        query = keyset_filter("last_search", after) if after else {}
+        cursor = self.async_researchers.find(query, sort=keyset_sort("last_search"))
+        return cursor.limit(limit) if limit else cursor
+    
+    async def iter_researchers_async(
+        self,
+        after: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Pesquisadores, um a um, mais recentes primeiro (streaming NDJSON)"""
+        if self.async_client is None:
+            if not await self.connect_async():
+                return
+        
+        async for doc in self._researchers_cursor(after, limit):
+            yield self._researcher_summary(doc)
+    
+    async def get_researchers_page_async(self, limit: int = 50, after: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Uma página de pesquisadores (contagem de buscas e publicações já estão no documento)
+        
+        Returns:
+            {"items": [...], "next_cursor": cursor da próxima página ou None}
+        """
+        if self.async_client is None:
+            if not await self.connect_async():
+                return {"items": [], "next_cursor": None}
+        
+        page = await self._collect_page(
+            self._researchers_cursor(after, limit + 1), limit, "last_search", self._researcher_summary
+        )
+        print(f"👥 Página com {len(page['items'])} pesquisadores")
+        return page
+    
+    async def _resolve_researcher_id_async(self, researcher_id: str) -> Optional[str]:
+        """
+        _id gravado para o pesquisador, com as mesmas chaves de build_research_writes
+
+        Aceita o próprio _id ('scholar:JicYPdAAAAAJ', 'maria-silva') ou o nome
+        ('Maria Silva'); um nome só resolve se não houver homônimos gravados.
+        """
+        if await self.async_researchers.count_documents({"_id": researcher_id}, limit=1):
+            return researcher_id
+        key = researcher_key(researcher_id)
+        if not key:
+            return None
+        if await self.async_researchers.count_documents({"_id": key}, limit=1):
+            return key
+        matches = await self.async_researchers.find({"name": researcher_id}, {"_id": 1}).to_list(length=2)
+        if len(matches) == 1:
+            return matches[0]["_id"]
+        # Sem documento de pesquisador: ainda pode haver buscas gravadas com a chave do nome
+        return key
     
     async def delete_researcher_async(self, researcher_id: str) -> Dict[str, Any]:
-        """Deletar um pesquisador específico e todas as suas publicações"""
+        """Deletar um pesquisador, suas buscas e as publicações que só ele tinha"""
         try:
-            if self.async_collection is None:
+            if self.async_client is None:
                 if not await self.connect_async():
                     return {"deleted_publications": 0}
             
-            # Deletar todas as buscas deste pesquisador
-            result = await self.async_collection.delete_many({
-                "researcher_info.name": researcher_id
-            })
-            
-            print(f"🗑️ Deletadas {result.deleted_count} buscas do pesquisador: {researcher_id}")
-            return {"deleted_publications": result.deleted_count}
+            key = await self._resolve_researcher_id_async(researcher_id)
+            if key is None:
+                print(f"⚠️ Pesquisador não encontrado: {researcher_id}")
+                return {"deleted_publications": 0, "deleted_searches": 0}
+            
+            await self.async_researchers.delete_one({"_id": key})
+            searches = await self.async_searches.delete_many({"researcher_id": key})
+            # Publicações em coautoria continuam ligadas aos outros pesquisadores
+            await self.async_publications.update_many({"researcher_ids": key}, {"$pull": {"researcher_ids": key}})
+            publications = await self.async_publications.delete_many({"researcher_ids": {"$size": 0}})
+            # Exclusões são raras: recontar em vez de decrementar cada contador
+            await self.rebuild_statistics_async()
+            
+            print(f"🗑️ Deletadas {searches.deleted_count} buscas e {publications.deleted_count} "
+                  f"publicações do pesquisador: {researcher_id}")
+            return {
+                "deleted_publications": publications.deleted_count,
+                "deleted_searches": searches.deleted_count
+            }
             
         except Exception as e:
             print(f"❌ Erro ao deletar pesquisador (async): {e}")
@@ -350,15 +767,19 @@ class ResearchDatabase:
     async def clear_all_data_async(self) -> Dict[str, Any]:
         """Limpar todos os dados do banco (USE COM CUIDADO!)"""
         try:
-            if self.async_collection is None:
+            if self.async_client is None:
                 if not await self.connect_async():
                     return {"deleted_count": 0}
             
-            # Deletar todos os documentos
-            result = await self.async_collection.delete_many({})
+            # Deletar todos os documentos (inclusive da coleção antiga)
+            deleted_count = 0
+            for collection in [self.async_collection, *self._normalized_collections().values()]:
+                result = await collection.delete_many({})
+                deleted_count += result.deleted_count
+            await self.rebuild_statistics_async()
             
-            print(f"🗑️ Banco de dados limpo! {result.deleted_count} documentos deletados")
-            return {"deleted_count": result.deleted_count}
+            print(f"🗑️ Banco de dados limpo! {deleted_count} documentos deletados")
+            return {"deleted_count": deleted_count}
             
         except Exception as e:
             print(f"❌ Erro ao limpar banco de dados (async): {e}")
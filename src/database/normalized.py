@@ -0,0 +1,247 @@
+"""
+🧩 MODELO NORMALIZADO DE ARMAZENAMENTO
+=====================================
+Cada resultado de busca vira três gravações idempotentes:
+
+- researcher_profiles: um documento por pesquisador (_id estável: 'plataforma:id'
+  quando o resultado traz o id do perfil, senão derivado do nome)
+- publications: um documento por publicação (_id = hash do conteúdo: título + ano),
+  ligado aos pesquisadores por researcher_ids
+- searches: registro enxuto da busca, com os _id das publicações encontradas
+
+Buscar o mesmo pesquisador dez vezes atualiza os mesmos documentos em vez de
+gravar dez cópias das publicações.
+"""
+
+import re
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+
+from ..utils.keyword_matcher import fold_text
+from .keywords import YEAR_FIELD, annotate_publication
+
+# (filtro, atualização) de um upsert
+Upsert = Tuple[Dict[str, Any], Dict[str, Any]]
+
+# Campos que variam por busca e não são sobrescritos com $set
+_PUBLICATION_COUNTERS = {"cited_by"}
+
+# Campo de researcher_info com o id do perfil em cada plataforma
+PLATFORM_ID_FIELDS = {"orcid": "orcid_id", "lattes": "lattes_id", "scholar": "scholar_id"}
+
+# Nomes que os extratores devolvem quando não acharam o nome (já como slug):
+# viraram um único "pesquisador" que juntava perfis sem relação
+PLACEHOLDER_NAME_KEYS = {"nome-nao-encontrado", "n-a", "nome-nao-informado"}
+
+
+def researcher_key(name: Optional[str]) -> str:
+    """
+    Chave derivada do nome: sem acentos, minúsculo, com hífens ('Maria Silva' -> 'maria-silva')
+
+    Nomes-placeholder ('Nome não encontrado', 'N/A') devolvem '' e nunca viram _id.
+    """
+    key = re.sub(r"[^a-z0-9]+", "-", fold_text(name or "")).strip("-")
+    return "" if key in PLACEHOLDER_NAME_KEYS else key
+
+
+def researcher_id_for(researcher_info: Dict[str, Any], platform: str = "") -> Optional[str]:
+    """
+    _id do pesquisador: 'plataforma:id' quando o resultado traz o id do perfil
+    (o da própria plataforma primeiro), senão a chave do nome
+
+    Homônimos com perfis diferentes ficam em documentos diferentes.
+    """
+    platforms = sorted(PLATFORM_ID_FIELDS, key=lambda name: name != platform)
+    for name in platforms:
+        value = str(researcher_info.get(PLATFORM_ID_FIELDS[name]) or "").strip()
+        if value and value != "N/A":
+            return f"{name}:{value}"
+    return researcher_key(researcher_info.get("name")) or None
+
+
+def publication_key(publication: Dict[str, Any]) -> Optional[str]:
+    """_id da publicação: hash do título normalizado + ano (ou do link, se não houver título)"""
+    title = re.sub(r"\W+", " ", fold_text(str(publication.get("title") or ""))).strip()
+    if not title or title == "n a":
+        title = str(publication.get("link") or "").strip()
+        if not title:
+            return None
+    year = publication.get(YEAR_FIELD)
+    return hashlib.sha1(f"{title}|{year or ''}".encode("utf-8")).hexdigest()
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def build_researcher_upsert(
+    researcher_id: str,
+    researcher_info: Dict[str, Any],
+    platform: str,
+    timestamp: datetime,
+    total_publications: int
+) -> Upsert:
+    """Mesclar os dados do pesquisador: campos vazios não apagam o que outra busca trouxe"""
+    update: Dict[str, Any] = {
+        "$set": {},
+        "$max": {"last_search": timestamp, "total_publications": total_publications},
+        "$setOnInsert": {"first_seen": timestamp},
+    }
+    for field, value in researcher_info.items():
+        if value not in (None, "", "N/A") and field != "name":
+            update["$set"][f"info.{field}"] = value
+    # Nome-placeholder não sobrescreve o nome real trazido por outra busca
+    names = "$set" if researcher_key(researcher_info.get("name")) else "$setOnInsert"
+    name = researcher_info.get("name") if names == "$set" else researcher_id
+    update[names].update({"name": name, "info.name": name})
+    if not update["$set"]:
+        del update["$set"]  # MongoDB recusa $set vazio
+    if platform:
+        update["$addToSet"] = {"platforms": platform}
+    return {"_id": researcher_id}, update
+
+
+def build_publication_upsert(
+    publication_id: str,
+    publication: Dict[str, Any],
+    researcher_id: Optional[str],
+    platform: str,
+    timestamp: datetime
+) -> Upsert:
+    """Upsert de uma publicação já anotada (palavras-chave e ano)"""
+    fields = {
+        key: value for key, value in publication.items()
+        if key not in _PUBLICATION_COUNTERS and key != "_id"
+    }
+    fields["last_seen"] = timestamp
+
+    update: Dict[str, Any] = {
+        "$set": fields,
+        "$setOnInsert": {"first_seen": timestamp},
+    }
+    cited_by = _as_int(publication.get("cited_by"))
+    if cited_by is not None:
+        update["$max"] = {"cited_by": cited_by}
+
+    add_to_set = {}
+    if researcher_id:
+        add_to_set["researcher_ids"] = researcher_id
+    if platform or publication.get("platform"):
+        add_to_set["platforms"] = publication.get("platform") or platform
+    if add_to_set:
+        update["$addToSet"] = add_to_set
+    return {"_id": publication_id}, update
+
+
+def build_research_writes(
+    research_data: Dict[str, Any],
+    timestamp: datetime,
+    search_id: Optional[ObjectId] = None
+) -> Dict[str, Any]:
+    """
+    Converter um resultado de busca nas gravações normalizadas
+
+    Returns:
+        {"search": documento do log, "researcher": upsert ou None, "publications": [upserts]}
+    """
+    platform = research_data.get("platform", "")
+    researcher_info = research_data.get("researcher_info") or {}
+    researcher_id = researcher_id_for(researcher_info, platform)
+
+    publication_upserts: List[Upsert] = []
+    publication_ids: List[str] = []
+    for publication in research_data.get("data", {}).get("publications", []):
+        if not isinstance(publication, dict):
+            continue
+        # Palavras-chave calculadas uma vez aqui, não a cada exportação
+        annotated = annotate_publication(publication)
+        publication_id = publication_key(annotated)
+        if publication_id is None or publication_id in publication_ids:
+            continue
+        publication_ids.append(publication_id)
+        publication_upserts.append(
+            build_publication_upsert(publication_id, annotated, researcher_id, platform, timestamp)
+        )
+
+    researcher_upsert = None
+    if researcher_id:
+        researcher_upsert = build_researcher_upsert(
+            researcher_id, researcher_info, platform, timestamp, len(publication_ids)
+        )
+
+    search = {
+        "_id": search_id or ObjectId(),
+        "timestamp": timestamp,
+        "query": research_data.get("query", ""),
+        "platform": platform,
+        "search_type": research_data.get("search_type", ""),
+        "researcher_id": researcher_id,
+        "researcher_name": researcher_info.get("name"),
+        "total_publications": research_data.get("total_results", 0),
+        "filtered_by_keywords": research_data.get("filtered_by_keywords", False),
+        "original_total": research_data.get("original_total", 0),
+        "execution_time": research_data.get("execution_time", 0),
+        "publication_ids": publication_ids,
+        "metadata": {
+            "saved_at": timestamp.isoformat(),
+            "source": "web-scraper-api",
+            "version": "2.0"
+        }
+    }
+
+    return {"search": search, "researcher": researcher_upsert, "publications": publication_upserts}
+
+
+def legacy_document_to_research_data(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Documento da coleção antiga (uma cópia completa por busca) no formato de resultado de busca"""
+    return {
+        "query": document.get("query", ""),
+        "platform": document.get("platform", ""),
+        "search_type": document.get("search_type", ""),
+        "researcher_info": document.get("researcher_info") or {},
+        "total_results": document.get("total_publications", 0),
+        "filtered_by_keywords": document.get("filtered_by_keywords", False),
+        "original_total": document.get("original_total", 0),
+        "execution_time": document.get("execution_time", 0),
+        "data": {"publications": document.get("publications") or []},
+    }
+
+
+# Documento único com os contadores gerais (coleção de estatísticas)
+STATS_ID = "global"
+
+
+def search_counter_updates(searches: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], List[Upsert]]:
+    """
+    Contadores das buscas recém-gravadas ($inc/$max), para leituras O(1) no painel
+
+    Args:
+        searches: Registros de busca inseridos agora (não os repetidos de um lote refeito)
+
+    Returns:
+        (atualização do documento de estatísticas, atualizações de cada pesquisador)
+    """
+    per_researcher: Dict[str, int] = {}
+    for search in searches:
+        if search.get("researcher_id"):
+            per_researcher[search["researcher_id"]] = per_researcher.get(search["researcher_id"], 0) + 1
+
+    stats_update: Dict[str, Any] = {
+        "$inc": {
+            "total_searches": len(searches),
+            "filtered_searches": sum(1 for search in searches if search.get("filtered_by_keywords")),
+        },
+        "$max": {"latest_search": max(search["timestamp"] for search in searches)},
+        "$addToSet": {"platforms": {"$each": sorted({s["platform"] for s in searches if s.get("platform")})}},
+    }
+    researcher_updates = [
+        ({"_id": researcher_id}, {"$inc": {"searches": count}})
+        for researcher_id, count in per_researcher.items()
+    ]
+    return stats_update, researcher_updates
@@ -0,0 +1,56 @@
+"""
+📄 PAGINAÇÃO POR CHAVE (KEYSET)
+==============================
+As listagens são ordenadas por (data, _id) decrescente. O cursor de uma página
+guarda o último par devolvido, e a próxima começa logo depois dele com um
+filtro que o índice atende. Não há skip, então a página 100 custa o mesmo que
+a primeira.
+"""
+
+import json
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+
+class InvalidCursor(ValueError):
+    """Cursor de paginação malformado"""
+
+
+def encode_cursor(sort_value: datetime, document_id: Any) -> str:
+    """Cursor opaco (base64 url-safe) a partir do último documento da página"""
+    payload = {
+        "t": sort_value.isoformat(),
+        "i": str(document_id),
+        "o": isinstance(document_id, ObjectId),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, Any]:
+    """(data, _id) gravados no cursor"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        document_id = ObjectId(payload["i"]) if payload["o"] else payload["i"]
+        return datetime.fromisoformat(payload["t"]), document_id
+    except (binascii.Error, InvalidId, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursor(f"Cursor inválido: {cursor}") from e
+
+
+def keyset_filter(field: str, cursor: str) -> Dict[str, Any]:
+    """Filtro dos documentos depois do cursor na ordem (field, _id) decrescente"""
+    sort_value, document_id = decode_cursor(cursor)
+    return {"$or": [
+        {field: {"$lt": sort_value}},
+        {field: sort_value, "_id": {"$lt": document_id}},
+    ]}
+
+
+def keyset_sort(field: str) -> List[Tuple[str, int]]:
+    return [(field, -1), ("_id", -1)]
@@ -0,0 +1,25 @@
+"""
+📈 RECONTAGEM DAS ESTATÍSTICAS
+=============================
+Os contadores de /mongodb/stats e /mongodb/researchers são atualizados a cada
+gravação. Este comando os recalcula a partir dos dados (ex: depois de uma
+falha no meio de um lote ou de alterações feitas direto no banco).
+
+Uso:
+    python -m src.database.rebuild_stats
+"""
+
+from .mongodb import ResearchDatabase
+
+
+def main():
+    db = ResearchDatabase()
+    try:
+        if db.connect():
+            db.rebuild_statistics()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
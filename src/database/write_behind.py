@@ -0,0 +1,158 @@
+"""
+📝 GRAVAÇÃO EM SEGUNDO PLANO (WRITE-BEHIND)
+==========================================
+Os endpoints de busca entregam o resultado à fila e respondem na hora; um
+worker no event loop da API grava os resultados em lotes (um bulk_write por
+coleção, ver ResearchDatabase.write_research_batch_async) quando o lote enche
+ou o intervalo de flush vence.
+
+- Fila limitada: se o MongoDB ficar para trás, submit() espera (backpressure)
+  em vez de acumular memória sem limite
+- Falhas de gravação são repetidas com espera crescente; o sink precisa ser
+  idempotente (upserts e _id atribuídos antes de enfileirar)
+- No shutdown a fila é drenada antes de fechar o cliente MongoDB
+"""
+
+import os
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from .mongodb import research_db
+
+load_dotenv()
+
+Document = Dict[str, Any]
+
+
+class WriteBehindQueue:
+    """Fila de documentos gravados em lote por um worker assíncrono"""
+
+    def __init__(
+        self,
+        sink: Callable[[List[Document]], Awaitable[int]],
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_pending: Optional[int] = None,
+        retries: Optional[int] = None
+    ):
+        """
+        Args:
+            sink: Corrotina idempotente que grava um lote e devolve quantos itens entraram
+            batch_size: Itens por lote
+            flush_interval: Espera máxima (s) para completar um lote
+            max_pending: Tamanho da fila antes de aplicar backpressure
+            retries: Novas tentativas de um lote que falhou
+        """
+        self.sink = sink
+        self.batch_size = batch_size or int(os.getenv("MONGODB_WRITE_BATCH_SIZE", 100))
+        self.flush_interval = flush_interval if flush_interval is not None else float(
+            os.getenv("MONGODB_WRITE_FLUSH_INTERVAL", 1.0)
+        )
+        self.max_pending = max_pending or int(os.getenv("MONGODB_WRITE_QUEUE_SIZE", 1000))
+        self.retries = retries if retries is not None else int(os.getenv("MONGODB_WRITE_RETRIES", 3))
+
+        self.submitted = 0
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+
+        self._queue: Optional["asyncio.Queue[Document]"] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    def start(self):
+        """Iniciar o worker no event loop atual (lifespan da aplicação)"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+        print(f"📝 Gravação em lote do MongoDB iniciada (lotes de {self.batch_size}, flush a cada {self.flush_interval}s)")
+
+    async def submit(self, document: Document):
+        """Enfileirar um item; só espera se a fila estiver cheia"""
+        if not self.running:
+            raise RuntimeError("Fila de gravação não iniciada")
+        await self._queue.put(document)
+        self.submitted += 1
+
+    async def _next_batch(self) -> List[Document]:
+        """Aguardar o primeiro documento e completar o lote até o tamanho ou o prazo"""
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+
+        while len(batch) < self.batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _write(self, batch: List[Document]):
+        for attempt in range(self.retries + 1):
+            try:
+                self.written += await self.sink(batch)
+                self.batches += 1
+                return
+            except Exception as e:
+                print(f"⚠️ Falha ao gravar lote no MongoDB (tentativa {attempt + 1}): {e}")
+
+            if attempt < self.retries:
+                await asyncio.sleep(min(2 ** attempt, 30))
+
+        self.failed += len(batch)
+        print(f"❌ {len(batch)} documentos descartados após {self.retries + 1} tentativas")
+
+    async def _run(self):
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def flush(self):
+        """Aguardar até que todos os documentos enfileirados sejam gravados"""
+        if self.running:
+            await self._queue.join()
+
+    async def stop(self, timeout: Optional[float] = 30.0):
+        """Drenar a fila e parar o worker (shutdown da aplicação)"""
+        if not self.running:
+            return
+        try:
+            await asyncio.wait_for(self.flush(), timeout=timeout)
+        except asyncio.TimeoutError:
+            print(f"⚠️ {self._queue.qsize()} documentos não gravados no shutdown (timeout de {timeout}s)")
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        print("🔒 Gravação em lote do MongoDB encerrada")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "max_pending": self.max_pending,
+            "batch_size": self.batch_size,
+            "submitted": self.submitted,
+            "written": self.written,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+
+# Instância global (iniciada e drenada no lifespan da API)
+research_writer = WriteBehindQueue(research_db.write_research_batch_async)
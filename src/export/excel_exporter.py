@@ -10,6 +10,8 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 import re
 
+from ..utils.keyword_matcher import KeywordMatcher
+
 # Palavras-chave para filtragem de publicações relacionadas ao envelhecimento
 KEYWORDS = [
     # Institucional
@@ -44,6 +46,12 @@ KEYWORDS = [
     'universidade aberta', 'open university'
 ]
 
+# Campos de texto pesquisados em cada publicação
+KEYWORD_FIELDS = ('title', 'authors', 'publication', 'snippet', 'abstract')
+
+# Compilado uma única vez para todas as buscas e exportações
+KEYWORD_MATCHER = KeywordMatcher(KEYWORDS)
+
 class ProfessionalExcelExporter:
     """Exportador profissional focado em publicações por linha"""
     
@@ -97,32 +105,8 @@ class ProfessionalExcelExporter:
         Returns:
             Lista de palavras-chave encontradas
         """
-        found_keywords = []
-        
-        # Campos de texto para pesquisar
-        text_fields = [
-            publication.get('title', ''),
-            publication.get('authors', ''),
-            publication.get('publication', ''),
-            publication.get('snippet', ''),
-            publication.get('abstract', '')  # Caso tenha resumo
-        ]
-        
-        # Juntar todos os textos em uma string única
-        full_text = ' '.join(text_fields).lower()
-        
-        # Buscar cada palavra-chave
-        for keyword in KEYWORDS:
-            keyword_lower = keyword.lower()
-            
-            # Busca por palavra completa (evita falsos positivos)
-            # Usando regex para garantir que seja uma palavra completa
-            pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-            
-            if re.search(pattern, full_text):
-                found_keywords.append(keyword)
-        
-        return found_keywords
+        # Uma passada pelo texto (título, autores, veículo, snippet e resumo)
+        return KEYWORD_MATCHER.find_in_fields(publication, KEYWORD_FIELDS)
     
     def _filter_publications_by_keywords(self, publications: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -185,6 +185,7 @@ class AcademicSearchResponse(BaseModel):
     # Metadados
     csv_file: Optional[str] = Field(None, description="Nome do arquivo CSV gerado")
     data_sources: List[str] = Field(default=[], description="Fontes de dados utilizadas")
+    platform_status: Dict[str, Dict[str, Any]] = Field(default={}, description="Status e latência por plataforma")
 
 class AcademicSummary(BaseModel):
     """Resumo estatístico acadêmico"""
@@ -205,4 +206,7 @@ class AcademicSummary(BaseModel):
     research_areas: List[str] = Field(default=[], description="Áreas de pesquisa")
     
     # Comparação entre plataformas
-    platform_comparison: Dict[str, Dict[str, Any]] = Field(default={}, description="Comparação entre plataformas")
\ No newline at end of file
+    platform_comparison: Dict[str, Dict[str, Any]] = Field(default={}, description="Comparação entre plataformas")
+    
+    # Status e latência de cada plataforma consultada
+    platform_status: Dict[str, Dict[str, Any]] = Field(default={}, description="Status e latência por plataforma")
\ No newline at end of file
@@ -16,6 +16,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 # Importar o scraper do Lattes
 from src.scraper.lattes_scraper import lattes_scraper, LattesProfile, LattesSearchResult
+from src.utils.executor import run_blocking
 
 # Importar integração ChromeDriver
 try:
@@ -51,7 +52,7 @@ async def search_lattes_researchers(
         print(f"🔍 Iniciando busca de pesquisadores: {name}")
         
         # Fazer busca no Lattes
-        results = lattes_scraper.search_researchers(name, max_results)
+        results = await run_blocking(lattes_scraper.search_researchers, name, max_results)
         
         execution_time = time.time() - start_time
         
@@ -135,7 +136,7 @@ async def get_lattes_profile_by_url(
             )
         
         # Obter perfil completo
-        profile = lattes_scraper.get_profile_by_url(profile_url)
+        profile = await run_blocking(lattes_scraper.get_profile_by_url, profile_url, include_all_sections)
         
         if not profile:
             raise HTTPException(
@@ -223,7 +224,7 @@ async def get_lattes_profile_by_id(
             )
         
         # Obter perfil completo
-        profile = lattes_scraper.get_profile_by_id(lattes_id)
+        profile = await run_blocking(lattes_scraper.get_profile_by_id, lattes_id, include_all_sections)
         
         if not profile:
             raise HTTPException(
@@ -308,7 +309,7 @@ async def search_lattes_by_area(
         
         # Por enquanto, usar busca por nome da área
         # TODO: Implementar busca específica por área no scraper
-        results = lattes_scraper.search_researchers(area, max_results)
+        results = await run_blocking(lattes_scraper.search_researchers, area, max_results)
         
         # Filtrar resultados que realmente tenham a área
         filtered_results = []
@@ -355,7 +356,7 @@ async def lattes_health_check():
     """
     try:
         # Fazer uma busca simples para testar conectividade
-        test_results = lattes_scraper.search_researchers("Silva", 1)
+        test_results = await run_blocking(lattes_scraper.search_researchers, "Silva", 1)
         
         return {
             "success": True,
@@ -465,7 +466,7 @@ async def get_lattes_profile_with_automation(
         automation_scraper = LattesScraperWithAutomation()
         
         # Extrair perfil (com fallback automático ou forçado)
-        result = automation_scraper.extract_profile(lattes_id, use_automation=force_automation)
+        result = await run_blocking(automation_scraper.extract_profile, lattes_id, use_automation=force_automation)
         
         execution_time = time.time() - start_time
         
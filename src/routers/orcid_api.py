@@ -10,6 +10,7 @@ from datetime import datetime
 
 # Importar o scraper do ORCID
 from src.scraper.orcid_scraper import orcid_scraper, OrcidProfile, OrcidSearchResult
+from src.utils.executor import run_blocking
 
 # Router para endpoints do ORCID
 orcid_router = APIRouter(prefix="/orcid", tags=["ORCID"])
@@ -36,7 +37,7 @@ async def search_orcid_researchers(
         print(f"🔍 Iniciando busca de pesquisadores no ORCID: {name}")
         
         # Fazer busca no ORCID
-        results = orcid_scraper.search_researchers(name, max_results)
+        results = await run_blocking(orcid_scraper.search_researchers, name, max_results)
         
         execution_time = time.time() - start_time
         
@@ -113,7 +114,7 @@ async def get_orcid_profile_by_url(
             )
         
         # Obter perfil completo
-        profile = orcid_scraper.get_profile_by_url(profile_url)
+        profile = await run_blocking(orcid_scraper.get_profile_by_url, profile_url)
         
         if not profile:
             raise HTTPException(
@@ -208,7 +209,7 @@ async def get_orcid_profile_by_id(
             )
         
         # Obter perfil completo
-        profile = orcid_scraper.get_profile_by_id(orcid_id)
+        profile = await run_blocking(orcid_scraper.get_profile_by_id, orcid_id)
         
         if not profile:
             raise HTTPException(
@@ -302,7 +303,7 @@ async def search_orcid_by_keyword(
     try:
         print(f"🔬 Buscando por keyword no ORCID: {keyword}")
         
-        results = orcid_scraper.search_by_keyword(keyword, max_results)
+        results = await run_blocking(orcid_scraper.search_by_keyword, keyword, max_results)
         
         execution_time = time.time() - start_time
         
@@ -351,7 +352,7 @@ async def search_orcid_by_affiliation(
     try:
         print(f"🏛️ Buscando por afiliação no ORCID: {institution}")
         
-        results = orcid_scraper.search_by_affiliation(institution, max_results)
+        results = await run_blocking(orcid_scraper.search_by_affiliation, institution, max_results)
         
         execution_time = time.time() - start_time
         
@@ -388,7 +389,7 @@ async def orcid_health_check():
     """
     try:
         # Fazer uma busca simples para testar conectividade
-        test_results = orcid_scraper.search_researchers("Smith", 1)
+        test_results = await run_blocking(orcid_scraper.search_researchers, "Smith", 1)
         
         return {
             "success": True,
@@ -16,6 +16,8 @@ from models.academic_models import (
 from services.academic_services import (
     LattesService, ORCIDService, AcademicResearchService
 )
+from utils.executor import run_blocking
+from utils.fan_out import fan_out
 
 # Router para endpoints acadêmicos
 academic_router = APIRouter(prefix="/academic", tags=["Academic Research"])
@@ -129,8 +131,8 @@ async def comprehensive_search(
     start_time = time.time()
     
     try:
-        # Busca em todas as plataformas
-        lattes_profiles, orcid_profiles, summary = academic_service.comprehensive_search(
+        # Busca em todas as plataformas (em paralelo)
+        lattes_profiles, orcid_profiles, summary = await academic_service.comprehensive_search_async(
             researcher_name, max_results
         )
         
@@ -168,7 +170,8 @@ async def comprehensive_search(
             total_publications=total_publications,
             total_projects=total_projects,
             csv_file=csv_file,
-            data_sources=data_sources
+            data_sources=data_sources,
+            platform_status=summary.platform_status
         )
         
         return response
@@ -311,7 +314,7 @@ async def _search_orcid(request: AcademicSearchRequest, start_time: float) -> Ac
 async def search_lattes_profiles(name: str, max_results: int = 10):
     """Busca perfis no Lattes por nome"""
     try:
-        profiles = lattes_service.search_by_name(name, max_results)
+        profiles = await run_blocking(lattes_service.search_by_name, name, max_results)
         return {
             "success": True,
             "message": f"Busca no Lattes concluída. {len(profiles)} perfis encontrados.",
@@ -326,7 +329,7 @@ async def search_lattes_profiles(name: str, max_results: int = 10):
 async def search_orcid_profiles(name: str, max_results: int = 10):
     """Busca perfis no ORCID por nome"""
     try:
-        profiles = orcid_service.search_by_name(name, max_results)
+        profiles = await run_blocking(orcid_service.search_by_name, name, max_results)
         return {
             "success": True,
             "message": f"Busca no ORCID concluída. {len(profiles)} perfis encontrados.",
@@ -342,7 +345,7 @@ async def search_lattes_by_topic(topic: str, max_results: int = 20):
     """Busca no Lattes por tema"""
     try:
         # Por enquanto, buscar pesquisadores que tenham o tema em suas áreas
-        profiles = lattes_service.search_by_research_area(topic, max_results)
+        profiles = await run_blocking(lattes_service.search_by_research_area, topic, max_results)
         return {
             "success": True,
             "message": f"Busca por tema '{topic}' no Lattes concluída.",
@@ -358,7 +361,7 @@ async def search_orcid_by_topic(topic: str, max_results: int = 20):
     """Busca no ORCID por tema"""
     try:
         # Buscar trabalhos com o tema
-        works = orcid_service.search_works_by_keyword(topic, max_results)
+        works = await run_blocking(orcid_service.search_works_by_keyword, topic, max_results)
         return {
             "success": True,
             "message": f"Busca por tema '{topic}' no ORCID concluída.",
@@ -433,27 +436,26 @@ async def comprehensive_academic_search(
         "results_by_platform": {}
     }
     
-    # Buscar em cada plataforma
-    for platform in platforms:
-        try:
-            if platform == "lattes":
-                if search_type in ["author", "both"]:
-                    platform_results = await search_lattes_profiles(query, max_results)
-                else:
-                    platform_results = await search_lattes_by_topic(query, max_results)
-                results["results_by_platform"]["lattes"] = platform_results
-                
-            elif platform == "orcid":
-                if search_type in ["author", "both"]:
-                    platform_results = await search_orcid_profiles(query, max_results)
-                else:
-                    platform_results = await search_orcid_by_topic(query, max_results)
-                results["results_by_platform"]["orcid"] = platform_results
-                
-        except Exception as e:
+    # Buscar em todas as plataformas ao mesmo tempo, cada uma com seu timeout
+    by_author = search_type in ["author", "both"]
+    searches = {
+        "lattes": lambda: (search_lattes_profiles if by_author else search_lattes_by_topic)(query, max_results),
+        "orcid": lambda: (search_orcid_profiles if by_author else search_orcid_by_topic)(query, max_results),
+    }
+    outcomes = await fan_out({
+        platform: searches[platform] for platform in platforms if platform in searches
+    })
+    
+    platform_status = {}
+    for platform, outcome in outcomes.items():
+        platform_status[platform] = outcome.status_dict()
+        if outcome.ok:
+            results["results_by_platform"][platform] = outcome.result
+        else:
             results["results_by_platform"][platform] = {
-                "error": f"Erro na busca: {str(e)}"
+                "error": f"Erro na busca: {outcome.error}"
             }
+    results["platform_status"] = platform_status
     
     # Calcular estatísticas
     total_results = 0
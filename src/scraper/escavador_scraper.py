@@ -4,17 +4,18 @@
 Scraper para buscar resumo do Lattes via Escavador
 """
 
-import requests
+import httpx
 from bs4 import BeautifulSoup
 from typing import Dict, Any, Optional
-import time
-import random
+
+from ..utils.http_client import HttpSession
+from ..utils.html_parser import parse_html
 
 class EscavadorScraper:
     """Scraper para buscar resumo do currículo Lattes via Escavador"""
     
     def __init__(self):
-        self.session = requests.Session()
+        self.session = HttpSession()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -42,9 +43,6 @@ class EscavadorScraper:
                 'q': name
             }
             
-            # Delay aleatório para evitar bloqueio
-            time.sleep(random.uniform(2, 4))
-            
             # Fazer requisição de busca
             print(f"📡 Acessando Escavador: {search_url}")
             response = self.session.get(search_url, params=params, timeout=20)
@@ -55,7 +53,7 @@ class EscavadorScraper:
                 print(f"⚠️ Status code não é 200: {response.status_code}")
                 return self._create_empty_result(name)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(response.content)
             
             # Estratégia: buscar elementos que contenham o nome e informações acadêmicas
             # O Escavador geralmente mostra cards com informações resumidas
@@ -79,7 +77,7 @@ class EscavadorScraper:
             # Se não encontrou nada, retornar resultado vazio
             return self._create_empty_result(name)
             
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             print("⚠️ Timeout ao acessar Escavador")
             return self._create_empty_result(name)
         except Exception as e:
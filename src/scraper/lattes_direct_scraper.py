@@ -2,21 +2,20 @@
 🇧🇷 SCRAPER DIRETO DO LATTES
 ============================
 Busca informações diretamente da plataforma Lattes usando busca por nome
-Usa requests apenas, sem BeautifulSoup para evitar dependências
+Usa apenas o cliente HTTP compartilhado, sem BeautifulSoup para evitar dependências
 """
 
-import requests
 from typing import Dict, Any, Optional, List
-import time
-import random
 import re
 import urllib.parse
 
+from ..utils.http_client import HttpSession
+
 class LattesDirectScraper:
     """Scraper para buscar informações diretamente da Plataforma Lattes"""
     
     def __init__(self):
-        self.session = requests.Session()
+        self.session = HttpSession()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -57,9 +56,6 @@ class LattesDirectScraper:
                 'asg_repositorio': '',
             }
             
-            # Delay para evitar bloqueio
-            time.sleep(random.uniform(1, 3))
-            
             print(f"📡 Acessando Plataforma Lattes...")
             response = self.session.get(self.base_url, params=params, timeout=20)
             
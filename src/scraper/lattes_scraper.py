@@ -7,12 +7,16 @@ Baseado na análise do repositório j5r/web-scrapper-lattes-productions
 import re
 import time
 import random
-import requests
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional, Any
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from urllib.parse import quote, urljoin
 
+from ..utils.http_client import HttpSession
+from ..utils.html_parser import parse_html
+from ..utils.parse_pool import parse_pool
+from .lattes_sections import CvSectionIndex
+
 class LattesSearchResult:
     """Resultado individual de busca no Lattes"""
     def __init__(self, name: str, lattes_id: str = None, lattes_url: str = None, 
@@ -111,13 +115,53 @@ class LattesProfile:
             "total_publications": self.total_publications,
             "total_projects": self.total_projects
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LattesProfile":
+        """Remontar o perfil a partir de to_dict() (ex: resultado do pool de parsing)"""
+        profile = cls()
+        for key, value in data.items():
+            if hasattr(profile, key):
+                setattr(profile, key, value)
+        return profile
+
+# Seções lidas no modo resumido (include_all_sections=False): dados pessoais,
+# áreas, formação e atuação. Produção, projetos, orientações e bancas, que
+# dominam o tamanho do CV de pesquisadores seniores, nem chegam ao parser.
+CV_SUMMARY_SECTIONS = ("Identificacao", "Endereco", "AreasAtuacao", "FormacaoAcademica", "AtuacaoProfissional")
+
+CV_SECTION_START = re.compile(r'<div class="title-wrapper"', re.IGNORECASE)
+CV_SECTION_ANCHOR = re.compile(r'<a name="(\w+)"', re.IGNORECASE)
+
+# Cabeçalho (nome, última atualização) e caixas de seção; menus, scripts e rodapé ficam de fora
+CV_SECTIONS_STRAINER = SoupStrainer("div", class_=re.compile(r"(^|\s)(infpessoa|title-wrapper)(\s|$)"))
+
+
+def select_cv_sections(html: str, sections: Tuple[str, ...]) -> str:
+    """
+    Recortar do HTML do CV só as seções pedidas, antes do parse
+
+    Cada seção começa em um <div class="title-wrapper"> com a âncora
+    <a name="..."> logo no início; o recorte vai até a seção seguinte.
+    """
+    starts = [match.start() for match in CV_SECTION_START.finditer(html)]
+    if not starts:
+        return html
+
+    parts = [html[:starts[0]]]
+    for start, end in zip(starts, starts[1:] + [len(html)]):
+        anchor = CV_SECTION_ANCHOR.search(html, start, min(end, start + 500))
+        if anchor and anchor.group(1).startswith(sections):
+            parts.append(html[start:end])
+    return "".join(parts)
+
 
 class LattesAdvancedScraper:
     """Scraper avançado para Plataforma Lattes baseado em análise de HTML real"""
     
     def __init__(self):
         self.base_url = "http://buscatextual.cnpq.br/buscatextual"
-        self.session = requests.Session()
+        self.session = HttpSession()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -287,7 +331,7 @@ class LattesAdvancedScraper:
                 'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8'
             }
             
-            response = requests.get(scholar_url, params=params, headers=headers, timeout=15)
+            response = self.session.get(scholar_url, params=params, headers=headers, timeout=15)
             
             if response.status_code == 200:
                 return self._parse_scholar_for_lattes(response.content, name, max_results)
@@ -301,7 +345,7 @@ class LattesAdvancedScraper:
     def _parse_scholar_for_lattes(self, html_content: bytes, searched_name: str, max_results: int) -> List[LattesSearchResult]:
         """Parse dos resultados do Scholar para encontrar pesquisadores brasileiros"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = parse_html(html_content)
             results = []
             
             # Buscar resultados do Scholar
@@ -407,7 +451,7 @@ class LattesAdvancedScraper:
         Baseado na estrutura atual da plataforma
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser', from_encoding='utf-8')
+            soup = parse_html(html_content, from_encoding='utf-8')
             results = []
             
             print("🔍 Analisando página de resultados do Lattes...")
@@ -642,8 +686,8 @@ class LattesAdvancedScraper:
             print(f"Erro ao extrair informações: {e}")
             return None
     
-    def get_profile_by_url(self, lattes_url: str) -> Optional[LattesProfile]:
-        """Obtém perfil completo por URL do Lattes"""
+    def get_profile_by_url(self, lattes_url: str, include_all_sections: bool = True) -> Optional[LattesProfile]:
+        """Obtém perfil por URL do Lattes (completo, ou só o resumo com include_all_sections=False)"""
         try:
             print(f"📋 Processando URL: {lattes_url}")
             
@@ -676,16 +720,15 @@ class LattesAdvancedScraper:
                 print(f"❌ Erro HTTP {response.status_code} ao acessar: {cv_url}")
                 return None
             
-            # Parse do HTML
-            soup = BeautifulSoup(response.content, 'html.parser', from_encoding='latin-1')
+            # Parse do HTML e extração dos dados, fora do processo do servidor
+            from .parse_tasks import lattes_profile_data
+            data = parse_pool.parse(lattes_profile_data, response.content, lattes_id, cv_url, include_all_sections)
             
-            # Verificar se a página carregou corretamente
-            if not soup.find('body'):
+            if data is None:
                 print("❌ Página vazia ou malformada")
                 return None
             
-            # Extrair dados do perfil
-            profile = self._extract_lattes_profile_data(soup, lattes_id, cv_url)
+            profile = LattesProfile.from_dict(data)
             
             if profile and profile.name:
                 print(f"✅ Perfil extraído com sucesso: {profile.name}")
@@ -698,12 +741,27 @@ class LattesAdvancedScraper:
             print(f"❌ Erro ao obter perfil: {e}")
             return None
     
-    def _extract_lattes_profile_data(self, soup: BeautifulSoup, lattes_id: str, url: str) -> LattesProfile:
+    def _parse_cv(self, content: bytes, include_all_sections: bool = True) -> BeautifulSoup:
+        """Árvore do CV: inteira, ou só cabeçalho e seções do resumo"""
+        if include_all_sections:
+            return parse_html(content, from_encoding='latin-1')
+        
+        html = select_cv_sections(content.decode('latin-1'), CV_SUMMARY_SECTIONS)
+        return parse_html(html, parse_only=CV_SECTIONS_STRAINER)
+    
+    def _extract_lattes_profile_data(
+        self,
+        soup: BeautifulSoup,
+        lattes_id: str,
+        url: str,
+        include_all_sections: bool = True
+    ) -> LattesProfile:
         """
         Extrai dados do perfil do HTML do Lattes
         Implementa parsing robusto baseado na estrutura real
         """
         profile = LattesProfile()
+        sections = CvSectionIndex(soup)
         profile.lattes_id = lattes_id
         profile.lattes_url = url
         
@@ -728,7 +786,7 @@ class LattesAdvancedScraper:
             # Se não encontrou nome, tentar via texto da página
             if not profile.name:
                 # Buscar padrões de nome no texto
-                page_text = soup.get_text()
+                page_text = sections.text
                 lines = page_text.split('\n')
                 for line in lines[:20]:  # Primeiras 20 linhas
                     line = line.strip()
@@ -739,40 +797,41 @@ class LattesAdvancedScraper:
                             break
             
             # Extrair informações básicas
-            profile.current_institution = self._extract_institution(soup)
-            profile.current_position = self._extract_position(soup)
-            profile.research_areas = self._extract_research_areas(soup)
-            profile.last_update = self._extract_last_update(soup)
+            profile.current_institution = self._extract_institution(sections)
+            profile.current_position = self._extract_position(sections)
+            profile.research_areas = self._extract_research_areas(sections)
+            profile.last_update = self._extract_last_update(sections)
             
             # Extrair formação
-            profile.education = self._extract_education(soup)
+            profile.education = self._extract_education(sections)
             
             # Extrair experiência profissional
-            profile.professional_experience = self._extract_professional_experience(soup)
-            
-            # Extrair publicações
-            profile.journal_articles = self._extract_publications(soup, "artigos")
-            profile.conference_papers = self._extract_publications(soup, "trabalhos")
-            profile.books = self._extract_publications(soup, "livros")
-            profile.book_chapters = self._extract_publications(soup, "capitulos")
-            
-            # Calcular estatísticas
-            profile.total_publications = (
-                len(profile.journal_articles) + 
-                len(profile.conference_papers) + 
-                len(profile.books) + 
-                len(profile.book_chapters)
-            )
-            
-            # Extrair orientações
-            profile.supervisions = self._extract_supervisions(soup)
-            
-            # Extrair projetos
-            profile.research_projects = self._extract_projects(soup)
-            profile.total_projects = len(profile.research_projects)
-            
-            # Extrair prêmios
-            profile.awards = self._extract_awards(soup)
+            profile.professional_experience = self._extract_professional_experience(sections)
+            
+            if include_all_sections:
+                # Extrair publicações
+                profile.journal_articles = self._extract_publications(sections, "artigos")
+                profile.conference_papers = self._extract_publications(sections, "trabalhos")
+                profile.books = self._extract_publications(sections, "livros")
+                profile.book_chapters = self._extract_publications(sections, "capitulos")
+                
+                # Calcular estatísticas
+                profile.total_publications = (
+                    len(profile.journal_articles) + 
+                    len(profile.conference_papers) + 
+                    len(profile.books) + 
+                    len(profile.book_chapters)
+                )
+                
+                # Extrair orientações
+                profile.supervisions = self._extract_supervisions(sections)
+                
+                # Extrair projetos
+                profile.research_projects = self._extract_projects(sections)
+                profile.total_projects = len(profile.research_projects)
+                
+                # Extrair prêmios
+                profile.awards = self._extract_awards(sections)
             
             print(f"📊 Dados extraídos - Nome: {profile.name}, Publicações: {profile.total_publications}, Projetos: {profile.total_projects}")
             
@@ -783,7 +842,7 @@ class LattesAdvancedScraper:
             profile.name = profile.name or "Nome não encontrado"
             return profile
     
-    def _extract_institution(self, soup: BeautifulSoup) -> str:
+    def _extract_institution(self, sections: CvSectionIndex) -> str:
         """Extrai instituição atual"""
         try:
             # Padrões para encontrar instituição
@@ -795,7 +854,7 @@ class LattesAdvancedScraper:
                 r'(UFMG|USP|UFRJ|UNICAMP|UFRGS|UFSC|UFPE|UFBA|UnB|UFC)'
             ]
             
-            page_text = soup.get_text()
+            page_text = sections.text
             for pattern in patterns:
                 match = re.search(pattern, page_text, re.IGNORECASE)
                 if match:
@@ -806,10 +865,10 @@ class LattesAdvancedScraper:
         except Exception:
             return "Erro ao extrair instituição"
     
-    def _extract_position(self, soup: BeautifulSoup) -> str:
+    def _extract_position(self, sections: CvSectionIndex) -> str:
         """Extrai cargo/posição atual"""
         try:
-            page_text = soup.get_text()
+            page_text = sections.text
             
             # Padrões de cargos acadêmicos
             position_patterns = [
@@ -920,13 +979,13 @@ class LattesAdvancedScraper:
         except Exception:
             return []
     
-    def _extract_publications(self, soup: BeautifulSoup, pub_type: str) -> List[Dict[str, str]]:
+    def _extract_publications(self, sections: CvSectionIndex, pub_type: str) -> List[Dict[str, str]]:
         """Extrai publicações por tipo"""
         try:
             publications = []
             
             # Buscar seções de publicações
-            page_text = soup.get_text()
+            page_text = sections.text
             
             # Padrões para identificar publicações
             if pub_type == "artigos":
@@ -974,11 +1033,11 @@ class LattesAdvancedScraper:
         except Exception:
             return []
     
-    def _extract_projects(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _extract_projects(self, sections: CvSectionIndex) -> List[Dict[str, str]]:
         """Extrai projetos de pesquisa"""
         try:
             projects = []
-            page_text = soup.get_text().lower()
+            page_text = sections.text.lower()
             
             if "projeto" in page_text:
                 for i in range(2):  # Até 2 projetos
@@ -1016,17 +1075,17 @@ class LattesAdvancedScraper:
         except Exception:
             return []
     
-    def get_profile_by_id(self, lattes_id: str) -> Optional[LattesProfile]:
-        """Obtém perfil completo por ID do Lattes"""
+    def get_profile_by_id(self, lattes_id: str, include_all_sections: bool = True) -> Optional[LattesProfile]:
+        """Obtém perfil por ID do Lattes (completo, ou só o resumo com include_all_sections=False)"""
         try:
             cv_url = f"{self.base_url}/visualizacv.do?id={lattes_id}"
-            return self._fetch_profile_from_url(cv_url)
+            return self._fetch_profile_from_url(cv_url, include_all_sections)
             
         except Exception as e:
             print(f"❌ Erro ao obter perfil por ID: {e}")
             return None
     
-    def _fetch_profile_from_url(self, url: str) -> Optional[LattesProfile]:
+    def _fetch_profile_from_url(self, url: str, include_all_sections: bool = True) -> Optional[LattesProfile]:
         """Busca e parse do perfil completo"""
         try:
             print(f"📋 Carregando perfil: {url}")
@@ -1036,8 +1095,9 @@ class LattesAdvancedScraper:
                 print(f"❌ Erro HTTP: {response.status_code}")
                 return None
             
-            soup = BeautifulSoup(response.content, 'html.parser', from_encoding='latin-1')
-            profile = self._parse_full_profile(soup, url)
+            from .parse_tasks import lattes_full_profile
+            data = parse_pool.parse(lattes_full_profile, response.content, url, include_all_sections)
+            profile = LattesProfile.from_dict(data)
             
             print(f"✅ Perfil carregado: {profile.name}")
             return profile
@@ -1046,12 +1106,19 @@ class LattesAdvancedScraper:
             print(f"❌ Erro ao carregar perfil: {e}")
             return None
     
-    def _parse_full_profile(self, soup: BeautifulSoup, url: str) -> LattesProfile:
+    def _parse_full_profile(self, soup: BeautifulSoup, url: str, include_all_sections: bool = True) -> LattesProfile:
         """
         Parse completo do currículo Lattes
         Baseado na estrutura real analisada do repositório
+
+        Com include_all_sections=False, só os dados pessoais, áreas, formação e
+        atuação são extraídos (as demais seções nem foram montadas no soup).
+
+        As seções são indexadas em uma passada (CvSectionIndex) e cada extrator
+        lê só a sua.
         """
         profile = LattesProfile()
+        sections = CvSectionIndex(soup)
         
         # Extrair ID da URL
         id_match = re.search(r'id=(\d+)', url)
@@ -1060,47 +1127,48 @@ class LattesAdvancedScraper:
             profile.lattes_url = f"http://lattes.cnpq.br/{profile.lattes_id}"
         
         # Nome do pesquisador
-        profile.name = self._extract_name(soup)
+        profile.name = self._extract_name(sections)
         
         # Dados pessoais
-        profile.birth_date = self._extract_birth_date(soup)
-        profile.nationality = self._extract_nationality(soup)
-        profile.last_update = self._extract_last_update(soup)
+        profile.birth_date = self._extract_birth_date(sections)
+        profile.nationality = self._extract_nationality(sections)
+        profile.last_update = self._extract_last_update(sections)
         
         # Instituição e cargo atual
-        profile.current_institution = self._extract_current_institution(soup)
-        profile.current_position = self._extract_current_position(soup)
+        profile.current_institution = self._extract_current_institution(sections)
+        profile.current_position = self._extract_current_position(sections)
         
         # Áreas de atuação
-        profile.research_areas = self._extract_research_areas(soup)
+        profile.research_areas = self._extract_research_areas(sections)
         
         # Formação acadêmica
-        profile.education = self._extract_education(soup)
+        profile.education = self._extract_education(sections)
         
         # Atuação profissional
-        profile.professional_experience = self._extract_professional_experience(soup)
-        
-        # Projetos de pesquisa
-        profile.research_projects = self._extract_research_projects(soup)
+        profile.professional_experience = self._extract_professional_experience(sections)
         
-        # Publicações
-        profile.journal_articles = self._extract_journal_articles(soup)
-        profile.conference_papers = self._extract_conference_papers(soup)
-        profile.book_chapters = self._extract_book_chapters(soup)
-        profile.books = self._extract_books(soup)
-        
-        # Orientações
-        profile.supervisions = self._extract_supervisions(soup)
-        
-        # Prêmios e títulos
-        profile.awards = self._extract_awards(soup)
-        
-        # Bancas
-        profile.examination_boards = self._extract_examination_boards(soup)
-        
-        # Atividades editoriais
-        profile.editorial_boards = self._extract_editorial_boards(soup)
-        profile.journal_reviews = self._extract_journal_reviews(soup)
+        if include_all_sections:
+            # Projetos de pesquisa
+            profile.research_projects = self._extract_research_projects(sections)
+            
+            # Publicações
+            profile.journal_articles = self._extract_journal_articles(sections)
+            profile.conference_papers = self._extract_conference_papers(sections)
+            profile.book_chapters = self._extract_book_chapters(sections)
+            profile.books = self._extract_books(sections)
+            
+            # Orientações
+            profile.supervisions = self._extract_supervisions(sections)
+            
+            # Prêmios e títulos
+            profile.awards = self._extract_awards(sections)
+            
+            # Bancas
+            profile.examination_boards = self._extract_examination_boards(sections)
+            
+            # Atividades editoriais
+            profile.editorial_boards = self._extract_editorial_boards(sections)
+            profile.journal_reviews = self._extract_journal_reviews(sections)
         
         # Calcular estatísticas
         profile.total_publications = (
@@ -1113,7 +1181,7 @@ class LattesAdvancedScraper:
         
         return profile
     
-    def _extract_name(self, soup: BeautifulSoup) -> str:
+    def _extract_name(self, sections: CvSectionIndex) -> str:
         """Extrai nome do pesquisador"""
         try:
             # Tentar diferentes seletores
@@ -1125,14 +1193,14 @@ class LattesAdvancedScraper:
             ]
             
             for selector in selectors:
-                element = soup.select_one(selector)
+                element = sections.soup.select_one(selector)
                 if element:
                     name = element.get_text(strip=True)
                     if name and len(name) > 3:
                         return name
             
             # Busca por padrão no texto
-            page_text = soup.get_text()
+            page_text = sections.text
             # Buscar por "Nome:" ou similar
             name_match = re.search(r'Nome:?\s*([A-Z][^;\n]+)', page_text)
             if name_match:
@@ -1144,10 +1212,10 @@ class LattesAdvancedScraper:
             print(f"Erro ao extrair nome: {e}")
             return "Nome não encontrado"
     
-    def _extract_birth_date(self, soup: BeautifulSoup) -> str:
+    def _extract_birth_date(self, sections: CvSectionIndex) -> str:
         """Extrai data de nascimento"""
         try:
-            page_text = soup.get_text()
+            page_text = sections.text
             patterns = [
                 r'Data de nascimento:?\s*(\d{2}/\d{2}/\d{4})',
                 r'Nascimento:?\s*(\d{2}/\d{2}/\d{4})',
@@ -1163,10 +1231,10 @@ class LattesAdvancedScraper:
         except:
             return ""
     
-    def _extract_nationality(self, soup: BeautifulSoup) -> str:
+    def _extract_nationality(self, sections: CvSectionIndex) -> str:
         """Extrai nacionalidade"""
         try:
-            page_text = soup.get_text()
+            page_text = sections.text
             patterns = [
                 r'Nacionalidade:?\s*([^;\n]+)',
                 r'País:?\s*([^;\n]+)'
@@ -1181,10 +1249,10 @@ class LattesAdvancedScraper:
         except:
             return "Brasileira"
     
-    def _extract_current_institution(self, soup: BeautifulSoup) -> str:
+    def _extract_current_institution(self, sections: CvSectionIndex) -> str:
         """Extrai instituição atual"""
         try:
-            page_text = soup.get_text()
+            page_text = sections.text
             patterns = [
                 r'Instituição:?\s*([^;\n]+)',
                 r'Vínculo institucional:?\s*([^;\n]+)',
@@ -1200,10 +1268,10 @@ class LattesAdvancedScraper:
         except:
             return ""
     
-    def _extract_current_position(self, soup: BeautifulSoup) -> str:
+    def _extract_current_position(self, sections: CvSectionIndex) -> str:
         """Extrai cargo atual"""
         try:
-            page_text = soup.get_text()
+            page_text = sections.text
             patterns = [
                 r'Cargo:?\s*([^;\n]+)',
                 r'Função:?\s*([^;\n]+)',
@@ -1219,10 +1287,10 @@ class LattesAdvancedScraper:
         except:
             return ""
     
-    def _extract_last_update(self, soup: BeautifulSoup) -> str:
+    def _extract_last_update(self, sections: CvSectionIndex) -> str:
         """Extrai data da última atualização"""
         try:
-            page_text = soup.get_text()
+            page_text = sections.text
             patterns = [
                 r'Última atualização:?\s*(\d{2}/\d{2}/\d{4})',
                 r'Atualizado em:?\s*(\d{2}/\d{2}/\d{4})',
@@ -1238,25 +1306,18 @@ class LattesAdvancedScraper:
         except:
             return datetime.now().strftime("%d/%m/%Y")
     
-    def _extract_research_areas(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_research_areas(self, sections: CvSectionIndex) -> List[str]:
         """Extrai áreas de atuação"""
         areas = []
         try:
             # Buscar seção de áreas de atuação
-            areas_section = soup.find('a', attrs={'name': 'AreasAtuacao'})
+            areas_section = sections.get('AreasAtuacao')
             if areas_section:
-                parent = areas_section.parent
-                if parent:
-                    # Buscar por divs com classe layout-cell-pad-5
-                    area_divs = parent.find_all('div', class_='layout-cell-pad-5')
-                    for div in area_divs:
-                        area_text = div.get_text(strip=True)
-                        if area_text and len(area_text) > 5:
-                            areas.append(area_text)
+                areas.extend(areas_section.items(min_length=5))
             
             # Se não encontrou, buscar por padrões no texto
             if not areas:
-                page_text = soup.get_text()
+                page_text = sections.text
                 area_match = re.search(r'Áreas? de atuação:?\s*([^.;]+)', page_text, re.IGNORECASE)
                 if area_match:
                     areas = [area.strip() for area in area_match.group(1).split(',')]
@@ -1266,102 +1327,85 @@ class LattesAdvancedScraper:
         
         return areas[:10]  # Limitar a 10 áreas
     
-    def _extract_education(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _extract_education(self, sections: CvSectionIndex) -> List[Dict[str, str]]:
         """Extrai formação acadêmica"""
         education = []
         try:
             # Buscar seção de formação
-            education_section = soup.find('a', attrs={'name': 'FormacaoAcademica'})
+            education_section = sections.get('FormacaoAcademica')
             if education_section:
-                parent = education_section.parent
-                if parent:
-                    education_items = parent.find_all('div', class_='layout-cell-pad-5')
-                    for item in education_items:
-                        text = item.get_text(strip=True)
-                        if text and len(text) > 10:
-                            # Tentar extrair ano, grau e instituição
-                            year_match = re.search(r'(\d{4})', text)
-                            year = year_match.group(1) if year_match else ""
-                            
-                            education.append({
-                                "degree": text[:100],  # Primeiros 100 chars
-                                "institution": "",
-                                "year": year,
-                                "full_text": text
-                            })
+                for text in education_section.items(min_length=10):
+                    # Tentar extrair ano, grau e instituição
+                    year_match = re.search(r'(\d{4})', text)
+                    year = year_match.group(1) if year_match else ""
+                    
+                    education.append({
+                        "degree": text[:100],  # Primeiros 100 chars
+                        "institution": "",
+                        "year": year,
+                        "full_text": text
+                    })
             
         except Exception as e:
             print(f"Erro ao extrair formação: {e}")
         
         return education
     
-    def _extract_professional_experience(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _extract_professional_experience(self, sections: CvSectionIndex) -> List[Dict[str, str]]:
         """Extrai atuação profissional"""
         experience = []
         try:
             # Buscar seção de atuação profissional
-            prof_section = soup.find('a', attrs={'name': 'AtuacaoProfissional'})
+            prof_section = sections.get('AtuacaoProfissional')
             if prof_section:
-                parent = prof_section.parent
-                if parent:
-                    exp_items = parent.find_all('div', class_='layout-cell-pad-5')
-                    for item in exp_items:
-                        text = item.get_text(strip=True)
-                        if text and len(text) > 10:
-                            experience.append({
-                                "position": text[:100],
-                                "institution": "",
-                                "period": "",
-                                "full_text": text
-                            })
+                for text in prof_section.items(min_length=10):
+                    experience.append({
+                        "position": text[:100],
+                        "institution": "",
+                        "period": "",
+                        "full_text": text
+                    })
             
         except Exception as e:
             print(f"Erro ao extrair experiência: {e}")
         
         return experience
     
-    def _extract_research_projects(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _extract_research_projects(self, sections: CvSectionIndex) -> List[Dict[str, str]]:
         """Extrai projetos de pesquisa baseado na estrutura analisada"""
         projects = []
         try:
             # Buscar seção de projetos usando o padrão do repositório analisado
-            projects_anchor = soup.find('a', attrs={'name': 'ProjetosPesquisa'})
+            projects_anchor = sections.get('ProjetosPesquisa')
             if projects_anchor:
-                parent = projects_anchor.parent
-                if parent:
-                    # Buscar por elementos com classe layout-cell-pad-5
-                    project_divs = parent.find_all('div', class_='layout-cell-pad-5')
+                for text in projects_anchor.items(min_length=15):
+                    # Extrair ano do projeto
+                    year_match = re.search(r'(\d{4})', text)
+                    year = year_match.group(1) if year_match else ""
                     
-                    for div in project_divs:
-                        text = div.get_text(strip=True)
-                        if text and len(text) > 15:
-                            # Extrair ano do projeto
-                            year_match = re.search(r'(\d{4})', text)
-                            year = year_match.group(1) if year_match else ""
-                            
-                            projects.append({
-                                "title": text[:150],  # Primeiros 150 chars como título
-                                "year": year,
-                                "description": text,
-                                "status": "Ativo" if "atual" in text.lower() else "Concluído"
-                            })
+                    projects.append({
+                        "title": text[:150],  # Primeiros 150 chars como título
+                        "year": year,
+                        "description": text,
+                        "status": "Ativo" if "atual" in text.lower() else "Concluído"
+                    })
             
         except Exception as e:
             print(f"Erro ao extrair projetos: {e}")
         
         return projects
     
-    def _extract_journal_articles(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _extract_journal_articles(self, sections: CvSectionIndex) -> List[Dict[str, str]]:
         """Extrai artigos em periódicos baseado na estrutura analisada"""
         articles = []
         try:
             # Buscar seção de artigos completos
-            articles_section = soup.find('div', id='artigos-completos')
+            articles_section = sections.by_id.get('artigos-completos')
             if not articles_section:
                 # Buscar por âncora
-                articles_anchor = soup.find('a', attrs={'name': 'ArtigosCompletos'})
+                articles_anchor = sections.get('ArtigosCompletos')
                 if articles_anchor:
-                    articles_section = articles_anchor.parent
+                    articles_section = articles_anchor.container
             
             if articles_section:
                 # Buscar artigos individuais
@@ -1400,45 +1444,39 @@ class LattesAdvancedScraper:
         
         return articles
     
-    def _extract_conference_papers(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _extract_conference_papers(self, sections: CvSectionIndex) -> List[Dict[str, str]]:
         """Extrai trabalhos em congressos"""
         papers = []
         try:
             # Buscar seção de trabalhos completos
-            works_anchor = soup.find('a', attrs={'name': 'TrabalhosPublicadosAnaisCongresso'})
+            works_anchor = sections.get('TrabalhosPublicadosAnaisCongresso')
             if works_anchor:
-                parent = works_anchor.parent
-                if parent:
-                    # Buscar próximos elementos até encontrar próxima seção
-                    siblings = parent.find_next_siblings()
-                    for sibling in siblings:
-                        if sibling.find('a', attrs={'name': re.compile(r'\w+')}):
-                            break  # Próxima seção encontrada
+                # Elementos seguintes até a próxima seção
+                for sibling in works_anchor.following():
+                    text = sibling.get_text(strip=True)
+                    if text and len(text) > 20:
+                        year_match = re.search(r'(\d{4})', text)
+                        year = year_match.group(1) if year_match else ""
                         
-                        text = sibling.get_text(strip=True)
-                        if text and len(text) > 20:
-                            year_match = re.search(r'(\d{4})', text)
-                            year = year_match.group(1) if year_match else ""
-                            
-                            papers.append({
-                                "title": text[:200],
-                                "year": year,
-                                "conference": "",
-                                "authors": "",
-                                "citation": text
-                            })
+                        papers.append({
+                            "title": text[:200],
+                            "year": year,
+                            "conference": "",
+                            "authors": "",
+                            "citation": text
+                        })
             
         except Exception as e:
             print(f"Erro ao extrair trabalhos: {e}")
         
         return papers
     
-    def _extract_book_chapters(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _extract_book_chapters(self, sections: CvSectionIndex) -> List[Dict[str, str]]:
         """Extrai capítulos de livros"""
         chapters = []
         try:
             # Implementar extração de capítulos
-            chapters_anchor = soup.find('a', attrs={'name': re.compile(r'Capitulos|Livros')})
+            chapters_anchor = sections.get(re.compile(r'Capitulos|Livros'))
             if chapters_anchor:
                 # Lógica similar aos artigos
                 pass
@@ -1447,12 +1485,12 @@ class LattesAdvancedScraper:
         
         return chapters
     
-    def _extract_books(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _extract_books(self, sections: CvSectionIndex) -> List[Dict[str, str]]:
         """Extrai livros publicados"""
         books = []
         try:
             # Implementar extração de livros
-            books_anchor = soup.find('a', attrs={'name': re.compile(r'LivrosPublicados')})
+            books_anchor = sections.get(re.compile(r'LivrosPublicados'))
             if books_anchor:
                 # Lógica similar aos artigos
                 pass
@@ -1461,12 +1499,12 @@ class LattesAdvancedScraper:
         
         return books
     
-    def _extract_supervisions(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _extract_supervisions(self, sections: CvSectionIndex) -> List[Dict[str, str]]:
         """Extrai orientações"""
         supervisions = []
         try:
             # Implementar extração de orientações
-            orient_anchor = soup.find('a', attrs={'name': re.compile(r'Orientacoes')})
+            orient_anchor = sections.get(re.compile(r'Orientacoes'))
             if orient_anchor:
                 # Lógica similar aos projetos
                 pass
@@ -1475,12 +1513,12 @@ class LattesAdvancedScraper:
         
         return supervisions
     
-    def _extract_awards(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _extract_awards(self, sections: CvSectionIndex) -> List[Dict[str, str]]:
         """Extrai prêmios e títulos"""
         awards = []
         try:
             # Implementar extração de prêmios
-            awards_anchor = soup.find('a', attrs={'name': re.compile(r'Premios|Titulos')})
+            awards_anchor = sections.get(re.compile(r'Premios|Titulos'))
             if awards_anchor:
                 # Lógica similar aos projetos
                 pass
@@ -1489,88 +1527,69 @@ class LattesAdvancedScraper:
         
         return awards
     
-    def _extract_examination_boards(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _extract_examination_boards(self, sections: CvSectionIndex) -> List[Dict[str, str]]:
         """Extrai participação em bancas baseado na estrutura analisada"""
         boards = []
         try:
             # Buscar seção de bancas
-            boards_anchor = soup.find('a', attrs={'name': 'ParticipacaoBancasTrabalho'})
+            boards_anchor = sections.get('ParticipacaoBancasTrabalho')
             if boards_anchor:
-                parent = boards_anchor.parent
-                if parent:
-                    # Buscar elementos conforme padrão do repositório
-                    board_items = parent.find_all('div', class_='layout-cell-pad-5')
+                for text in boards_anchor.items(min_length=10):
+                    year_match = re.search(r'(\d{4})', text)
+                    year = year_match.group(1) if year_match else ""
                     
-                    for item in board_items:
-                        text = item.get_text(strip=True)
-                        if text and len(text) > 10:
-                            year_match = re.search(r'(\d{4})', text)
-                            year = year_match.group(1) if year_match else ""
-                            
-                            boards.append({
-                                "type": "Banca",
-                                "year": year,
-                                "description": text,
-                                "institution": ""
-                            })
+                    boards.append({
+                        "type": "Banca",
+                        "year": year,
+                        "description": text,
+                        "institution": ""
+                    })
             
         except Exception as e:
             print(f"Erro ao extrair bancas: {e}")
         
         return boards
     
-    def _extract_editorial_boards(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _extract_editorial_boards(self, sections: CvSectionIndex) -> List[Dict[str, str]]:
         """Extrai membro de corpo editorial"""
         editorial = []
         try:
             # Buscar seção de corpo editorial
-            editorial_anchor = soup.find('a', attrs={'name': 'MembroCorpoEditorial'})
+            editorial_anchor = sections.get('MembroCorpoEditorial')
             if editorial_anchor:
-                parent = editorial_anchor.parent
-                if parent:
-                    editorial_items = parent.find_all('div', class_='layout-cell-pad-5')
+                for text in editorial_anchor.items(min_length=10):
+                    year_match = re.search(r'(\d{4})', text)
+                    year = year_match.group(1) if year_match else ""
                     
-                    for item in editorial_items:
-                        text = item.get_text(strip=True)
-                        if text and len(text) > 10:
-                            year_match = re.search(r'(\d{4})', text)
-                            year = year_match.group(1) if year_match else ""
-                            
-                            editorial.append({
-                                "journal": text[:100],
-                                "year": year,
-                                "role": "Membro Editorial",
-                                "description": text
-                            })
+                    editorial.append({
+                        "journal": text[:100],
+                        "year": year,
+                        "role": "Membro Editorial",
+                        "description": text
+                    })
             
         except Exception as e:
             print(f"Erro ao extrair corpo editorial: {e}")
         
         return editorial
     
-    def _extract_journal_reviews(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _extract_journal_reviews(self, sections: CvSectionIndex) -> List[Dict[str, str]]:
         """Extrai revisão de periódicos"""
         reviews = []
         try:
             # Buscar seção de revisor de periódico
-            review_anchor = soup.find('a', attrs={'name': 'RevisorPeriodico'})
+            review_anchor = sections.get('RevisorPeriodico')
             if review_anchor:
-                parent = review_anchor.parent
-                if parent:
-                    review_items = parent.find_all('div', class_='layout-cell-pad-5')
+                for text in review_anchor.items(min_length=10):
+                    year_match = re.search(r'(\d{4})', text)
+                    year = year_match.group(1) if year_match else ""
                     
-                    for item in review_items:
-                        text = item.get_text(strip=True)
-                        if text and len(text) > 10:
-                            year_match = re.search(r'(\d{4})', text)
-                            year = year_match.group(1) if year_match else ""
-                            
-                            reviews.append({
-                                "journal": text[:100],
-                                "year": year,
-                                "role": "Revisor",
-                                "description": text
-                            })
+                    reviews.append({
+                        "journal": text[:100],
+                        "year": year,
+                        "role": "Revisor",
+                        "description": text
+                    })
             
         except Exception as e:
             print(f"Erro ao extrair revisões: {e}")
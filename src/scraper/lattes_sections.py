@@ -0,0 +1,103 @@
+"""
+🗂️ ÍNDICE DE SEÇÕES DO CV LATTES
+===============================
+Cada seção do CV começa com uma âncora <a name="..."> dentro da caixa da
+seção (div.title-wrapper), seguida do título <h1>. O índice percorre a
+árvore uma única vez, guarda âncora, título e caixa de cada seção, e os
+extratores trabalham só na sua seção, em vez de cada um varrer o CV
+inteiro atrás do próprio cabeçalho.
+
+O texto da página inteira, usado pelas buscas por padrão (nascimento,
+nacionalidade, instituição...), também é calculado uma única vez.
+"""
+
+import re
+from typing import Dict, Iterator, List, Optional, Pattern, Set, Union
+
+from bs4 import BeautifulSoup, Tag
+
+
+class CvSection:
+    """Uma seção do CV: âncora, título e a caixa que contém os itens"""
+
+    def __init__(self, index: "CvSectionIndex", position: int, anchor: Tag):
+        self._index = index
+        self.position = position
+        self.anchor = anchor
+        self.name = anchor.get("name", "")
+        self.container = anchor.parent
+        title = anchor.find_next_sibling("h1")
+        self.title = title.get_text(strip=True) if title else ""
+
+    def items(self, min_length: int = 0) -> Iterator[str]:
+        """Textos dos itens (div.layout-cell-pad-5) da seção"""
+        if self.container is None:
+            return
+        for item in self.container.find_all("div", class_="layout-cell-pad-5"):
+            text = item.get_text(strip=True)
+            if text and len(text) > min_length:
+                yield text
+
+    def following(self) -> List[Tag]:
+        """Irmãos seguintes da caixa da seção, até o primeiro que contém outra âncora"""
+        if self.container is None:
+            return []
+        elements = []
+        for sibling in self.container.find_next_siblings():
+            if id(sibling) in self._index.anchor_ancestors:
+                break
+            elements.append(sibling)
+        return elements
+
+
+class CvSectionIndex:
+    """Seções do CV por nome da âncora, montadas em uma passada pela árvore"""
+
+    def __init__(self, soup: BeautifulSoup):
+        self.soup = soup
+        self.sections: List[CvSection] = []
+        self.by_name: Dict[str, CvSection] = {}
+        self.by_id: Dict[str, Tag] = {}
+        # Elementos que contêm alguma âncora: limites entre seções
+        self.anchor_ancestors: Set[int] = set()
+        self._text: Optional[str] = None
+
+        for tag in soup.find_all(True):
+            element_id = tag.get("id")
+            if element_id and element_id not in self.by_id:
+                self.by_id[element_id] = tag
+            if tag.name == "a" and tag.get("name"):
+                section = CvSection(self, len(self.sections), tag)
+                self.sections.append(section)
+                self.by_name.setdefault(section.name, section)
+                for parent in tag.parents:
+                    if id(parent) in self.anchor_ancestors:
+                        break
+                    self.anchor_ancestors.add(id(parent))
+
+    def get(self, name: Union[str, Pattern]) -> Optional[CvSection]:
+        """
+        Seção pelo nome exato da âncora, ou a primeira cujo nome casa com a regex
+        (mesma semântica de soup.find('a', attrs={'name': ...}))
+        """
+        if isinstance(name, str):
+            return self.by_name.get(name)
+        for section in self.sections:
+            if name.search(section.name):
+                return section
+        return None
+
+    @property
+    def text(self) -> str:
+        """Texto da página inteira (soup.get_text()), calculado uma vez"""
+        if self._text is None:
+            self._text = self.soup.get_text()
+        return self._text
+
+    def search(self, patterns: List[str], flags: int = re.IGNORECASE) -> Optional[re.Match]:
+        """Primeiro padrão que casa com o texto da página"""
+        for pattern in patterns:
+            match = re.search(pattern, self.text, flags)
+            if match:
+                return match
+        return None
@@ -6,11 +6,12 @@ Scraping funcional e robusto da plataforma ORCID
 import re
 import time
 import json
-import requests
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from urllib.parse import quote
 
+from ..utils.http_client import HttpSession
+
 class OrcidSearchResult:
     """Resultado individual de busca no ORCID"""
     def __init__(self, name: str, orcid_id: str = None, orcid_url: str = None, 
@@ -122,7 +123,7 @@ class OrcidAdvancedScraper:
     def __init__(self):
         self.base_url = "https://pub.orcid.org/v3.0"
         self.search_url = "https://pub.orcid.org/v3.0/search"
-        self.session = requests.Session()
+        self.session = HttpSession()
         self.session.headers.update({
             'Accept': 'application/json',
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -0,0 +1,53 @@
+"""
+🧮 TAREFAS DE PARSING PARA O POOL DE PROCESSOS
+=============================================
+Funções de módulo (serializáveis) que o parse_pool executa nos workers:
+recebem o corpo bruto da página e devolvem só dicionários e listas, que
+voltam ao processo do servidor sem carregar a árvore BeautifulSoup.
+"""
+
+from typing import Any, Dict, Optional
+
+from ..utils.html_parser import parse_html
+from . import scholar_page
+from .lattes_scraper import LattesAdvancedScraper
+
+# Um scraper por processo, criado no primeiro uso (só os métodos de extração são usados)
+_lattes: Optional[LattesAdvancedScraper] = None
+
+
+def _lattes_scraper() -> LattesAdvancedScraper:
+    global _lattes
+    if _lattes is None:
+        _lattes = LattesAdvancedScraper()
+    return _lattes
+
+
+def scholar_publications_page(content: bytes) -> Dict[str, Any]:
+    """Página de publicações do Scholar → {"publications": [...] ou None}"""
+    soup = parse_html(content, parse_only=scholar_page.PUBLICATIONS_STRAINER)
+    return {"publications": scholar_page.extract_publications(soup)}
+
+
+def lattes_full_profile(content: bytes, url: str, include_all_sections: bool = True) -> Dict[str, Any]:
+    """CV Lattes → LattesProfile.to_dict(), pelo parse completo (_parse_full_profile)"""
+    scraper = _lattes_scraper()
+    soup = scraper._parse_cv(content, include_all_sections)
+    return scraper._parse_full_profile(soup, url, include_all_sections).to_dict()
+
+
+def lattes_profile_data(
+    content: bytes,
+    lattes_id: Optional[str],
+    cv_url: str,
+    include_all_sections: bool = True
+) -> Optional[Dict[str, Any]]:
+    """CV Lattes → LattesProfile.to_dict() (_extract_lattes_profile_data), ou None se a página veio vazia"""
+    scraper = _lattes_scraper()
+    soup = scraper._parse_cv(content, include_all_sections)
+
+    # O modo resumido não monta o <body>
+    page_root = soup.find('body') if include_all_sections else soup.find()
+    if not page_root:
+        return None
+    return scraper._extract_lattes_profile_data(soup, lattes_id, cv_url, include_all_sections).to_dict()
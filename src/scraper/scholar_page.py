@@ -0,0 +1,237 @@
+"""
+🎓 ESTRUTURA DAS PÁGINAS DO GOOGLE SCHOLAR
+=========================================
+Partes do HTML do perfil que o ScholarExtractor lê. O parse monta só essas
+subárvores; menus, scripts e o restante da página não viram árvore.
+
+A tabela de citações (citações, índice h, i10; total e desde o ano) é lida
+em uma passada por extract_citation_stats; as linhas de publicação viram
+dicionários em extract_publications (também usada pelos workers de parsing).
+"""
+
+import re
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from ..utils.keyword_matcher import fold_text
+
+# Perfil: cabeçalho (nome, afiliação), tabela de citações e aviso de CAPTCHA
+# (as publicações saem das páginas paginadas, não da página do perfil)
+PROFILE_STRAINER = SoupStrainer(id=["gsc_prf_i", "gsc_prf_in", "gsc_rsb_st", "gsc_captcha_ccl"])
+
+# Páginas de publicações: só a tabela de artigos
+PUBLICATIONS_STRAINER = SoupStrainer(id=["gsc_a_t", "gsc_captcha_ccl"])
+
+
+class MetricColumns(NamedTuple):
+    """Valor de uma métrica nas duas colunas da tabela: total e desde o ano"""
+    all_time: Optional[int]
+    since_year: Optional[int]
+
+
+class CitationStats:
+    """Tabela de citações do perfil (#gsc_rsb_st), lida em uma passada"""
+
+    def __init__(
+        self,
+        citations: Optional[MetricColumns] = None,
+        h_index: Optional[MetricColumns] = None,
+        i10_index: Optional[MetricColumns] = None,
+        since_year: Optional[int] = None
+    ):
+        self.citations = citations
+        self.h_index = h_index
+        self.i10_index = i10_index
+        self.since_year = since_year
+
+    @property
+    def complete(self) -> bool:
+        """Todas as métricas com valor total?"""
+        return all(
+            metric is not None and metric.all_time is not None
+            for metric in (self.citations, self.h_index, self.i10_index)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        def columns(metric: Optional[MetricColumns]) -> Dict[str, Optional[int]]:
+            metric = metric or MetricColumns(None, None)
+            return {"all": metric.all_time, "since": metric.since_year}
+
+        return {
+            "since_year": self.since_year,
+            "citations": columns(self.citations),
+            "h_index": columns(self.h_index),
+            "i10_index": columns(self.i10_index),
+        }
+
+
+# Ordem das linhas na tabela do Scholar, usada quando o rótulo não é reconhecido
+METRIC_ROW_ORDER = ("citations", "h_index", "i10_index")
+
+
+def _metric_for_label(label: str) -> Optional[str]:
+    """Métrica de uma linha pelo rótulo ('Citações', 'Índice h', 'h-index', 'i10-index'...)"""
+    folded = fold_text(label)
+    if "i10" in folded:
+        return "i10_index"
+    if folded.startswith("cit"):
+        return "citations"
+    if re.search(r"(^|\W)h(\W|$)|h-index|h index", folded):
+        return "h_index"
+    return None
+
+
+def _to_int(text: str) -> Optional[int]:
+    digits = re.sub(r"[^\d]", "", text)
+    return int(digits) if digits else None
+
+
+def extract_citation_stats(soup: BeautifulSoup) -> CitationStats:
+    """
+    Ler citações, índice h e i10 (total e desde o ano) de uma vez
+
+    Percorre as linhas de #gsc_rsb_st uma única vez. Sem a tabela, usa as
+    células .gsc_rsb_std na ordem do Scholar (citações, h, i10; total e recente).
+    Métricas não encontradas ficam None.
+    """
+    stats = CitationStats()
+    table = soup.find(id="gsc_rsb_st")
+
+    if table is None:
+        values = [_to_int(cell.get_text()) for cell in soup.select(".gsc_rsb_std")]
+        for index, metric in enumerate(METRIC_ROW_ORDER):
+            pair = values[index * 2:index * 2 + 2]
+            if pair:
+                setattr(stats, metric, MetricColumns(pair[0], pair[1] if len(pair) > 1 else None))
+        return stats
+
+    data_rows = 0
+    for row in table.find_all("tr"):
+        headers = row.find_all("th")
+        if headers:
+            # Cabeçalho: "Todos | Desde 2019"
+            year = re.search(r"\d{4}", headers[-1].get_text())
+            stats.since_year = int(year.group()) if year else None
+            continue
+
+        cells = row.find_all("td")
+        if len(cells) < 2:
+            continue
+        metric = _metric_for_label(cells[0].get_text(" ", strip=True))
+        if metric is None and data_rows < len(METRIC_ROW_ORDER):
+            metric = METRIC_ROW_ORDER[data_rows]
+        data_rows += 1
+        if metric is None or getattr(stats, metric) is not None:
+            continue
+
+        values = [_to_int(cell.get_text()) for cell in cells[1:3]]
+        setattr(stats, metric, MetricColumns(values[0], values[1] if len(values) > 1 else None))
+
+    return stats
+
+
+# Seletores das linhas de publicação, do formato atual aos alternativos
+# (o Google Scholar pode mudar a estrutura)
+PUBLICATION_ROW_SELECTORS = (
+    '.gsc_a_tr',           # Seletor original
+    'tr.gsc_a_tr',         # Mais específico
+    '.gs_or_cit',          # Alternativo 1
+    '.gs_ri',              # Alternativo 2
+    'tbody tr',            # Genérico
+    '[data-aid]',          # Por atributo
+    '.publication-item',   # Possível novo
+    '.result-item'         # Possível novo
+)
+
+
+def extract_publications(soup: BeautifulSoup) -> Optional[List[Dict[str, Any]]]:
+    """
+    Publicações de uma página de perfil/publicações em dicionários simples
+
+    Returns:
+        Lista de publicações, ou None se nenhum seletor de linha casou
+        (página fora do formato esperado; o chamador decide o fallback)
+    """
+    publications = []
+
+    pub_elements = []
+    for selector in PUBLICATION_ROW_SELECTORS:
+        pub_elements = soup.select(selector)
+        if pub_elements:
+            print(f"🔍 Elementos de publicação encontrados: {len(pub_elements)} (seletor: {selector})")
+            break
+
+    if not pub_elements:
+        print(f"🔍 Elementos de publicação encontrados: 0")
+        return None
+
+    for i, pub in enumerate(pub_elements):
+        try:
+            # Múltiplos seletores para título
+            title_selectors = ['.gsc_a_at', 'a.gsc_a_at', '.gs_rt a', 'h3 a', '.title-link']
+            title_elem = None
+            for title_selector in title_selectors:
+                title_elem = pub.select_one(title_selector)
+                if title_elem:
+                    break
+
+            if title_elem:
+                title = title_elem.get_text(strip=True)
+
+                # Múltiplos seletores para ano
+                year_selectors = ['.gsc_a_h', '.gsc_a_y', '.gs_fl', '.year']
+                year = None
+                for year_selector in year_selectors:
+                    year_elem = pub.select_one(year_selector)
+                    if year_elem:
+                        year_text = year_elem.get_text(strip=True)
+                        try:
+                            year = int(year_text) if year_text.isdigit() else None
+                            if year:
+                                break
+                        except:
+                            continue
+
+                # Múltiplos seletores para citações
+                citations_selectors = ['.gsc_a_c', '.gs_fl a', '.citations']
+                citations = 0
+                for cit_selector in citations_selectors:
+                    citations_elem = pub.select_one(cit_selector)
+                    if citations_elem:
+                        cit_text = citations_elem.get_text(strip=True)
+                        try:
+                            citations = int(cit_text) if cit_text.isdigit() else 0
+                            break
+                        except:
+                            continue
+
+                # Extrair venue/journal - melhor seletor
+                venue_elem = pub.select_one('.gs_gray')
+                venue_text = venue_elem.get_text(strip=True) if venue_elem else "Não especificado"
+
+                # Separar autores e revista do campo venue
+                authors = venue_text  # Por padrão, venue contém autores + revista
+                journal = venue_text  # Para compatibilidade
+
+                # Tentar separar autores da revista (formato comum: "Autores - Revista, Ano")
+                if " - " in venue_text:
+                    parts = venue_text.split(" - ", 1)
+                    authors = parts[0].strip()
+                    journal = parts[1].strip() if len(parts) > 1 else venue_text
+
+                publications.append({
+                    "title": title,
+                    "venue": journal,  # Revista/periódico
+                    "authors": authors,  # Lista de autores
+                    "year": year,
+                    "citations": citations,
+                    "type": "Artigo",
+                    "platform": "scholar"
+                })
+
+        except Exception as e:
+            print(f"❌ Erro ao processar publicação {i}: {e}")
+            continue
+
+    return publications
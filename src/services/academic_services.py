@@ -7,7 +7,7 @@ Camada de serviço para operações de busca acadêmica
 import os
 import re
 import time
-import requests
+import asyncio
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, date
 from bs4 import BeautifulSoup
@@ -21,17 +21,28 @@ from ..models.academic_models import (
     AcademicSummary
 )
 from ..utils.academic_metrics import calculate_academic_metrics
+from ..utils.http_client import HttpSession
+from ..utils.html_parser import parse_html
+from ..utils.executor import run_blocking
+from ..utils.fan_out import fan_out
+from ..utils.memory_cache import TTLCache
 
 # Carregar variáveis de ambiente
 env_path = os.path.join(os.path.dirname(__file__), 'scraper', '.env')
 load_dotenv(env_path)
 
+# Perfis ORCID completos já processados, compartilhados por todas as instâncias
+orcid_profile_cache: TTLCache[ORCIDProfile] = TTLCache(
+    max_entries=int(os.getenv("ORCID_PROFILE_CACHE_SIZE", 2048)),
+    ttl=float(os.getenv("ORCID_PROFILE_CACHE_TTL", 12 * 3600))
+)
+
 class LattesService:
     """Serviço para busca na Plataforma Lattes"""
     
     def __init__(self):
         self.base_url = "http://buscatextual.cnpq.br/buscatextual"
-        self.session = requests.Session()
+        self.session = HttpSession()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
@@ -125,7 +136,7 @@ class LattesService:
             response = success_response
             
             # Debug da resposta - VERSÃO MELHORADA
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(response.content)
             
             print(f"📄 Título da página: {soup.title.string if soup.title else 'Sem título'}")
             print(f"� Tamanho do conteúdo: {len(response.content)} bytes")
@@ -198,7 +209,7 @@ class LattesService:
             if response.status_code != 200:
                 return None
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(response.content)
             profile = self._parse_full_lattes_profile(soup, lattes_id)
             
             return profile
@@ -605,7 +616,7 @@ class LattesService:
             if response.status_code != 200:
                 return None
                 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(response.content)
             
             # Extrair dados básicos
             name = soup.find('h2', class_='nome')
@@ -637,15 +648,17 @@ class ORCIDService:
     def __init__(self):
         self.base_url = "https://pub.orcid.org/v3.0"
         self.search_url = "https://pub.orcid.org/v3.0/search"
-        self.session = requests.Session()
+        self.session = HttpSession()
         self.session.headers.update({
             'Accept': 'application/json',
             'User-Agent': 'Mozilla/5.0 Academic Research Tool'
         })
         self.request_count = 0
+        self.max_concurrency = int(os.getenv("ORCID_MAX_CONCURRENCY", 8))
+        self.profile_cache = orcid_profile_cache
     
     def search_by_name(self, name: str, max_results: int = 20) -> List[ORCIDProfile]:
-        """Busca por nome no ORCID"""
+        """Busca por nome no ORCID (falhas de rede ou da API geram exceção, não lista vazia)"""
         try:
             # Query de busca
             query = f'given-names:"{name.split()[0]}"'
@@ -672,57 +685,81 @@ class ORCIDService:
             return profiles
             
         except Exception as e:
+            # Propagar: quem chama decide (fan_out marca a plataforma com erro)
             print(f"❌ Erro na busca ORCID: {e}")
-            return []
+            raise
+    
+    @staticmethod
+    def _normalize_orcid_id(orcid_id: str) -> str:
+        """Remove prefixo de URL do ORCID ID"""
+        return orcid_id.replace('https://orcid.org/', '').replace('http://orcid.org/', '').strip('/ ')
     
     def get_full_profile(self, orcid_id: str) -> Optional[ORCIDProfile]:
         """Obtém perfil completo do ORCID"""
-        try:
-            # Remove URL prefix if present
-            orcid_id = orcid_id.replace('https://orcid.org/', '')
-            
-            profile_url = f"{self.base_url}/{orcid_id}/record"
-            
-            print(f"📋 Carregando perfil ORCID: {orcid_id}")
-            response = self.session.get(profile_url, timeout=30)
-            self.request_count += 1
-            
-            if response.status_code != 200:
-                return None
-            
-            data = response.json()
-            profile = self._parse_full_orcid_profile(data, orcid_id)
-            
-            return profile
-            
-        except Exception as e:
-            print(f"❌ Erro ao carregar perfil ORCID: {e}")
-            return None
+        profiles = self.get_full_profiles([orcid_id])
+        return profiles[0] if profiles else None
+    
+    def get_full_profiles(self, orcid_ids: List[str]) -> List[ORCIDProfile]:
+        """
+        Obtém vários perfis completos do ORCID em paralelo
+        
+        IDs repetidos são buscados uma única vez e perfis já carregados vêm do
+        cache em memória; os demais registros são baixados juntos (até
+        ORCID_MAX_CONCURRENCY por vez), no ritmo do limitador do pub.orcid.org.
+        A ordem dos IDs é preservada; perfis com erro ficam de fora.
+        """
+        unique_ids = list(dict.fromkeys(
+            self._normalize_orcid_id(orcid_id) for orcid_id in orcid_ids if orcid_id
+        ))
+        
+        profiles: Dict[str, ORCIDProfile] = {}
+        missing = []
+        for orcid_id in unique_ids:
+            cached = self.profile_cache.get(orcid_id)
+            if cached is not None:
+                profiles[orcid_id] = cached
+            else:
+                missing.append(orcid_id)
+        
+        if missing:
+            print(f"📋 Carregando {len(missing)} perfis ORCID ({len(unique_ids) - len(missing)} em cache)")
+            urls = [f"{self.base_url}/{orcid_id}/record" for orcid_id in missing]
+            responses = self.session.get_many(urls, max_concurrency=self.max_concurrency, timeout=30)
+            self.request_count += len(missing)
+            
+            for orcid_id, response in zip(missing, responses):
+                if isinstance(response, Exception):
+                    print(f"❌ Erro ao carregar perfil ORCID {orcid_id}: {response}")
+                    continue
+                if response.status_code != 200:
+                    continue
+                try:
+                    profile = self._parse_full_orcid_profile(response.json(), orcid_id)
+                except Exception as e:
+                    print(f"❌ Erro ao carregar perfil ORCID {orcid_id}: {e}")
+                    continue
+                self.profile_cache.put(orcid_id, profile)
+                profiles[orcid_id] = profile
+        
+        return [profiles[orcid_id] for orcid_id in unique_ids if orcid_id in profiles]
     
     def _process_orcid_search_results(self, data: Dict, max_results: int) -> List[ORCIDProfile]:
         """Processa resultados de busca do ORCID"""
-        profiles = []
+        orcid_ids = []
         
         results = data.get('result', [])
         
         for result in results[:max_results]:
             try:
                 orcid_id = result.get('orcid-identifier', {}).get('path', '')
-                
                 if orcid_id:
-                    # Busca perfil completo
-                    full_profile = self.get_full_profile(orcid_id)
-                    if full_profile:
-                        profiles.append(full_profile)
-                
-                # Rate limiting
-                time.sleep(0.1)
-                
+                    orcid_ids.append(orcid_id)
             except Exception as e:
                 print(f"⚠️ Erro ao processar resultado ORCID: {e}")
                 continue
         
-        return profiles
+        # Busca perfis completos (em paralelo, com cache)
+        return self.get_full_profiles(orcid_ids)
     
     def _parse_full_orcid_profile(self, data: Dict, orcid_id: str) -> ORCIDProfile:
         """Parse completo do perfil ORCID com logs de debug"""
@@ -1200,18 +1237,37 @@ class AcademicResearchService:
         self.orcid_service = ORCIDService()
     
     def comprehensive_search(self, researcher_name: str, max_results: int = 20) -> Tuple[List[LattesProfile], List[ORCIDProfile], AcademicSummary]:
-        """Busca completa em todas as plataformas"""
+        """Busca completa em todas as plataformas (versão síncrona, fora de event loop)"""
+        return asyncio.run(self.comprehensive_search_async(researcher_name, max_results))
+    
+    async def comprehensive_search_async(
+        self,
+        researcher_name: str,
+        max_results: int = 20,
+        timeouts: Optional[Dict[str, float]] = None
+    ) -> Tuple[List[LattesProfile], List[ORCIDProfile], AcademicSummary]:
+        """
+        Busca completa em todas as plataformas, em paralelo
+        
+        Lattes e ORCID são consultados ao mesmo tempo, cada um com seu timeout;
+        uma plataforma lenta ou com erro volta vazia e o status fica no resumo.
+        """
         print(f"🎯 BUSCA ACADÊMICA COMPLETA: {researcher_name}")
         print("=" * 60)
         
-        # Busca no Lattes
-        lattes_profiles = self.lattes_service.search_by_name(researcher_name, max_results)
+        outcomes = await fan_out({
+            "lattes": lambda: run_blocking(self.lattes_service.search_by_name, researcher_name, max_results),
+            "orcid": lambda: run_blocking(self.orcid_service.search_by_name, researcher_name, max_results),
+        }, timeouts)
         
-        # Busca no ORCID
-        orcid_profiles = self.orcid_service.search_by_name(researcher_name, max_results)
+        lattes_profiles = (outcomes["lattes"].result or []) if outcomes["lattes"].ok else []
+        orcid_profiles = (outcomes["orcid"].result or []) if outcomes["orcid"].ok else []
         
         # Gera resumo
         summary = self._generate_academic_summary(researcher_name, lattes_profiles, orcid_profiles)
+        summary.platform_status = {
+            platform: outcome.status_dict() for platform, outcome in outcomes.items()
+        }
         
         return lattes_profiles, orcid_profiles, summary
     
@@ -7,9 +7,10 @@ Serviço para buscar múltiplos pesquisadores no Google Scholar
 import os
 import time
 from typing import List, Dict, Any, Optional
-from serpapi import GoogleSearch
 from dotenv import load_dotenv
 
+from .serpapi_client import serpapi_client
+
 # Carregar variáveis de ambiente
 env_path = os.path.join(os.path.dirname(__file__), '..', '..', '.env')
 load_dotenv(env_path)
@@ -21,7 +22,11 @@ class GoogleScholarAuthorsService:
         self.api_key = os.getenv("SERPAPI_KEY") or os.getenv("API_KEY")
         if not self.api_key:
             raise ValueError("❌ SERPAPI_KEY não encontrada no arquivo .env")
-        self.api_calls_count = 0
+    
+    @property
+    def api_calls_count(self) -> int:
+        """Chamadas pagas à SerpAPI (acertos de cache e chamadas colapsadas não contam)"""
+        return serpapi_client.api_calls_count
 
     def search_authors_by_name(self, author_name: str, max_results: int = 10) -> List[Dict[str, Any]]:
         """Busca múltiplos autores por nome no Google Scholar - versão simplificada"""
@@ -311,9 +316,7 @@ class GoogleScholarAuthorsService:
                 "start": 0
             }
             
-            search = GoogleSearch(params)
-            results = search.get_dict()
-            self.api_calls_count += 1
+            results = serpapi_client.search(params)
             
             if 'error' in results:
                 print(f"❌ Erro ao buscar publicações: {results['error']}")
@@ -355,9 +358,7 @@ class GoogleScholarAuthorsService:
                 "start": 0
             }
             
-            search = GoogleSearch(params)
-            results = search.get_dict()
-            self.api_calls_count += 1
+            results = serpapi_client.search(params)
             
             if 'error' in results:
                 print(f"❌ Erro ao buscar publicações: {results['error']}")
@@ -0,0 +1,193 @@
+"""
+🔑 CLIENTE SERPAPI COM CACHE
+===========================
+Wrapper único para todas as chamadas à SerpAPI (substitui GoogleSearch(...).get_dict()).
+
+- Cache persistente por parâmetros canônicos (api_key não entra na chave), TTL por engine
+- Singleflight: chamadas idênticas simultâneas viram uma única requisição paga
+- Contadores de chamadas pagas e taxa de acerto do cache
+- Requisições passam pelo cliente HTTP compartilhado (pool + limitador do host serpapi.com)
+"""
+
+import os
+import copy
+import json
+import time
+import asyncio
+import hashlib
+from typing import Any, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from ..utils.http_cache import DEFAULT_CACHE_DIR, DiskCache
+from ..utils.http_client import HttpEngine, http_engine
+
+load_dotenv()
+
+SERPAPI_URL = "https://serpapi.com/search"
+
+# Parâmetros que não mudam o resultado da busca
+EXCLUDED_PARAMS = {"api_key", "output", "source", "no_cache", "async"}
+
+# engine: TTL em segundos
+DEFAULT_ENGINE_TTLS: Dict[str, int] = {
+    "google_scholar": 24 * 3600,
+    "google_scholar_author": 24 * 3600,
+    "google_scholar_profiles": 24 * 3600,
+    "google_scholar_cite": 7 * 24 * 3600,
+}
+DEFAULT_TTL = 12 * 3600
+
+
+class SerpApiClient:
+    """Cliente SerpAPI com cache em disco e colapso de chamadas idênticas"""
+
+    def __init__(self, engine: Optional[HttpEngine] = None, directory: Optional[str] = None):
+        self.engine = engine or http_engine
+        self.storage = DiskCache(directory or os.getenv("HTTP_CACHE_DIR", DEFAULT_CACHE_DIR), "serpapi")
+        self.enabled = os.getenv("SERPAPI_CACHE_ENABLED", "true").lower() == "true"
+        self.ttls = dict(DEFAULT_ENGINE_TTLS)
+        self.timeout = float(os.getenv("SERPAPI_TIMEOUT", 60))
+        self.max_concurrency = int(os.getenv("SERPAPI_MAX_CONCURRENCY", 4))
+
+        self.api_calls_count = 0
+        self.cache_hits = 0
+        self.collapsed_calls = 0
+        self.lookups = 0
+
+        # Requisições em andamento (acessado apenas no loop do cliente HTTP)
+        self._inflight: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
+    @staticmethod
+    def cache_key(params: Dict[str, Any]) -> str:
+        """Chave canônica: parâmetros ordenados, sem api_key e sem valores nulos"""
+        canonical = {
+            key: str(value) for key, value in params.items()
+            if key not in EXCLUDED_PARAMS and value is not None
+        }
+        return hashlib.sha256(json.dumps(canonical, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def ttl_for(self, params: Dict[str, Any]) -> int:
+        return self.ttls.get(params.get("engine", ""), DEFAULT_TTL)
+
+    # ------------------------------------------------------------------
+    # Execução (no loop do cliente HTTP)
+    # ------------------------------------------------------------------
+
+    async def _search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.lookups += 1
+        key = self.cache_key(params)
+
+        if self.enabled:
+            cached = await asyncio.to_thread(self.storage.load, key)
+            if cached is not None and time.time() - cached[0].get("stored_at", 0) < self.ttl_for(params):
+                self.cache_hits += 1
+                return json.loads(cached[1])
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.collapsed_calls += 1
+            print(f"🔗 Chamada SerpAPI idêntica em andamento, aguardando resultado ({params.get('engine')})")
+
+        # shield: cancelar um chamador não cancela a requisição compartilhada
+        result = await asyncio.shield(task)
+        return copy.deepcopy(result)
+
+    async def _fetch(self, key: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        query = dict(params)
+        query["output"] = "json"
+
+        response = await self.engine.get(SERPAPI_URL, params=query, timeout=self.timeout, use_cache=False)
+        self.api_calls_count += 1
+
+        try:
+            results = response.json()
+        except ValueError:
+            return {"error": f"Resposta inválida da SerpAPI (HTTP {response.status_code})"}
+
+        if self.enabled and response.status_code == 200 and "error" not in results:
+            meta = {"engine": params.get("engine"), "stored_at": time.time()}
+            body = json.dumps(results, ensure_ascii=False).encode("utf-8")
+            try:
+                await asyncio.to_thread(self.storage.store, key, meta, body)
+            except OSError as e:
+                print(f"⚠️ Não foi possível gravar no cache SerpAPI: {e}")
+
+        return results
+
+    async def _search_pages(
+        self,
+        params: Dict[str, Any],
+        offsets: List[int],
+        is_last_page: Callable[[Dict[str, Any]], bool],
+        max_concurrency: int,
+    ) -> List[Dict[str, Any]]:
+        pages: List[Dict[str, Any]] = []
+        for wave_start in range(0, len(offsets), max_concurrency):
+            wave = offsets[wave_start:wave_start + max_concurrency]
+            results = await asyncio.gather(
+                *(self._search({**params, "start": offset}) for offset in wave),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    result = {"error": str(result)}
+                pages.append(result)
+                # Primeira página curta (ou com erro) encerra: as ondas seguintes nem saem
+                if "error" in result or is_last_page(result):
+                    return pages
+        return pages
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    def search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Equivalente a GoogleSearch(params).get_dict(), com cache"""
+        return self.engine.run_sync(self._search(params))
+
+    async def asearch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Versão assíncrona de search()"""
+        return await self.engine.run(self._search(params))
+
+    def search_pages(
+        self,
+        params: Dict[str, Any],
+        offsets: List[int],
+        is_last_page: Callable[[Dict[str, Any]], bool],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Buscar várias páginas (parâmetro start) em paralelo, em ondas limitadas
+
+        Args:
+            params: Parâmetros base da busca
+            offsets: Valores de start de cada página, em ordem
+            is_last_page: Indica se uma página é a última (ex: veio incompleta)
+            max_concurrency: Páginas simultâneas (padrão: SERPAPI_MAX_CONCURRENCY)
+
+        Returns:
+            Resultados em ordem, até a primeira página curta ou com erro (inclusive)
+        """
+        if not offsets:
+            return []
+        concurrency = max(1, max_concurrency or self.max_concurrency)
+        return self.engine.run_sync(self._search_pages(params, offsets, is_last_page, concurrency))
+
+    def stats(self) -> Dict[str, Any]:
+        served_without_call = self.cache_hits + self.collapsed_calls
+        return {
+            "api_calls_count": self.api_calls_count,
+            "lookups": self.lookups,
+            "cache_hits": self.cache_hits,
+            "collapsed_calls": self.collapsed_calls,
+            "hit_ratio": round(served_without_call / self.lookups, 3) if self.lookups else 0.0,
+        }
+
+
+# Instância global
+serpapi_client = SerpApiClient()
@@ -9,7 +9,6 @@ import re
 import time
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-from serpapi import GoogleSearch
 from dotenv import load_dotenv
 import pandas as pd
 
@@ -20,6 +19,7 @@ from ..models import (
 from ..utils.academic_metrics import calculate_academic_metrics
 from ..scraper.escavador_scraper import search_lattes_summary
 from ..scraper.lattes_direct_scraper import search_lattes_by_name
+from .serpapi_client import serpapi_client
 
 # Carregar variáveis de ambiente
 env_path = os.path.join(os.path.dirname(__file__), '..', '..', '.env')
@@ -30,7 +30,11 @@ class GoogleScholarService:
     
     def __init__(self):
         self.api_key = os.getenv("API_KEY") or "demo_key_for_testing"
-        self.api_calls_count = 0
+    
+    @property
+    def api_calls_count(self) -> int:
+        """Chamadas pagas à SerpAPI (acertos de cache e chamadas colapsadas não contam)"""
+        return serpapi_client.api_calls_count
     
     def test_connection(self) -> Tuple[bool, str]:
         """Testa a conexão com a API SerpAPI"""
@@ -43,9 +47,7 @@ class GoogleScholarService:
                 "num": 1
             }
             
-            search = GoogleSearch(params)
-            results = search.get_dict()
-            self.api_calls_count += 1
+            results = serpapi_client.search(params)
             
             if 'error' in results:
                 return False, f"Erro da API: {results['error']}"
@@ -66,38 +68,33 @@ class GoogleScholarService:
             "start": 0
         }
         
-        all_results = []
-        page = 1
+        # Offsets conhecidos de antemão: as páginas saem em paralelo
+        page_size = params["num"]
+        total_pages = min(max_pages, -(-max_results // page_size))
+        offsets = [page * page_size for page in range(total_pages)]
         
-        while len(all_results) < max_results and page <= max_pages:
-            search = GoogleSearch(params)
-            results = search.get_dict()
-            self.api_calls_count += 1
-            
+        pages = serpapi_client.search_pages(
+            params,
+            offsets,
+            is_last_page=lambda results: (
+                len(results.get("organic_results", [])) < page_size
+                or "next" not in results.get("serpapi_pagination", {})
+            )
+        )
+        
+        all_results = []
+        for page, results in enumerate(pages, start=1):
             if 'error' in results:
-                raise Exception(f"Erro da API: {results['error']}")
-            
-            organic_results = results.get("organic_results", [])
-            
-            if not organic_results:
+                if not all_results:
+                    raise Exception(f"Erro da API: {results['error']}")
                 break
             
-            for result in organic_results:
+            for result in results.get("organic_results", []):
                 if len(all_results) >= max_results:
                     break
                     
                 pub_data = self._extract_publication_data(result, page)
                 all_results.append(pub_data)
-            
-            # Próxima página
-            if "next" in results.get("serpapi_pagination", {}):
-                params["start"] += 20
-                page += 1
-            else:
-                break
-            
-            # Delay entre requests
-            time.sleep(0.5)
         
         return all_results
     
@@ -258,9 +255,7 @@ class GoogleScholarService:
                     "q": result.result_id
                 }
                 
-                search = GoogleSearch(params)
-                cite_results = search.get_dict()
-                self.api_calls_count += 1
+                cite_results = serpapi_client.search(params)
                 
                 if 'error' in cite_results:
                     continue
@@ -272,9 +267,6 @@ class GoogleScholarService:
                         citation_snippet=citation.get("snippet")
                     )
                     citations.append(citation_data)
-                
-                # Delay entre requests
-                time.sleep(0.5)
                     
             except Exception:
                 continue
@@ -290,9 +282,7 @@ class GoogleScholarService:
             "num": 100
         }
         
-        search = GoogleSearch(params)
-        results = search.get_dict()
-        self.api_calls_count += 1
+        results = serpapi_client.search(params)
         
         if 'error' in results:
             raise Exception(f"Erro: {results['error']}")
@@ -551,9 +541,7 @@ class GoogleScholarService:
                 "hl": "en"
             }
             
-            search = GoogleSearch(params)
-            results = search.get_dict()
-            self.api_calls_count += 1
+            results = serpapi_client.search(params)
             
             if 'error' in results:
                 # Se der erro, tentar busca genérica
@@ -628,9 +616,7 @@ class GoogleScholarService:
                 "hl": "pt"
             }
             
-            search = GoogleSearch(params)
-            results = search.get_dict()
-            self.api_calls_count += 1
+            results = serpapi_client.search(params)
             
             if 'error' in results:
                 raise Exception(f"Erro da API: {results['error']}")
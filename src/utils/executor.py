@@ -0,0 +1,89 @@
+"""
+⚙️ CAMADA DE EXECUÇÃO PARA CÓDIGO BLOQUEANTE
+==========================================
+Os extratores (Scholar, Lattes, ORCID, Escavador, SerpAPI) são síncronos.
+Este módulo envia essas chamadas para um pool de threads limitado, para que
+os endpoints assíncronos não congelem o event loop do uvicorn.
+"""
+
+import os
+import asyncio
+import functools
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 16
+
+
+class BlockingExecutor:
+    """Pool limitado de threads para chamadas bloqueantes dos extratores"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or int(
+            os.getenv("SCRAPER_MAX_WORKERS", DEFAULT_MAX_WORKERS)
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Criar o pool sob demanda (também após um shutdown)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="scraper-worker"
+            )
+            print(f"⚙️ Pool de extratores iniciado ({self.max_workers} workers)")
+        return self._executor
+
+    async def run(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> T:
+        """
+        Executar uma função bloqueante no pool e aguardar o resultado
+
+        Cancelar a task que aguarda (ou estourar o timeout) remove a chamada da
+        fila se ela ainda não começou; uma chamada já em execução termina em
+        segundo plano, mas seu resultado é descartado.
+
+        Args:
+            func: Função síncrona a executar
+            timeout: Tempo máximo de espera em segundos (None = sem limite)
+
+        Returns:
+            O valor retornado por func
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+        future = loop.run_in_executor(self.executor, call)
+
+        if timeout is None:
+            return await future
+        return await asyncio.wait_for(future, timeout=timeout)
+
+    def shutdown(self, wait: bool = False):
+        """Encerrar o pool, cancelando chamadas que ainda estão na fila"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+            print("🔒 Pool de extratores encerrado")
+
+
+# Instância global
+blocking_executor = BlockingExecutor()
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> T:
+    """Atalho para blocking_executor.run"""
+    return await blocking_executor.run(func, *args, timeout=timeout, **kwargs)
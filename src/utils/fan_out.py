@@ -0,0 +1,104 @@
+"""
+🔀 BUSCA PARALELA EM MÚLTIPLAS PLATAFORMAS
+=========================================
+Dispara a consulta em todas as plataformas pedidas ao mesmo tempo, cada uma
+com seu próprio timeout. A latência total passa a ser a da fonte mais lenta
+(limitada pelo timeout), e não a soma de todas.
+
+Uma plataforma lenta ou com erro não derruba as demais: o resultado traz o
+status e a latência de cada fonte, e os dados das que responderam.
+"""
+
+import os
+import time
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_PLATFORM_TIMEOUT = 30.0
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+
+
+def platform_timeout(platform: str) -> float:
+    """Timeout da plataforma: PLATFORM_TIMEOUT_<NOME> ou PLATFORM_TIMEOUT"""
+    default = float(os.getenv("PLATFORM_TIMEOUT", DEFAULT_PLATFORM_TIMEOUT))
+    return float(os.getenv(f"PLATFORM_TIMEOUT_{platform.upper()}", default))
+
+
+class PlatformOutcome:
+    """Resultado de uma plataforma: status, latência e dados (ou erro)"""
+
+    def __init__(
+        self,
+        platform: str,
+        status: str,
+        latency: float,
+        result: Any = None,
+        error: Optional[str] = None
+    ):
+        self.platform = platform
+        self.status = status
+        self.latency = latency
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.status == STATUS_OK
+
+    def status_dict(self) -> Dict[str, Any]:
+        """Status e latência, sem os dados, para a resposta da API"""
+        status = {"status": self.status, "latency": round(self.latency, 3)}
+        if self.error:
+            status["error"] = self.error
+        return status
+
+
+async def _run_platform(
+    platform: str,
+    call: Callable[[], Awaitable[Any]],
+    timeout: Optional[float]
+) -> PlatformOutcome:
+    start = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(call(), timeout=timeout)
+    except asyncio.TimeoutError:
+        latency = time.perf_counter() - start
+        print(f"⏱️ {platform}: sem resposta em {timeout}s, seguindo sem esta fonte")
+        return PlatformOutcome(platform, STATUS_TIMEOUT, latency, error=f"Timeout após {timeout}s")
+    except Exception as e:
+        latency = time.perf_counter() - start
+        print(f"⚠️ {platform}: erro na busca: {e}")
+        return PlatformOutcome(platform, STATUS_ERROR, latency, error=str(e))
+
+    latency = time.perf_counter() - start
+    print(f"✅ {platform}: concluído em {latency:.2f}s")
+    return PlatformOutcome(platform, STATUS_OK, latency, result=result)
+
+
+async def fan_out(
+    calls: Dict[str, Callable[[], Awaitable[Any]]],
+    timeouts: Optional[Dict[str, float]] = None
+) -> Dict[str, PlatformOutcome]:
+    """
+    Executar as buscas de todas as plataformas em paralelo
+
+    Args:
+        calls: plataforma -> função sem argumentos que devolve a corrotina da busca
+        timeouts: timeout por plataforma em segundos (padrão: platform_timeout)
+
+    Returns:
+        plataforma -> PlatformOutcome, na mesma ordem de calls
+    """
+    timeouts = timeouts or {}
+    outcomes = await asyncio.gather(*(
+        _run_platform(platform, call, timeouts.get(platform, platform_timeout(platform)))
+        for platform, call in calls.items()
+    ))
+    return {outcome.platform: outcome for outcome in outcomes}
@@ -0,0 +1,96 @@
+"""
+🧩 PARSER HTML COMPARTILHADO
+===========================
+Todos os extratores montam a árvore BeautifulSoup por aqui, em vez de fixar
+'html.parser' (o backend mais lento) em cada chamada.
+
+- Backend configurável por HTML_PARSER (padrão: lxml, já listado no requirements)
+- Sem o backend pedido instalado, cai para 'html.parser' com um aviso
+- Página que o backend rápido rejeita é refeita com 'html.parser'
+- parse_only (SoupStrainer) monta só as partes que o extrator lê; se nada
+  casar (layout mudou, CAPTCHA...), a página é montada inteira
+
+Comparação de backends nas páginas do cache HTTP: python -m src.utils.parser_benchmark
+"""
+
+import os
+from typing import Optional, Union
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import ParserRejectedMarkup, builder_registry
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_BACKEND = "lxml"
+FALLBACK_BACKEND = "html.parser"
+
+
+def backend_available(name: str) -> bool:
+    """O BeautifulSoup tem um tree builder instalado para este backend?"""
+    return builder_registry.lookup(name) is not None
+
+
+class HtmlParser:
+    """Fachada de parsing com backend selecionável"""
+
+    def __init__(self, backend: Optional[str] = None):
+        requested = backend or os.getenv("HTML_PARSER", DEFAULT_BACKEND)
+        if backend_available(requested):
+            self.backend = requested
+        else:
+            print(f"⚠️ Parser HTML '{requested}' não instalado, usando '{FALLBACK_BACKEND}'")
+            self.backend = FALLBACK_BACKEND
+
+    def parse(
+        self,
+        markup: Union[str, bytes],
+        from_encoding: Optional[str] = None,
+        parse_only: Optional[SoupStrainer] = None
+    ) -> BeautifulSoup:
+        """
+        Montar a árvore de uma página
+
+        Args:
+            markup: Corpo da resposta (bytes de preferência, para a detecção de encoding)
+            from_encoding: Encoding conhecido da página (ex: 'latin-1' no CV Lattes)
+            parse_only: Subárvores a montar; o resto da página é descartado durante o parse
+        """
+        if isinstance(markup, str):
+            # Texto já decodificado: from_encoding não se aplica
+            from_encoding = None
+
+        if parse_only is not None:
+            soup = self._build(markup, from_encoding, parse_only)
+            if soup.find() is not None:
+                return soup
+            print("⚠️ Nenhuma seção esperada na página, montando a página inteira")
+
+        return self._build(markup, from_encoding)
+
+    def _build(
+        self,
+        markup: Union[str, bytes],
+        from_encoding: Optional[str],
+        parse_only: Optional[SoupStrainer] = None
+    ) -> BeautifulSoup:
+        try:
+            return BeautifulSoup(markup, self.backend, from_encoding=from_encoding, parse_only=parse_only)
+        except ParserRejectedMarkup as e:
+            if self.backend == FALLBACK_BACKEND:
+                raise
+            print(f"⚠️ Parser '{self.backend}' rejeitou a página ({e}), usando '{FALLBACK_BACKEND}'")
+            return BeautifulSoup(markup, FALLBACK_BACKEND, from_encoding=from_encoding, parse_only=parse_only)
+
+
+# Instância global
+html_parser = HtmlParser()
+
+
+def parse_html(
+    markup: Union[str, bytes],
+    from_encoding: Optional[str] = None,
+    parse_only: Optional[SoupStrainer] = None
+) -> BeautifulSoup:
+    """Atalho para html_parser.parse"""
+    return html_parser.parse(markup, from_encoding=from_encoding, parse_only=parse_only)
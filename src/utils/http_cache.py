@@ -0,0 +1,286 @@
+"""
+🗄️ CACHE HTTP EM DISCO
+=====================
+Cache persistente de respostas abaixo do cliente HTTP compartilhado.
+
+- Chave: hash do método + URL normalizada (host em minúsculas, parâmetros ordenados)
+- Armazenamento: gzip em disco, no volume lattes_cache já montado pelo docker-compose
+- Validade: TTL por host; depois de expirar, revalida com ETag/Last-Modified
+  (resposta 304 renova a entrada sem baixar o corpo de novo)
+- Validação por host: páginas de bloqueio que chegam com status 200 (CAPTCHA
+  do Scholar e do CNPq) nunca são gravadas, nem servidas se já estiverem no disco
+"""
+
+import os
+import gzip
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CACHE_DIR = os.path.join(PROJECT_ROOT, "lattes_cache")
+
+# host: TTL em segundos (hosts fora da lista não são cacheados)
+DEFAULT_HOST_TTLS: Dict[str, int] = {
+    "scholar.google.com": 6 * 3600,
+    "buscatextual.cnpq.br": 24 * 3600,
+    "lattes.cnpq.br": 24 * 3600,
+    "pub.orcid.org": 12 * 3600,
+    "escavador.com": 24 * 3600,
+}
+
+
+def without_markers(*markers: bytes) -> Callable[[bytes], bool]:
+    """Validador: corpo aceito se não contém nenhum dos marcadores"""
+    def valid(body: bytes) -> bool:
+        return not any(marker in body for marker in markers)
+    return valid
+
+
+# Desafio do CNPq (visualizacv.do pede o código antes de mostrar o currículo)
+# e página de serviço fora do ar, ambos com status 200
+_LATTES_BLOCK_PAGE = without_markers(
+    b"tokenCaptchar", b"divCaptcha", b"g-recaptcha", b"Service Temporarily Unavailable"
+)
+
+# host: validador do corpo (False = página de bloqueio, não cachear)
+DEFAULT_VALIDATORS: Dict[str, Callable[[bytes], bool]] = {
+    "scholar.google.com": without_markers(
+        b"gsc_captcha_ccl", b"gs_captcha", b'id="recaptcha"', b"unusual traffic from your computer network"
+    ),
+    "buscatextual.cnpq.br": _LATTES_BLOCK_PAGE,
+    "lattes.cnpq.br": _LATTES_BLOCK_PAGE,
+}
+
+# Cabeçalhos que não fazem sentido para um corpo já decodificado
+SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+
+
+def _host_matches(host: str, key: str) -> bool:
+    return host == key or host.endswith("." + key)
+
+
+def normalize_url(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Normalizar URL + parâmetros para uso como chave de cache"""
+    parsed = httpx.URL(url).copy_merge_params(params) if params else httpx.URL(url)
+    query = sorted(httpx.QueryParams(parsed.query).multi_items())
+    normalized = parsed.copy_with(
+        scheme=parsed.scheme.lower(),
+        host=parsed.host.lower(),
+        query=str(httpx.QueryParams(query)).encode() or None,
+        fragment=None,
+    )
+    return str(normalized)
+
+
+class DiskCache:
+    """Armazenamento chave → (metadados, corpo) comprimido com gzip"""
+
+    def __init__(self, directory: str, namespace: str):
+        self.directory = os.path.join(directory, namespace)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.gz")
+
+    def load(self, key: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rb") as handle:
+                raw = handle.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError) as e:
+            print(f"⚠️ Entrada de cache corrompida removida ({key[:12]}): {e}")
+            self.delete(key)
+            return None
+
+        header, _, body = raw.partition(b"\n")
+        return json.loads(header), body
+
+    def store(self, key: str, meta: Dict[str, Any], body: bytes):
+        """Gravar de forma atômica (arquivo temporário + rename)"""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw_handle, gzip.GzipFile(fileobj=raw_handle, mode="wb", compresslevel=6) as handle:
+                handle.write(json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+                handle.write(b"\n")
+                handle.write(body)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+class CachedResponse:
+    """Entrada de cache carregada do disco"""
+
+    def __init__(self, key: str, meta: Dict[str, Any], body: bytes, ttl: int):
+        self.key = key
+        self.meta = meta
+        self.body = body
+        self.ttl = ttl
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() - self.meta.get("stored_at", 0) < self.ttl
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.meta.get("etag") or self.meta.get("last_modified"))
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.meta.get("etag"):
+            headers["If-None-Match"] = self.meta["etag"]
+        if self.meta.get("last_modified"):
+            headers["If-Modified-Since"] = self.meta["last_modified"]
+        return headers
+
+    def to_response(self, method: str = "GET") -> httpx.Response:
+        headers = dict(self.meta.get("headers", {}))
+        headers["x-cache"] = "HIT"
+        return httpx.Response(
+            status_code=self.meta.get("status_code", 200),
+            headers=headers,
+            content=self.body,
+            request=httpx.Request(method, self.meta["url"]),
+        )
+
+
+class ResponseCache:
+    """Cache de respostas HTTP com TTL por host e revalidação condicional"""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        ttls: Optional[Dict[str, int]] = None,
+        validators: Optional[Dict[str, Callable[[bytes], bool]]] = None
+    ):
+        self.directory = directory or os.getenv("HTTP_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self.enabled = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"
+        self.max_body_size = int(os.getenv("HTTP_CACHE_MAX_BODY", 10 * 1024 * 1024))
+        self.ttls = dict(DEFAULT_HOST_TTLS if ttls is None else ttls)
+        self.validators = dict(DEFAULT_VALIDATORS if validators is None else validators)
+        self.storage = DiskCache(self.directory, "http")
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._lock = threading.Lock()
+
+    def ttl_for(self, url: str) -> int:
+        host = (urlsplit(url).hostname or "").lower()
+        for key, ttl in self.ttls.items():
+            if _host_matches(host, key):
+                return ttl
+        return 0
+
+    def is_valid(self, url: str, body: bytes) -> bool:
+        """O corpo passa no validador do host? (hosts sem validador: sempre)"""
+        host = (urlsplit(url).hostname or "").lower()
+        for key, validator in self.validators.items():
+            if _host_matches(host, key):
+                return validator(body)
+        return True
+
+    def is_cacheable(self, method: str, url: str) -> bool:
+        return self.enabled and method.upper() == "GET" and self.ttl_for(url) > 0
+
+    @staticmethod
+    def key_for(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        return hashlib.sha256(f"{method.upper()} {normalize_url(url, params)}".encode("utf-8")).hexdigest()
+
+    def _count(self, attribute: str):
+        with self._lock:
+            setattr(self, attribute, getattr(self, attribute) + 1)
+
+    def lookup(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[CachedResponse]:
+        """Buscar entrada (fresca ou expirada-mas-revalidável) para a URL"""
+        key = self.key_for("GET", url, params)
+        loaded = self.storage.load(key)
+        if loaded is None:
+            self._count("misses")
+            return None
+
+        entry = CachedResponse(key, *loaded, ttl=self.ttl_for(url))
+        if not self.is_valid(url, entry.body):
+            # Página de bloqueio gravada antes da validação existir
+            self.storage.delete(key)
+            self._count("misses")
+            return None
+        if entry.fresh:
+            self._count("hits")
+            return entry
+
+        # Entrada expirada: conta como miss, mas ainda serve para revalidação
+        self._count("misses")
+        return entry if entry.revalidatable else None
+
+    def store(self, url: str, params: Optional[Dict[str, Any]], response: httpx.Response) -> bool:
+        """Gravar resposta 200 (ignora no-store, corpos enormes, páginas de bloqueio e redirecionamentos para fora)"""
+        if response.status_code != 200 or len(response.content) > self.max_body_size:
+            return False
+        if "no-store" in response.headers.get("cache-control", "").lower():
+            return False
+
+        # Redirecionamento para fora dos hosts cacheados (ex: login do Google) não é guardado
+        if self.ttl_for(str(response.url)) <= 0:
+            return False
+
+        # CAPTCHA chega com status 200: gravado, seria repetido até o TTL expirar
+        if not self.is_valid(url, response.content):
+            print(f"🚫 Página de bloqueio não será cacheada: {url}")
+            return False
+
+        meta = {
+            "url": str(response.url),
+            "status_code": response.status_code,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() not in SKIPPED_HEADERS},
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "stored_at": time.time(),
+        }
+        self.storage.store(self.key_for("GET", url, params), meta, response.content)
+        return True
+
+    def refresh(self, entry: CachedResponse):
+        """Renovar uma entrada revalidada (resposta 304)"""
+        entry.meta["stored_at"] = time.time()
+        self.storage.store(entry.key, entry.meta, entry.body)
+        self._count("revalidated")
+
+    def invalidate(self, url: str, params: Optional[Dict[str, Any]] = None):
+        """Remover uma resposta que não deveria ter sido cacheada (ex: CAPTCHA)"""
+        self.storage.delete(self.key_for("GET", url, params))
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "directory": self.directory,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "hit_ratio": round((self.hits + self.revalidated) / lookups, 3) if lookups else 0.0,
+        }
+
+
+# Instância global
+response_cache = ResponseCache()
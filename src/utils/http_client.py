@@ -0,0 +1,321 @@
+"""
+🌐 CLIENTE HTTP COMPARTILHADO
+============================
+Um único cliente httpx assíncrono para todos os scrapers: conexões keep-alive
+reaproveitadas por host, HTTP/2 quando o servidor suporta e timeouts padronizados.
+
+O cliente vive em um event loop próprio (thread dedicada), então pode ser usado
+tanto por código assíncrono (await http_engine.get(...)) quanto pelos extratores
+síncronos que rodam no pool de threads (HttpSession / http_engine.get_sync(...)).
+
+Cookies não ficam no cliente: cada HttpSession tem o próprio jar, enviado e
+atualizado a cada requisição (inclusive nos redirecionamentos), para que
+extratores e usuários simultâneos não troquem JSESSIONID nem cookies do Google.
+"""
+
+import os
+import asyncio
+import threading
+from concurrent.futures import Future
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, Coroutine, Dict, List, Optional, TypeVar, Union
+
+import httpx
+from dotenv import load_dotenv
+
+from .http_cache import response_cache
+from .rate_limiter import rate_limiter
+
+load_dotenv()
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+T = TypeVar("T")
+
+# Cabeçalhos de conexão são responsabilidade do pool (e proibidos no HTTP/2)
+HOP_BY_HOP_HEADERS = {"connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"}
+
+# Mesmo limite padrão do httpx
+MAX_REDIRECTS = 20
+
+
+def _prepare_headers(headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Remover cabeçalhos hop-by-hop e codificações que o cliente não sabe decodificar"""
+    prepared = {}
+    for key, value in (headers or {}).items():
+        if key.lower() in HOP_BY_HOP_HEADERS:
+            continue
+        if key.lower() == "accept-encoding" and not BROTLI_AVAILABLE:
+            value = ", ".join(
+                encoding.strip() for encoding in value.split(",")
+                if encoding.strip() and encoding.strip() != "br"
+            )
+        prepared[key] = value
+    return prepared
+
+
+class HttpEngine:
+    """Cliente httpx assíncrono compartilhado, com pool de conexões por host"""
+
+    def __init__(self):
+        self.timeout = float(os.getenv("TIMEOUT", 30))
+        self.max_connections = int(os.getenv("HTTP_MAX_CONNECTIONS", 100))
+        self.max_keepalive_connections = int(os.getenv("HTTP_MAX_KEEPALIVE", 20))
+        self.keepalive_expiry = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", 60))
+        self.http2 = HTTP2_AVAILABLE and os.getenv("HTTP2_ENABLED", "true").lower() == "true"
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=self.http2,
+            # Jar do cliente recusa tudo: os cookies pertencem a cada HttpSession
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            timeout=httpx.Timeout(self.timeout),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+        )
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop, ready: threading.Event):
+        asyncio.set_event_loop(loop)
+        self._client = self._create_client()
+        ready.set()
+        loop.run_forever()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """Iniciar o event loop do cliente na primeira requisição"""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                thread = threading.Thread(
+                    target=self._run_loop, args=(loop, ready), name="http-engine", daemon=True
+                )
+                thread.start()
+                ready.wait()
+                self._loop, self._thread = loop, thread
+                protocol = "HTTP/2" if self.http2 else "HTTP/1.1"
+                print(f"🌐 Cliente HTTP compartilhado iniciado ({protocol}, até {self.max_connections} conexões)")
+            return self._loop
+
+    def close(self):
+        """Fechar o cliente e parar o event loop dedicado"""
+        with self._lock:
+            loop, thread, client = self._loop, self._thread, self._client
+            self._loop = self._thread = self._client = None
+
+        if loop is None:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=10)
+        except Exception as e:
+            print(f"⚠️ Erro ao fechar cliente HTTP: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=10)
+        loop.close()
+        print("🔒 Cliente HTTP compartilhado encerrado")
+
+    async def aclose(self):
+        """Versão assíncrona de close() para o lifespan da aplicação"""
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    # ------------------------------------------------------------------
+    # Execução de corrotinas no loop do cliente
+    # ------------------------------------------------------------------
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "Future[T]":
+        """Agendar uma corrotina no loop do cliente (thread-safe)"""
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def run_sync(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Executar uma corrotina no loop do cliente e bloquear até o resultado"""
+        if self._thread is not None and threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("run_sync não pode ser chamado de dentro do loop do cliente HTTP")
+        return self.submit(coro).result()
+
+    async def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Executar uma corrotina no loop do cliente a partir de outro event loop"""
+        if self._loop is not None and asyncio.get_running_loop() is self._loop:
+            return await coro
+        return await asyncio.wrap_future(self.submit(coro))
+
+    # ------------------------------------------------------------------
+    # Requisições
+    # ------------------------------------------------------------------
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+        cookies: Optional[httpx.Cookies] = None,
+    ) -> httpx.Response:
+        """
+        Enviar a requisição (executa sempre no loop do cliente)
+
+        cookies: jar da sessão, enviado e atualizado com os Set-Cookie das
+        respostas; sem jar, os cookies valem só dentro desta requisição
+        """
+        headers = _prepare_headers(headers)
+        cacheable = use_cache and response_cache.is_cacheable(method, url)
+
+        # Cache em disco: resposta fresca volta sem tocar a rede nem o limitador
+        cached = None
+        if cacheable:
+            cached = await asyncio.to_thread(response_cache.lookup, url, params)
+            if cached is not None and cached.fresh:
+                return cached.to_response(method)
+            if cached is not None:
+                headers.update(cached.conditional_headers())
+
+        # Aguardar orçamento do host sem bloquear as demais requisições do loop
+        await rate_limiter.acquire(url)
+        request = self._client.build_request(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            data=data,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
+        response = await self._send_following_redirects(
+            request, cookies if cookies is not None else httpx.Cookies()
+        )
+
+        if cached is not None and response.status_code == 304:
+            await asyncio.to_thread(response_cache.refresh, cached)
+            return cached.to_response(method)
+
+        if cacheable:
+            try:
+                await asyncio.to_thread(response_cache.store, url, params, response)
+            except OSError as e:
+                print(f"⚠️ Não foi possível gravar no cache HTTP: {e}")
+        return response
+
+    async def _send_following_redirects(self, request: httpx.Request, cookies: httpx.Cookies) -> httpx.Response:
+        """Seguir redirecionamentos aplicando e atualizando o jar da sessão a cada salto"""
+        history: List[httpx.Response] = []
+        while True:
+            cookies.set_cookie_header(request)
+            response = await self._client.send(request, follow_redirects=False)
+            cookies.extract_cookies(response)
+
+            if response.next_request is None:
+                response.history = history
+                return response
+            if len(history) >= MAX_REDIRECTS:
+                await response.aclose()
+                raise httpx.TooManyRedirects("Excedido o limite de redirecionamentos", request=request)
+
+            await response.aread()
+            history.append(response)
+            request = response.next_request
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Requisição assíncrona (pode ser aguardada de qualquer event loop)"""
+        return await self.run(self._send(method, url, **kwargs))
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    def request_sync(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Requisição bloqueante, para os extratores síncronos"""
+        return self.run_sync(self._send(method, url, **kwargs))
+
+    def get_sync(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request_sync("GET", url, **kwargs)
+
+    async def _gather(
+        self, urls: List[str], max_concurrency: Optional[int], **kwargs: Any
+    ) -> List[Union[httpx.Response, Exception]]:
+        semaphore = asyncio.Semaphore(max_concurrency or len(urls) or 1)
+
+        async def fetch(url: str) -> httpx.Response:
+            async with semaphore:
+                return await self._send("GET", url, **kwargs)
+
+        return await asyncio.gather(*(fetch(url) for url in urls), return_exceptions=True)
+
+    def get_many_sync(
+        self, urls: List[str], max_concurrency: Optional[int] = None, **kwargs: Any
+    ) -> List[Union[httpx.Response, Exception]]:
+        """
+        Buscar várias URLs em paralelo e devolver as respostas na mesma ordem
+
+        O ritmo real continua limitado pelo token bucket de cada host; falhas
+        individuais voltam como exceções na posição correspondente.
+        """
+        return self.run_sync(self._gather(urls, max_concurrency, **kwargs))
+
+
+class HttpSession:
+    """
+    Fachada no estilo requests.Session sobre o cliente compartilhado
+
+    Cada extrator mantém seus próprios cabeçalhos padrão e seu próprio jar de
+    cookies (como um requests.Session), mas todas as conexões (e o pool de
+    keep-alive) pertencem ao http_engine.
+    """
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, engine: Optional[HttpEngine] = None):
+        self.headers: Dict[str, str] = dict(headers or {})
+        self.cookies = httpx.Cookies()
+        self.engine = engine or http_engine
+
+    def _merge_headers(self, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        merged = dict(self.headers)
+        merged.update(headers or {})
+        return merged
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs: Any) -> httpx.Response:
+        return self.engine.request_sync(
+            method, url, headers=self._merge_headers(headers), cookies=self.cookies, **kwargs
+        )
+
+    def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request("POST", url, **kwargs)
+
+    def get_many(
+        self, urls: List[str], headers: Optional[Dict[str, str]] = None, **kwargs: Any
+    ) -> List[Union[httpx.Response, Exception]]:
+        """Buscar várias URLs em paralelo (ver HttpEngine.get_many_sync)"""
+        return self.engine.get_many_sync(urls, headers=self._merge_headers(headers), cookies=self.cookies, **kwargs)
+
+
+# Instância global
+http_engine = HttpEngine()
@@ -0,0 +1,112 @@
+"""
+🔎 MOTOR DE BUSCA DE PALAVRAS-CHAVE
+==================================
+Todas as palavras-chave viram uma única expressão regular compilada uma vez.
+O texto é normalizado uma vez (minúsculas, sem acentos) e percorrido uma única
+vez, devolvendo todas as palavras-chave encontradas.
+
+Palavras-chave contidas em outras (ex: 'idosa' em 'pessoa idosa') também são
+reportadas, como acontecia com a busca de uma palavra por vez.
+"""
+
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set
+
+# Marcas de acento que sobram depois da decomposição NFKD
+_COMBINING_MARKS = re.compile("[\u0300-\u036f]")
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    Montar uma alternância em forma de trie (ex: 'ag(?:ed|e?ing)')
+
+    Com prefixos compartilhados, o motor de regex testa um único ramo por
+    caractere em vez de tentar cada palavra-chave em cada posição do texto.
+    """
+    trie: Dict[str, Dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, Dict]) -> str:
+        optional = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        # Ramos mais longos primeiro: em cada posição vale a maior correspondência
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if optional else group
+
+    return build(trie)
+
+
+def fold_text(text: str) -> str:
+    """Normalizar texto para comparação: minúsculas e sem acentos"""
+    if text.isascii():
+        return text.lower()
+    return _COMBINING_MARKS.sub("", unicodedata.normalize("NFKD", text)).casefold()
+
+
+class KeywordMatcher:
+    """Busca várias palavras-chave em uma única passada pelo texto"""
+
+    def __init__(self, keywords: Iterable[str], whole_words: bool = True):
+        """
+        Args:
+            keywords: Palavras-chave, na ordem em que devem ser reportadas
+            whole_words: Exigir palavra completa (\\b...\\b) em vez de substring
+        """
+        self.keywords = list(dict.fromkeys(keywords))
+        self.whole_words = whole_words
+
+        # Forma normalizada -> palavras-chave originais (ex: 'geriatria' e 'geriatría')
+        self._originals: Dict[str, List[str]] = {}
+        for keyword in self.keywords:
+            self._originals.setdefault(fold_text(keyword), []).append(keyword)
+        self._order = {keyword: index for index, keyword in enumerate(self.keywords)}
+
+        folded = list(self._originals)
+        alternation = _trie_pattern(folded)
+        if whole_words:
+            self._pattern = re.compile(rf"\b(?=({alternation})\b)")
+        else:
+            self._pattern = re.compile(rf"(?=({alternation}))")
+
+        # Palavras-chave que aparecem dentro de cada uma (também casam quando ela casa)
+        self._implied: Dict[str, Set[str]] = {
+            keyword: {other for other in folded if self._contains(keyword, other)}
+            for keyword in folded
+        }
+
+    def _contains(self, text: str, keyword: str) -> bool:
+        if self.whole_words:
+            return re.search(rf"\b{re.escape(keyword)}\b", text) is not None
+        return keyword in text
+
+    def find(self, text: Optional[str]) -> List[str]:
+        """Palavras-chave presentes no texto, sem repetição, na ordem da lista original"""
+        if not text:
+            return []
+
+        matched: Set[str] = set()
+        for match in self._pattern.finditer(fold_text(text)):
+            keyword = match.group(1)
+            if keyword not in matched:
+                matched.update(self._implied[keyword])
+
+        found = [original for keyword in matched for original in self._originals[keyword]]
+        found.sort(key=self._order.__getitem__)
+        return found
+
+    def find_in_fields(self, record: Dict, fields: Iterable[str]) -> List[str]:
+        """Buscar nos campos de texto de um registro (ex: título, autores, resumo)"""
+        return self.find(" ".join(str(record.get(field) or "") for field in fields))
+
+    def matches(self, text: Optional[str]) -> bool:
+        """Verificar se o texto contém alguma palavra-chave"""
+        return bool(text) and self._pattern.search(fold_text(text)) is not None
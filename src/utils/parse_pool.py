@@ -0,0 +1,148 @@
+"""
+🧮 POOL DE PROCESSOS PARA PARSING DE HTML
+========================================
+Montar a árvore e extrair os dados (CV Lattes de vários MB, páginas de
+publicações do Scholar) é Python puro e preso à CPU: em threads, segura o
+GIL e disputa o processador com o event loop e com os outros extratores.
+
+Os extratores enviam o corpo bruto da resposta (bytes) e uma tarefa de
+src.scraper.parse_tasks; o parse roda em outro processo e volta só o
+resultado em dicionários simples, sem objetos BeautifulSoup.
+
+- Tamanho do pool pelo número de núcleos (PARSE_WORKERS para fixar)
+- PARSE_WORKERS=0 desliga o pool: as tarefas rodam no próprio processo
+- Worker que morre (falta de memória, crash do lxml) não derruba a chamada:
+  o pool é recriado e a tarefa roda no próprio processo
+- Seguro entre threads: um único pool é criado mesmo com chamadas
+  simultâneas, e uma chamada que pega o pool já encerrado tenta um novo
+
+Escalonamento com o número de workers: python -m src.utils.parse_pool_benchmark
+"""
+
+import os
+import threading
+import multiprocessing
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterable, List, Optional, Tuple, TypeVar
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+T = TypeVar("T")
+
+
+def default_workers() -> int:
+    """Núcleos disponíveis para este processo"""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+class ParsePool:
+    """Pool de processos para as tarefas de parsing dos extratores"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        if max_workers is None:
+            configured = os.getenv("PARSE_WORKERS")
+            max_workers = int(configured) if configured else default_workers()
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Extratores chamam o pool de várias threads ao mesmo tempo
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_workers > 0
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Criar o pool sob demanda (também após um shutdown)"""
+        with self._lock:
+            if self._executor is None:
+                # spawn: o servidor tem threads (event loop, pool de extratores),
+                # e fork copiaria locks em estado indefinido para os workers
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                print(f"🧮 Pool de parsing iniciado ({self.max_workers} processos)")
+            return self._executor
+
+    def _submit(self, task: Callable[..., T], *args: Any) -> Tuple[ProcessPoolExecutor, "Future[T]"]:
+        """
+        Enviar ao pool atual, tentando uma vez em um pool novo se ele quebrou
+        ou foi encerrado por outra thread (RuntimeError do submit)
+        """
+        executor = self.executor
+        try:
+            return executor, executor.submit(task, *args)
+        except RuntimeError:
+            self._discard(executor)
+            executor = self.executor
+            return executor, executor.submit(task, *args)
+
+    def submit(self, task: Callable[..., T], *args: Any) -> "Future[T]":
+        """Enviar uma tarefa ao pool (task e args precisam ser serializáveis)"""
+        return self._submit(task, *args)[1]
+
+    def parse(self, task: Callable[..., T], *args: Any) -> T:
+        """
+        Executar uma tarefa de parsing e aguardar o resultado
+
+        Feito para os extratores síncronos, que já rodam no pool de threads:
+        a thread fica esperando o processo, sem segurar o GIL.
+        """
+        if not self.enabled:
+            return task(*args)
+        try:
+            executor, future = self._submit(task, *args)
+        except RuntimeError as e:
+            print(f"⚠️ Pool de parsing indisponível ({e}), executando no processo")
+            return task(*args)
+        try:
+            return future.result()
+        except (BrokenProcessPool, CancelledError):
+            print("⚠️ Worker de parsing encerrado inesperadamente, recriando o pool")
+            self._discard(executor)
+            return task(*args)
+
+    def map(self, task: Callable[..., T], items: Iterable[Any]) -> List[T]:
+        """Executar uma tarefa por item (ex: páginas de publicações), na ordem dos itens"""
+        items = list(items)
+        if not self.enabled or len(items) < 2:
+            return [self.parse(task, item) for item in items]
+        try:
+            submitted = [self._submit(task, item) for item in items]
+        except RuntimeError as e:
+            print(f"⚠️ Pool de parsing indisponível ({e}), executando no processo")
+            return [task(item) for item in items]
+        try:
+            return [future.result() for _, future in submitted]
+        except (BrokenProcessPool, CancelledError):
+            print("⚠️ Worker de parsing encerrado inesperadamente, recriando o pool")
+            for executor in {executor for executor, _ in submitted}:
+                self._discard(executor)
+            return [task(item) for item in items]
+
+    def _discard(self, executor: Optional[ProcessPoolExecutor] = None, wait: bool = False) -> bool:
+        """
+        Encerrar o pool atual (ou só `executor`, se ele ainda for o atual:
+        um pool que outra thread já recriou não é derrubado)
+        """
+        with self._lock:
+            if self._executor is None or (executor is not None and executor is not self._executor):
+                return False
+            executor, self._executor = self._executor, None
+        executor.shutdown(wait=wait, cancel_futures=True)
+        return True
+
+    def shutdown(self, wait: bool = False):
+        """Encerrar os processos, cancelando tarefas que ainda estão na fila"""
+        if self._discard(wait=wait):
+            print("🔒 Pool de parsing encerrado")
+
+
+# Instância global
+parse_pool = ParsePool()
@@ -0,0 +1,98 @@
+"""
+⏱️ BENCHMARK DO POOL DE PARSING
+==============================
+Vazão (páginas/s) das tarefas de parsing com 1, 2, 4... processos até o
+número de núcleos, contra o parsing no próprio processo (como rodava nas
+threads do pool de extratores). Usa CVs Lattes e páginas de publicações do
+Scholar sintéticas; o tempo de subir os processos fica fora da medida.
+
+Uso:
+    python -m src.utils.parse_pool_benchmark
+    python -m src.utils.parse_pool_benchmark --pages 64 --items 400 --workers 1 2 4 8
+"""
+
+import time
+import argparse
+import functools
+from typing import Callable, Dict, List
+
+from .parse_pool import ParsePool, default_workers
+from .parser_benchmark import sample_lattes_cv, sample_scholar_profile
+from ..scraper import parse_tasks
+
+LATTES_URL = "http://buscatextual.cnpq.br/buscatextual/visualizacv.do?id=1234567890123456"
+
+
+def build_jobs(pages: int, items_per_section: int) -> Dict[str, List[bytes]]:
+    """Páginas por tipo de tarefa"""
+    return {
+        "lattes": [sample_lattes_cv(items_per_section=items_per_section)] * pages,
+        "scholar": [sample_scholar_profile(publications=100)] * (pages * 4),
+    }
+
+
+def worker_counts(cores: int) -> List[int]:
+    counts, workers = [], 1
+    while workers < cores:
+        counts.append(workers)
+        workers *= 2
+    return counts + [cores]
+
+
+def throughput(pool: ParsePool, task: Callable, bodies: List[bytes]) -> float:
+    """Páginas por segundo processando todas as páginas no pool"""
+    start = time.perf_counter()
+    pool.map(task, bodies)
+    return len(bodies) / (time.perf_counter() - start)
+
+
+def run_benchmark(jobs: Dict[str, List[bytes]], counts: List[int]) -> Dict[str, Dict[int, float]]:
+    """Vazão por tipo de página e número de processos (0 = no próprio processo)"""
+    tasks = {
+        "lattes": functools.partial(parse_tasks.lattes_full_profile, url=LATTES_URL),
+        "scholar": parse_tasks.scholar_publications_page,
+    }
+    results: Dict[str, Dict[int, float]] = {label: {} for label in jobs}
+
+    for workers in [0] + counts:
+        pool = ParsePool(max_workers=workers)
+        try:
+            if pool.enabled:
+                # Subir os processos e importar os módulos antes de medir
+                pool.map(parse_tasks.scholar_publications_page, jobs["scholar"][:workers])
+            for label, bodies in jobs.items():
+                results[label][workers] = throughput(pool, tasks[label], bodies)
+        finally:
+            pool.shutdown(wait=True)
+    return results
+
+
+def print_report(results: Dict[str, Dict[int, float]], jobs: Dict[str, List[bytes]]):
+    for label, rates in results.items():
+        size_kb = len(jobs[label][0]) / 1024
+        print(f"\n📄 {label} ({len(jobs[label])} páginas de {size_kb:.0f} KB)")
+        baseline = rates[0]
+        for workers, rate in rates.items():
+            name = "no processo" if workers == 0 else f"{workers} processo(s)"
+            print(f"   {name:<16} {rate:8.1f} páginas/s  {rate / baseline:5.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vazão do pool de parsing por número de processos")
+    parser.add_argument("--pages", type=int, default=32, help="CVs Lattes por rodada (Scholar: 4x)")
+    parser.add_argument("--items", type=int, default=300, help="Itens por seção do CV sintético")
+    parser.add_argument("--workers", type=int, nargs="*", help="Números de processos (padrão: 1, 2, 4... até os núcleos)")
+    args = parser.parse_args()
+
+    cores = default_workers()
+    counts = sorted(set(args.workers)) if args.workers else worker_counts(cores)
+    print(f"🧮 {cores} núcleo(s) disponível(is); medindo com {', '.join(map(str, counts))} processo(s)")
+    if cores == 1:
+        print("ℹ️ Com um único núcleo não há ganho de vazão: o pool só tira o parsing do processo do servidor")
+
+    jobs = build_jobs(args.pages, args.items)
+    print_report(run_benchmark(jobs, counts), jobs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+⏱️ BENCHMARK DOS PARSERS HTML
+============================
+Mede o tempo de parse por página em cada backend instalado, com as páginas
+reais guardadas no cache HTTP (Scholar, Lattes, Escavador...). Sem cache,
+usa páginas sintéticas no formato do Scholar e do CV Lattes.
+
+selectolax entra só como referência: ele não monta uma árvore BeautifulSoup,
+então os extratores não podem usá-lo sem serem reescritos.
+
+Também compara o parse completo com o parcial (SoupStrainer) usado pelos
+extratores: perfil do Scholar e CV Lattes no modo resumido.
+
+Uso:
+    python -m src.utils.parser_benchmark
+    python -m src.utils.parser_benchmark pagina.html outra_pasta/ --repeat 10
+"""
+
+import os
+import gzip
+import json
+import time
+import argparse
+import statistics
+import tracemalloc
+from collections import defaultdict
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from bs4 import BeautifulSoup
+
+from .html_parser import backend_available, html_parser, parse_html
+from .http_cache import response_cache
+from ..scraper import scholar_page
+from ..scraper.lattes_scraper import CV_SECTIONS_STRAINER, CV_SUMMARY_SECTIONS, select_cv_sections
+
+SOUP_BACKENDS = ("html.parser", "lxml", "html5lib")
+
+Page = Tuple[str, bytes]
+
+
+def _cached_pages(directory: str) -> Iterator[Page]:
+    """Corpos HTML do cache HTTP, rotulados pelo host"""
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if not name.endswith(".gz"):
+                continue
+            try:
+                with gzip.open(os.path.join(root, name), "rb") as handle:
+                    header, _, body = handle.read().partition(b"\n")
+                meta = json.loads(header)
+            except (OSError, EOFError, ValueError):
+                continue
+            content_type = meta.get("headers", {}).get("content-type", "")
+            if "html" in content_type or body.lstrip()[:1] == b"<":
+                yield urlsplit(meta.get("url", "")).hostname or "cache", body
+
+
+def _file_pages(paths: List[str]) -> Iterator[Page]:
+    for path in paths:
+        if os.path.isdir(path):
+            names = sorted(os.listdir(path))
+            yield from _file_pages([os.path.join(path, name) for name in names if name.endswith((".html", ".htm"))])
+            continue
+        with open(path, "rb") as handle:
+            yield os.path.basename(path), handle.read()
+
+
+def sample_scholar_profile(publications: int = 100) -> bytes:
+    """Página sintética no formato do perfil do Google Scholar"""
+    rows = "".join(
+        f'<tr class="gsc_a_tr"><td class="gsc_a_t"><a class="gsc_a_at" href="/citations?view_op=view_citation&amp;'
+        f'citation_for_view=X:{index}">Envelhecimento ativo e qualidade de vida {index}</a>'
+        f'<div class="gs_gray">M Silva, J Souza, A Costa</div><div class="gs_gray">Revista Brasileira {index % 7}, 2020</div></td>'
+        f'<td class="gsc_a_c"><a class="gsc_a_ac gs_ibl">{index * 3}</a></td>'
+        f'<td class="gsc_a_y"><span class="gsc_a_h gsc_a_hc gs_ibl">{2000 + index % 24}</span></td></tr>'
+        for index in range(publications)
+    )
+    stats = "".join(
+        f'<tr><td class="gsc_rsb_sc1"><a class="gsc_rsb_f">{label}</a></td>'
+        f'<td class="gsc_rsb_std">{total}</td><td class="gsc_rsb_std">{recent}</td></tr>'
+        for label, total, recent in (("Citações", 1234, 456), ("Índice h", 18, 11), ("Índice i10", 27, 14))
+    )
+    head = "".join(f'<meta name="m{index}" content="{index}"><link rel="preload" href="/s{index}.js">' for index in range(60))
+    return (
+        f'<!DOCTYPE html><html><head><title>Maria Silva - Google Acadêmico</title>{head}</head><body>'
+        f'<div id="gsc_prf_i"><div id="gsc_prf_in">Maria Silva</div><div class="gsc_prf_il">Universidade de São Paulo</div></div>'
+        f'<table id="gsc_rsb_st"><thead><tr><th class="gsc_rsb_sth"></th><th class="gsc_rsb_sth">Todos</th>'
+        f'<th class="gsc_rsb_sth">Desde 2019</th></tr></thead><tbody>{stats}</tbody></table>'
+        f'<table id="gsc_a_t"><tbody id="gsc_a_b">{rows}</tbody></table>'
+        f'<script>{"var x = 1;" * 2000}</script></body></html>'
+    ).encode("utf-8")
+
+
+def sample_lattes_cv(items_per_section: int = 150) -> bytes:
+    """Página sintética no formato do CV Lattes (seções com layout-cell)"""
+    sections = ("Identificacao", "FormacaoAcademicaTitulacao", "AtuacaoProfissional", "ProjetosPesquisa",
+                "ArtigosCompletos", "TrabalhosPublicadosAnaisCongresso", "Orientacoes", "PremiosTitulos")
+    body = []
+    for section in sections:
+        items = "".join(
+            f'<div class="layout-cell layout-cell-3 text-align-right"><div class="layout-cell-pad-5 text-align-right">'
+            f'<b>{index}.</b></div></div><div class="layout-cell layout-cell-9"><div class="layout-cell-pad-5">'
+            f'SILVA, M.; SOUZA, J. Título do trabalho {index} sobre envelhecimento. Revista X, v. {index}, p. 1-10, '
+            f'{1990 + index % 34}.<br class="clear"></div></div>'
+            for index in range(items_per_section)
+        )
+        body.append(f'<div class="title-wrapper"><a name="{section}"></a><h1>{section}</h1>'
+                    f'<div class="layout-cell-12 data-cell">{items}</div></div>')
+    return (
+        '<html><head><meta http-equiv="Content-Type" content="text/html; charset=ISO-8859-1">'
+        '<title>Currículo do Sistema de Currículos Lattes (Maria Silva)</title></head><body>'
+        '<div class="infpessoa"><h2 class="nome">Maria Silva</h2>'
+        '<ul class="informacoes-autor"><li>Última atualização do currículo em 01/05/2024</li></ul></div>'
+        f'{"".join(body)}</body></html>'
+    ).encode("latin-1")
+
+
+def _sample_pages() -> Iterator[Page]:
+    yield "sintético: scholar", sample_scholar_profile()
+    yield "sintético: lattes", sample_lattes_cv()
+
+
+def available_parsers() -> Dict[str, Callable[[bytes], object]]:
+    """Backends instalados: nome → função de parse"""
+    parsers: Dict[str, Callable[[bytes], object]] = {}
+    for name in SOUP_BACKENDS:
+        if backend_available(name):
+            parsers[name] = lambda body, backend=name: BeautifulSoup(body, backend)
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+        parsers["selectolax (referência)"] = LexborHTMLParser
+    except ImportError:
+        pass
+    return parsers
+
+
+def time_parse(parse: Callable[[bytes], object], body: bytes, repeat: int) -> float:
+    """Mediana, em ms, de `repeat` parses da mesma página"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(body)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run_benchmark(pages: List[Page], repeat: int = 5) -> Dict[str, Dict[str, float]]:
+    """Tempo médio por página (ms), por grupo de páginas e backend"""
+    parsers = available_parsers()
+    grouped: Dict[str, List[bytes]] = defaultdict(list)
+    for label, body in pages:
+        grouped[label].append(body)
+
+    results: Dict[str, Dict[str, float]] = {}
+    for label, bodies in grouped.items():
+        results[label] = {
+            name: statistics.mean(time_parse(parse, body, repeat) for body in bodies)
+            for name, parse in parsers.items()
+        }
+    return results
+
+
+def print_report(results: Dict[str, Dict[str, float]], pages: List[Page]):
+    sizes: Dict[str, List[int]] = defaultdict(list)
+    for label, body in pages:
+        sizes[label].append(len(body))
+
+    for label, timings in results.items():
+        average_kb = statistics.mean(sizes[label]) / 1024
+        print(f"\n📄 {label} ({len(sizes[label])} página(s), {average_kb:.0f} KB em média)")
+        baseline = timings.get("html.parser")
+        for name, elapsed in sorted(timings.items(), key=lambda item: item[1]):
+            speedup = f"  {baseline / elapsed:5.1f}x" if baseline else ""
+            print(f"   {name:<26} {elapsed:9.2f} ms/página{speedup}")
+
+
+def partial_parser(label: str) -> Optional[Tuple[Callable[[bytes], object], Callable[[bytes], object]]]:
+    """(parse completo, parse parcial) como os extratores fazem para este tipo de página"""
+    if "scholar" in label:
+        return (
+            lambda body: parse_html(body),
+            lambda body: parse_html(body, parse_only=scholar_page.PROFILE_STRAINER),
+        )
+    if "lattes" in label or "cnpq" in label:
+        return (
+            lambda body: parse_html(body, from_encoding="latin-1"),
+            lambda body: parse_html(
+                select_cv_sections(body.decode("latin-1"), CV_SUMMARY_SECTIONS),
+                parse_only=CV_SECTIONS_STRAINER
+            ),
+        )
+    return None
+
+
+def peak_memory(parse: Callable[[bytes], object], body: bytes) -> float:
+    """Pico de memória alocada (MB) durante um parse"""
+    tracemalloc.start()
+    try:
+        parse(body)
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+
+def print_partial_report(pages: List[Page], repeat: int):
+    print(f"\n✂️ Parse completo x parcial (backend {html_parser.backend})")
+    grouped: Dict[str, List[bytes]] = defaultdict(list)
+    for label, body in pages:
+        grouped[label].append(body)
+
+    for label, bodies in grouped.items():
+        parsers = partial_parser(label)
+        if parsers is None:
+            continue
+        full, partial = parsers
+        full_ms = statistics.mean(time_parse(full, body, repeat) for body in bodies)
+        partial_ms = statistics.mean(time_parse(partial, body, repeat) for body in bodies)
+        full_mb = statistics.mean(peak_memory(full, body) for body in bodies)
+        partial_mb = statistics.mean(peak_memory(partial, body) for body in bodies)
+        print(f"📄 {label}")
+        print(f"   completo {full_ms:9.2f} ms/página {full_mb:7.1f} MB")
+        print(f"   parcial  {partial_ms:9.2f} ms/página {partial_mb:7.1f} MB  ({full_ms / partial_ms:.1f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Comparar backends de parsing HTML")
+    parser.add_argument("paths", nargs="*", help="Arquivos .html ou pastas (padrão: cache HTTP)")
+    parser.add_argument("--repeat", type=int, default=5, help="Parses por página (mediana)")
+    parser.add_argument("--limit", type=int, default=200, help="Máximo de páginas do cache")
+    args = parser.parse_args()
+
+    if args.paths:
+        pages = list(_file_pages(args.paths))
+    else:
+        pages = []
+        for page in _cached_pages(response_cache.storage.directory):
+            pages.append(page)
+            if len(pages) >= args.limit:
+                break
+        if not pages:
+            print("ℹ️ Cache HTTP vazio, usando páginas sintéticas")
+            pages = list(_sample_pages())
+
+    print(f"⏱️ Backends: {', '.join(available_parsers())}")
+    print_report(run_benchmark(pages, repeat=args.repeat), pages)
+    print_partial_report(pages, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+🚦 LIMITADOR DE TAXA POR HOST
+============================
+Token bucket por host de origem (Scholar, Escavador, ORCID, Lattes, SerpAPI).
+Só atrasa uma requisição quando o orçamento do host realmente acabou: com o
+host ocioso a requisição sai na hora, sob carga a taxa agregada continua educada.
+
+Configuração via variável de ambiente (requisições por segundo / rajada):
+    RATE_LIMITS="scholar.google.com=0.25/3,serpapi.com=2/5"
+"""
+
+import os
+import time
+import asyncio
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# host: (requisições por segundo, tamanho da rajada)
+DEFAULT_HOST_LIMITS: Dict[str, Tuple[float, float]] = {
+    "scholar.google.com": (0.25, 3),
+    "escavador.com": (0.5, 2),
+    "pub.orcid.org": (8.0, 8),
+    "buscatextual.cnpq.br": (0.5, 3),
+    "lattes.cnpq.br": (0.5, 3),
+    "serpapi.com": (2.0, 5),
+}
+
+
+class TokenBucket:
+    """
+    Token bucket thread-safe e independente de event loop
+
+    reserve() consome um token imediatamente e devolve quanto tempo o chamador
+    deve esperar; o saldo pode ficar negativo, o que enfileira os chamadores
+    seguintes na ordem de chegada.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.total_requests = 0
+        self.delayed_requests = 0
+        self.total_wait = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Reservar tokens e retornar o atraso necessário em segundos"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+            self.total_requests += 1
+
+            if self.tokens >= 0:
+                return 0.0
+
+            delay = -self.tokens / self.rate
+            self.delayed_requests += 1
+            self.total_wait += delay
+            return delay
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "rate_per_second": self.rate,
+            "burst": self.capacity,
+            "total_requests": self.total_requests,
+            "delayed_requests": self.delayed_requests,
+            "total_wait_seconds": round(self.total_wait, 2),
+        }
+
+
+class HostRateLimiter:
+    """Registro de token buckets por host"""
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, float]]] = None):
+        self.limits = dict(DEFAULT_HOST_LIMITS)
+        self.limits.update(limits if limits is not None else self._limits_from_env())
+        self.enabled = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _limits_from_env() -> Dict[str, Tuple[float, float]]:
+        """Ler RATE_LIMITS no formato host=taxa/rajada separados por vírgula"""
+        limits = {}
+        for item in os.getenv("RATE_LIMITS", "").split(","):
+            if "=" not in item:
+                continue
+            host, _, budget = item.strip().partition("=")
+            rate, _, burst = budget.partition("/")
+            try:
+                limits[host.strip().lower()] = (float(rate), float(burst or 1))
+            except ValueError:
+                print(f"⚠️ RATE_LIMITS inválido ignorado: {item}")
+        return limits
+
+    def _host_key(self, url_or_host: str) -> Optional[str]:
+        """Encontrar o host configurado (também cobre subdomínios, ex: www.escavador.com)"""
+        host = urlsplit(url_or_host).hostname if "://" in url_or_host else url_or_host
+        host = (host or "").lower()
+        for key in self.limits:
+            if host == key or host.endswith("." + key):
+                return key
+        return None
+
+    def bucket_for(self, url_or_host: str) -> Optional[TokenBucket]:
+        key = self._host_key(url_or_host)
+        if key is None:
+            return None
+        with self._lock:
+            if key not in self._buckets:
+                rate, burst = self.limits[key]
+                self._buckets[key] = TokenBucket(rate, burst)
+            return self._buckets[key]
+
+    def reserve(self, url_or_host: str) -> float:
+        """Reservar uma requisição para o host e retornar o atraso necessário"""
+        if not self.enabled:
+            return 0.0
+        bucket = self.bucket_for(url_or_host)
+        return bucket.reserve() if bucket else 0.0
+
+    async def acquire(self, url_or_host: str):
+        """Aguardar (sem bloquear o event loop) até haver orçamento para o host"""
+        delay = self.reserve(url_or_host)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def acquire_sync(self, url_or_host: str):
+        """Versão bloqueante de acquire() para código síncrono"""
+        delay = self.reserve(url_or_host)
+        if delay > 0:
+            time.sleep(delay)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {host: bucket.stats() for host, bucket in self._buckets.items()}
+
+
+# Instância global
+rate_limiter = HostRateLimiter()